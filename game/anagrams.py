@@ -0,0 +1,193 @@
+"""Rack-signature index: words of up to seven letters grouped by their sorted letters."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from pathlib import Path
+
+from .lexicon import _source_crc, read_word_list
+from .paths import data_path
+from .word_set import pack_word
+
+COMPILED_ANAGRAMS_NAME = "lexicon.anagrams"
+MAX_RACK_WORD = 7
+
+_WORD_BYTES = 8  # each word as ASCII, zero-padded
+_A_ORD = ord("A")
+
+# Compiled file: header, signature keys (u64 × count, sorted), then the words (8 bytes each)
+# in the same order, in native byte order.
+_MAGIC = b"SQANAGR\x01"
+_HEADER = struct.Struct("<8s4sII")  # magic, byte order, words, source crc32
+_BYTE_ORDER = b"LE\x00\x00" if sys.byteorder == "little" else b"BE\x00\x00"
+
+
+def signature(letters: Iterable[str]) -> str:
+    """Sorted upper-case letters: words that are anagrams of each other share it."""
+    return "".join(sorted(letter.upper() for letter in letters))
+
+
+class AnagramIndex:
+    """Words of 2 to MAX_RACK_WORD letters keyed by signature.
+
+    keys[i] is the packed signature (word_set.pack_word) of word i; words are sorted by key and
+    stored as zero-padded ASCII, 8 bytes each (an array or a memory-mapped file). A lookup
+    binary-searches keys for the run of words sharing a signature, so opening the index reads
+    nothing but the header.
+    """
+
+    __slots__ = ("keys", "words")
+
+    def __init__(self, keys: Sequence[int], words: bytes | memoryview) -> None:
+        """keys: sorted signature keys; words: the matching words, _WORD_BYTES each."""
+        self.keys = keys
+        self.words = words
+
+    def __len__(self) -> int:
+        """Words in the index."""
+        return len(self.keys)
+
+    def _words_at(self, start: int, end: int) -> list[str]:
+        words = self.words
+        return [
+            bytes(words[i * _WORD_BYTES : (i + 1) * _WORD_BYTES]).rstrip(b"\0").decode("ascii")
+            for i in range(start, end)
+        ]
+
+    def _words_for(self, key: int) -> list[str]:
+        keys = self.keys
+        start = bisect_left(keys, key)
+        if start == len(keys) or keys[start] != key:
+            return []
+        return self._words_at(start, bisect_right(keys, key, start))
+
+    def anagrams(self, letters: Iterable[str]) -> list[str]:
+        """Words spelled with exactly these letters (no blanks), in sorted order."""
+        return self._words_for(pack_word(signature(letters)))
+
+    def playable(self, tiles: Iterable[str]) -> list[str]:
+        """Every word of two or more letters that the rack tiles (blanks "?") can spell, sorted.
+
+        Walks signatures letter by letter in sorted order, spending a rack tile on each letter
+        or a blank when the rack has none left. Keys of one length sort like their signatures,
+        so each step is a binary search within the keys sharing the prefix so far, which lands
+        on the next letter some word actually has: blanks only try letters that lead to a word.
+        """
+        tiles = list(tiles)
+        counts = [0] * 26
+        for tile in tiles:
+            if tile != "?":
+                counts[ord(tile.upper()) - _A_ORD] += 1
+        keys = self.keys
+        found: list[str] = []
+
+        def walk(key: int, lo: int, hi: int, letter: int, blanks: int, rest: int) -> None:
+            """Extend the signature packed in key, whose words' keys are keys[lo:hi], from letter
+            up; rest is the bit width of the letters still to come after the next one."""
+            while letter < 26:
+                if not blanks and not counts[letter]:
+                    letter += 1
+                    continue
+                lo = bisect_left(keys, (key * 32 + letter + 1) << rest, lo, hi)
+                if lo == hi:
+                    return
+                letter = ((keys[lo] >> rest) & 31) - 1
+                spent = 0 if counts[letter] else 1
+                if spent > blanks:
+                    letter += 1
+                    continue
+                prefix = key * 32 + letter + 1
+                end = bisect_left(keys, (prefix + 1) << rest, lo, hi)
+                if rest:
+                    counts[letter] -= 1 - spent
+                    walk(prefix, lo, end, letter, blanks - spent, rest - 5)
+                    counts[letter] += 1 - spent
+                else:
+                    found.extend(self._words_at(lo, end))
+                lo = end
+                letter += 1
+
+        for length in range(2, min(len(tiles), MAX_RACK_WORD) + 1):
+            lo = bisect_left(keys, 1 << 5 * (length - 1))
+            hi = bisect_left(keys, 1 << 5 * length, lo)
+            walk(0, lo, hi, 0, tiles.count("?"), 5 * (length - 1))
+        return sorted(found)
+
+
+def build_anagram_index(words: Iterable[str]) -> AnagramIndex:
+    """Index the 2- to MAX_RACK_WORD-letter words of a word list."""
+    entries = sorted(
+        {(pack_word(signature(word)), word.upper()) for word in words if 2 <= len(word) <= MAX_RACK_WORD}
+    )
+    keys = array("Q", (key for key, _ in entries))
+    blob = b"".join(word.encode("ascii").ljust(_WORD_BYTES, b"\0") for _, word in entries)
+    return AnagramIndex(keys, blob)
+
+
+def write_anagram_index(index: AnagramIndex, path: str | Path, source_crc: int = 0) -> None:
+    """Serialize index (written atomically)."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as outfile:
+        outfile.write(_HEADER.pack(_MAGIC, _BYTE_ORDER, len(index), source_crc))
+        outfile.write(array("Q", index.keys).tobytes())
+        outfile.write(bytes(index.words))
+    os.replace(tmp, path)
+
+
+def open_anagram_index(path: str | Path, expected_crc: int | None = None) -> AnagramIndex | None:
+    """Memory-map a compiled index; None if missing, foreign, or stale."""
+    try:
+        with open(path, "rb") as infile:
+            buf = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(buf) < _HEADER.size:
+        return None
+    magic, byte_order, count, crc = _HEADER.unpack_from(buf)
+    if magic != _MAGIC or byte_order != _BYTE_ORDER:
+        return None
+    if expected_crc is not None and crc != expected_crc:
+        return None
+    if len(buf) != _HEADER.size + (8 + _WORD_BYTES) * count:
+        return None
+    view = memoryview(buf)
+    words_at = _HEADER.size + 8 * count
+    return AnagramIndex(view[_HEADER.size : words_at].cast("Q"), view[words_at:])
+
+
+def compile_anagram_index(dict_path: str | Path | None = None, out_path: str | Path | None = None) -> Path:
+    """Write the index for a word list (default: beside the packaged lexicon)."""
+    source = Path(dict_path) if dict_path is not None else data_path("dictionary.txt")
+    target = Path(out_path) if out_path is not None else source.with_name(COMPILED_ANAGRAMS_NAME)
+    write_anagram_index(build_anagram_index(read_word_list(source)), target, _source_crc(source))
+    return target
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: Path) -> AnagramIndex:
+    compiled = path.with_name(COMPILED_ANAGRAMS_NAME)
+    if path.is_file():
+        index = open_anagram_index(compiled, expected_crc=_source_crc(path)) if compiled.is_file() else None
+        return index if index is not None else build_anagram_index(read_word_list(path))
+    index = open_anagram_index(compiled)
+    if index is None:
+        raise FileNotFoundError(f"Neither {path} nor a compiled {compiled} was found.")
+    return index
+
+
+def load_anagram_index(dict_path: str | Path | None = None) -> AnagramIndex:
+    """AnagramIndex for a word list (default: data_path("dictionary.txt")), loaded once per process.
+
+    A compiled lexicon.anagrams beside the word list is memory-mapped when it was built from the
+    current word list; otherwise the index is built in memory (run `squabble compile-lexicon`).
+    """
+    path = Path(dict_path) if dict_path is not None else data_path("dictionary.txt")
+    return _load_cached(path.resolve())
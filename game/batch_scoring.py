@@ -0,0 +1,106 @@
+"""Score many candidate plays at once with NumPy (optional "fast" extra)."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import NamedTuple
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError("Batch scoring needs NumPy; install the 'fast' extra") from exc
+
+from .cross_checks import NO_CROSS_WORD, CrossChecks
+from .rulebook import Rulebook
+from .tile_bag import TILE_KINDS
+from .types import BoardState, Move
+
+_A_ORD = ord("A")
+_MAX_LEN = 15
+
+IntArray = npt.NDArray[np.int64]
+
+
+class MoveBatch(NamedTuple):
+    """Plays as parallel arrays, one row per play.
+
+    starts[n] is the first square (y * 15 + x); dirs[n] is 0 for "R" and 1 for "D";
+    tiles[n, i] is the letter index (0-25) of the i-th word character, -1 past the end;
+    blanks[n, i] is True where that character is a blank (lower case).
+    """
+
+    starts: IntArray
+    dirs: IntArray
+    tiles: IntArray
+    blanks: npt.NDArray[np.bool_]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+def encode_moves(moves: Sequence[Move]) -> MoveBatch:
+    """Pack plays into a MoveBatch."""
+    count = len(moves)
+    starts = np.empty(count, dtype=np.int64)
+    dirs = np.empty(count, dtype=np.int64)
+    tiles = np.full((count, _MAX_LEN), -1, dtype=np.int64)
+    blanks = np.zeros((count, _MAX_LEN), dtype=np.bool_)
+    for n, move in enumerate(moves):
+        y, x = move.coords
+        starts[n] = y * 15 + x
+        dirs[n] = move.dir == "D"
+        word = move.word
+        tiles[n, : len(word)] = [ord(ch.upper()) - _A_ORD for ch in word]
+        blanks[n, : len(word)] = [ch.islower() for ch in word]
+    return MoveBatch(starts, dirs, tiles, blanks)
+
+
+class BatchScorer:
+    """Rulebook.score_move for a whole batch of legal plays, as array arithmetic.
+
+    Letter and word multipliers are held as 225-entry grids and tile points as a 27-entry table
+    (A-Z, blank). Cross-words come from a board's CrossChecks partial sums, so every play is
+    scored in one pass over a (plays x 15) array. Plays are assumed legal (as generated);
+    unlike score_move, words are not looked up and placement is not checked.
+    """
+
+    def __init__(self, rulebook: Rulebook) -> None:
+        """Build the multiplier grids and the points table from rulebook."""
+        # One extra neutral slot (225) for the padding past each word's end.
+        self.letter_mul = np.array(rulebook.letter_mul + [1], dtype=np.int64)
+        self.word_mul = np.array(rulebook.word_mul + [1], dtype=np.int64)
+        self.points = np.array([rulebook.tile_scores[tile] for tile in TILE_KINDS], dtype=np.int64)
+
+    def scores(self, batch: MoveBatch, board_state: BoardState, cross_checks: CrossChecks) -> IntArray:
+        """Score of every play in batch on board_state (cross_checks must describe the same board)."""
+        if not len(batch):
+            return np.zeros(0, dtype=np.int64)
+        occupied = np.array(
+            [board_state[y][x] != " " for y in range(15) for x in range(15)] + [True], dtype=np.bool_
+        )
+        cross = np.array(
+            [cross_checks.cross_score["R"] + [NO_CROSS_WORD], cross_checks.cross_score["D"] + [NO_CROSS_WORD]],
+            dtype=np.int64,
+        )
+
+        in_word = batch.tiles >= 0
+        steps = np.where(batch.dirs == 1, 15, 1)
+        squares = batch.starts[:, None] + steps[:, None] * np.arange(_MAX_LEN)
+        # Squares past the word's end may run off the board; point them at slot 225.
+        squares = np.where(in_word, squares, 225)
+
+        points = np.where(batch.blanks, self.points[26], self.points[batch.tiles])
+        points = np.where(in_word, points, 0)
+        placed = in_word & ~occupied[squares]
+        letter_mul = np.where(placed, self.letter_mul[squares], 1)
+        word_mul = np.where(placed, self.word_mul[squares], 1)
+
+        letters = points * letter_mul
+        main = letters.sum(axis=1) * word_mul.prod(axis=1)
+        partial = cross[batch.dirs[:, None], squares]
+        has_cross = placed & (partial != NO_CROSS_WORD)
+        cross_words = np.where(has_cross, (partial + letters) * word_mul, 0).sum(axis=1)
+        bingo = np.where(placed.sum(axis=1) == 7, 50, 0)
+        result: IntArray = main + cross_words + bingo
+        return result
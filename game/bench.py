@@ -0,0 +1,280 @@
+"""Benchmarks on a fixed corpus of mid-game positions, reported as JSON for comparing commits."""
+
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .board import Board
+from .compact_board import CompactBoard
+from .game_master import GameMaster
+from .lexicon import clear_lexicon_cache
+from .paths import data_path
+from .players.computer import ComputerPlayer, MoveGenerator, SearchMode
+from .rulebook import Rulebook
+from .simulate import game_seed
+from .turn_stats import TurnStats
+from .types import Move
+
+BENCH_CORPUS_NAME = "bench_positions.json"
+
+
+class Position(NamedTuple):
+    """A board and the rack of the player to move."""
+
+    rows: list[str]
+    rack: list[str]
+
+    def board(self, rulebook: Rulebook) -> Board:
+        """A fresh Board holding rows, with its cross-checks attached."""
+        board = Board()
+        board.grid = CompactBoard(self.rows)
+        rulebook.analyse(board)
+        return board
+
+
+@dataclass
+class BenchResult:
+    """Timing for one benchmark: ops run, their total time, and one extra untimed pass's
+    lexicon nodes visited (None when no search runs) and traced peak allocation."""
+
+    name: str
+    ops: int
+    seconds: float
+    ops_per_sec: float
+    nodes: int | None
+    peak_bytes: int
+
+
+def build_corpus(seed: int = 0, games: int = 6, turns: Sequence[int] = (5, 9, 13, 17)) -> list[Position]:
+    """Positions from seeded greedy self-play: the board and mover's rack before each listed turn.
+
+    Turns that were passes or exchanges are skipped.
+    """
+    gm = GameMaster(computer_count=2)
+    positions: list[Position] = []
+    for game in range(games):
+        gm.play_game(headless=True, seed=game_seed(seed, game))
+        board = Board()
+        for record in gm.turn_log:
+            if record.move.coords == (-1, -1) or not record.move.word.isalpha():
+                continue
+            if record.turn in turns:
+                rack = list(record.leave) + _placed_tiles(record.move, board)
+                positions.append(Position(board.grid.to_rows(), sorted(rack)))
+            board.play_move(record.move)
+    return positions
+
+
+def _placed_tiles(move: Move, board: Board) -> list[str]:
+    y, x = move.coords
+    is_d, is_r = move.dir == "D", move.dir == "R"
+    return [
+        "?" if ch.islower() else ch
+        for i, ch in enumerate(move.word)
+        if board.state[y + i * is_d][x + i * is_r] == " "
+    ]
+
+
+def write_corpus(positions: Iterable[Position], path: str | Path) -> None:
+    """Save positions as JSON."""
+    data = [{"rows": p.rows, "rack": "".join(p.rack)} for p in positions]
+    with open(path, "w", encoding="utf-8") as outfile:
+        json.dump({"version": 1, "positions": data}, outfile, indent=1)
+        outfile.write("\n")
+
+
+def load_corpus(path: str | Path | None = None) -> list[Position]:
+    """Positions from path (default: DATA_ROOT/bench_positions.json)."""
+    with open(path if path is not None else data_path(BENCH_CORPUS_NAME), encoding="utf-8") as infile:
+        data = json.load(infile)
+    return [Position(list(p["rows"]), list(p["rack"])) for p in data["positions"]]
+
+
+# A benchmark op is prepared untimed (fresh board, cleared caches) and returns the call to time.
+Op = Callable[[], Callable[[], Any]]
+
+
+def _measure(
+    name: str, ops: Sequence[Op], players: Sequence[ComputerPlayer] = (), game_master: GameMaster | None = None
+) -> BenchResult:
+    """Time each op, then rerun them once to count lexicon nodes and trace peak memory.
+
+    The rerun turns on TurnStats for players (and game_master's players) and sums their nodes.
+    """
+    seconds = 0.0
+    for prepare in ops:
+        call = prepare()
+        started = time.perf_counter()
+        call()
+        seconds += time.perf_counter() - started
+
+    nodes = 0
+    calls = [prepare() for prepare in ops]
+    for player in players:
+        player.profile = True
+    if game_master is not None:
+        game_master.profile = True
+    tracemalloc.start()
+    try:
+        for call in calls:
+            for player in players:
+                player.stats = TurnStats()
+            call()
+            nodes += sum(player.stats.nodes for player in players if player.stats is not None)
+            if game_master is not None:
+                nodes += sum(rec.stats.nodes for rec in game_master.turn_log if rec.stats is not None)
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        for player in players:
+            player.profile, player.stats = False, None
+        if game_master is not None:
+            game_master.profile = False
+    return BenchResult(name, len(ops), seconds, len(ops) / seconds if seconds else 0.0, nodes or None, peak)
+
+
+BENCHMARKS = ("rulebook_init", "valid_locations", "find_words", "score_move", "get_move", "full_game")
+
+
+def run_benchmarks(
+    positions: Sequence[Position],
+    *,
+    rulebook: Rulebook | None = None,
+    generator: MoveGenerator = "trie",
+    search: SearchMode = "full",
+    rounds: int = 3,
+    games: int = 1,
+    only: Iterable[str] | None = None,
+) -> list[BenchResult]:
+    """Run the named benchmarks (default: all of BENCHMARKS) over positions.
+
+    Position benchmarks run every position rounds times and rulebook_init (with the lexicon
+    cache cleared) rounds times; full_game plays games seeded games. get_move and full_game
+    use generator and search; the others time the trie generator's parts.
+    """
+    selected = list(only) if only is not None else list(BENCHMARKS)
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(sorted(unknown))}")
+    rulebook = rulebook if rulebook is not None else Rulebook()
+    player = ComputerPlayer(0, [], rulebook, name="bench")
+    mover = ComputerPlayer(0, [], rulebook, name="bench", generator=generator, search=search)
+    repeated = [p for _ in range(rounds) for p in positions]
+    results: list[BenchResult] = []
+
+    for name in selected:
+        ops: list[Op]
+        players: list[ComputerPlayer] = []
+        gm: GameMaster | None = None
+        if name == "rulebook_init":
+            ops = [_rulebook_op] * rounds
+        elif name == "valid_locations":
+            ops = [_locations_op(player, p, rulebook) for p in repeated]
+        elif name == "find_words":
+            ops, players = [_find_words_op(player, p, rulebook) for p in repeated], [player]
+        elif name == "score_move":
+            ops = [op for p in positions for op in _score_ops(player, p, rulebook)] * rounds
+        elif name == "get_move":
+            ops, players = [_get_move_op(mover, p, rulebook) for p in repeated], [mover]
+        else:
+            gm = GameMaster(computer_count=2, rulebook=rulebook, generator=generator, search=search)
+            ops = [_game_op(gm, game_seed(0, game)) for game in range(games)]
+        results.append(_measure(name, ops, players, gm))
+    return results
+
+
+def _rulebook_op() -> Callable[[], Any]:
+    clear_lexicon_cache()
+    return Rulebook
+
+
+def _locations_op(player: ComputerPlayer, position: Position, rulebook: Rulebook) -> Op:
+    def prepare() -> Callable[[], Any]:
+        # A fresh CrossChecks, so its per-line start-square cache starts empty.
+        board = position.board(rulebook)
+        player.tiles = position.rack
+        return lambda: player.get_valid_locations(board.state, board.analysis)
+
+    return prepare
+
+
+def _find_words_op(player: ComputerPlayer, position: Position, rulebook: Rulebook) -> Op:
+    board = position.board(rulebook)
+    cross_checks = board.analysis
+    assert cross_checks is not None
+    player.tiles = position.rack
+    locations = player.get_valid_locations(board.state, cross_checks)
+
+    def run() -> Any:
+        return [
+            player.find_words(
+                fixed_tiles=tuple(loc.fixed),
+                min_length=max(2, loc.min_len),
+                max_length=loc.max_len,
+                cross_masks=cross_checks.line_masks(loc.coords, loc.dir, loc.max_len),
+            )
+            for loc in locations
+        ]
+
+    def prepare() -> Callable[[], Any]:
+        player.tiles = position.rack
+        return run
+
+    return prepare
+
+
+def _score_ops(player: ComputerPlayer, position: Position, rulebook: Rulebook) -> list[Op]:
+    board = position.board(rulebook)
+    player.tiles = position.rack
+    moves = player.generate_moves(board.state, board.analysis)
+
+    def score_op(move: Move) -> Op:
+        return lambda: lambda: rulebook.score_move(move, board.state, cross_checks=board.analysis)
+
+    return [score_op(move) for move in moves]
+
+
+def _get_move_op(player: ComputerPlayer, position: Position, rulebook: Rulebook) -> Op:
+    def prepare() -> Callable[[], Any]:
+        board = position.board(rulebook)
+        player.tiles = position.rack
+        return lambda: player.get_move(board.state, board)
+
+    return prepare
+
+
+def _game_op(gm: GameMaster, seed: int) -> Op:
+    return lambda: lambda: gm.play_game(headless=True, seed=seed)
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def report(results: Sequence[BenchResult], **options: Any) -> dict[str, Any]:
+    """JSON-ready report: environment, commit (when run from a git checkout), options, results."""
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": options,
+        "benchmarks": [asdict(result) for result in results],
+    }
@@ -5,7 +5,9 @@ from __future__ import annotations
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.text import Text
 
-from .types import BoardState, Move
+from .compact_board import CompactBoard
+from .cross_checks import CrossChecks
+from .types import Move
 from .ui import BLANK_TILE_STYLE, BONUS_GLYPHS, BONUS_STYLES, TILE_STYLE, Highlight
 
 
@@ -31,8 +33,15 @@ class Board:
             " w   L   L   w ",
             "W  l   W   l  W",
         ]
-        self.state: BoardState = ["".join([" " for _ in range(15)]) for _ in range(15)]
+        self.grid = CompactBoard()
         self.highlight: Highlight | None = None
+        # Cross-checks and anchors, attached by Rulebook.analyse and updated by play_move.
+        self.analysis: CrossChecks | None = None
+
+    @property
+    def state(self) -> CompactBoard:
+        """The grid, readable as fifteen row strings (board.state[y][x])."""
+        return self.grid
 
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         """Yield Rich Text lines forming the coloured board grid."""
@@ -84,14 +93,25 @@ class Board:
                         line.append(f" {glyph} ", style=style)
             yield line
 
+    @property
+    def key(self) -> int:
+        """Zobrist key of the tiles on the board, updated by every play and undo."""
+        return self.grid.key
+
     def play_move(self, move: Move) -> bool:
         """Write the word into the grid at coords along move.dir."""
-        y, x = move.coords
-        if move.dir == "D":
-            for i, c in enumerate(move.word):
-                row = self.state[y + i]
-                self.state[y + i] = row[:x] + c + row[x + 1 :]
-        if move.dir == "R":
-            row = self.state[y]
-            self.state[y] = row[:x] + move.word + row[x + len(move.word) :]
+        self.apply_move(move)
         return True
+
+    def apply_move(self, move: Move) -> list[int]:
+        """Play move in place; return the newly filled squares for undo_move."""
+        placed = self.grid.apply(move)
+        if self.analysis is not None:
+            self.analysis.refresh_squares(self.grid, [divmod(sq, 15) for sq in placed])
+        return placed
+
+    def undo_move(self, placed: list[int]) -> None:
+        """Lift tiles a play put down (the squares returned by apply_move)."""
+        self.grid.undo(placed)
+        if self.analysis is not None:
+            self.analysis.refresh_squares(self.grid, [divmod(sq, 15) for sq in placed])
@@ -2,23 +2,293 @@
 
 from __future__ import annotations
 
+import argparse
+import json
 import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
 
+from .anagrams import compile_anagram_index
+from .bench import BENCH_CORPUS_NAME, BENCHMARKS, build_corpus, load_corpus, report, run_benchmarks, write_corpus
 from .exceptions import QuitGame
 from .game_master import GameMaster
+from .leaves import LEAVES_NAME, fit_leaves, leave_observations, load_leaves, write_leaves
+from .lexicon import compile_lexicon
+from .paths import data_path
+from .simulate import ComputerSettings, GameResult, default_workers, replay_game, run_games, write_results
+from .turn_stats import TurnStats
+from .word_set import compile_word_set
 
 
-def main() -> int:
-    """Run from argv; exit 0 even when the player quits."""
+def _play(argv: list[str]) -> int:
+    """Interactive game; `squabble [<human_players> <computer_players>]`."""
     try:
-        if len(sys.argv) == 1:
+        if not argv:
             gm = GameMaster(human_count=1, computer_count=1)
             gm.play_game(True)
         else:
-            human_count = int(sys.argv[1])
-            computer_count = int(sys.argv[2])
+            human_count = int(argv[0])
+            computer_count = int(argv[1])
             gm = GameMaster(human_count, computer_count)
             gm.play_game(True)
     except QuitGame:
         pass
     return 0
+
+
+def _compile_lexicon(argv: list[str]) -> int:
+    """Build the memory-mappable lexicon from a word list."""
+    parser = argparse.ArgumentParser(
+        prog="squabble compile-lexicon",
+        description="Compile dictionary.txt into the binary lexicon, word set and anagram index loaded at startup.",
+    )
+    parser.add_argument("--source", help="word list (default: DATA_ROOT/dictionary.txt)")
+    parser.add_argument("--output", help="compiled DAWG (default: lexicon.dawg beside the source)")
+    parser.add_argument("--gaddag-output", help="compiled GADDAG (default: lexicon.gaddag beside the source)")
+    parser.add_argument("--words-output", help="packed word set (default: lexicon.words beside the source)")
+    parser.add_argument("--anagrams-output", help="anagram index (default: lexicon.anagrams beside the source)")
+    parser.add_argument("--no-gaddag", action="store_true", help="skip the GADDAG used by the anchor move generator")
+    args = parser.parse_args(argv)
+    for target in compile_lexicon(args.source, args.output, args.gaddag_output, gaddag=not args.no_gaddag):
+        print(f"Wrote {target}")
+    print(f"Wrote {compile_word_set(args.source, args.words_output)}")
+    print(f"Wrote {compile_anagram_index(args.source, args.anagrams_output)}")
+    return 0
+
+
+def _simulate(argv: list[str]) -> int:
+    """Headless computer-only games; one JSON line per game."""
+    parser = argparse.ArgumentParser(
+        prog="squabble simulate",
+        description="Play computer-only games without rendering and write one JSON record per game.",
+    )
+    parser.add_argument("--games", type=int, default=1, help="number of games (default: 1)")
+    parser.add_argument("--players", type=int, default=2, help="computer players per game (default: 2)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed; game i uses a seed derived from it")
+    parser.add_argument("--replay", type=int, metavar="GAME_SEED", help="replay the one game recorded with this seed")
+    parser.add_argument("--output", help="JSON-lines file to write (default: stdout)")
+    parser.add_argument(
+        "--game-log",
+        help="append every turn to this game log (.gz/.zst compress it); each worker writes its own NAME-PID shard",
+    )
+    parser.add_argument("--columns", metavar="DIR", help="also write per-turn and per-game column tables to DIR")
+    parser.add_argument(
+        "--columns-format",
+        choices=("auto", "parquet", "npy"),
+        default="auto",
+        help="Parquet (needs pyarrow) or NumPy .npy bundles; auto picks Parquet when available",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="worker processes; 0 uses every available core (default: 1)"
+    )
+    parser.add_argument("--generator", choices=("trie", "gaddag"), default="trie", help="move generator")
+    parser.add_argument("--search", choices=("full", "fused"), default="full", help="search mode")
+    parser.add_argument(
+        "--scoring", choices=("loop", "batch"), default="loop", help="score candidates one by one or in a NumPy batch"
+    )
+    parser.add_argument("--equity", action="store_true", help="rank plays by equity using the leave table written by fit-leaves")
+    parser.add_argument("--leaves", help="leave table for equity play (implies --equity)")
+    parser.add_argument("--endgame", action="store_true", help="solve two-player endgames once the bag is empty")
+    parser.add_argument("--cache", type=int, default=0, metavar="ENTRIES", help="move cache size per process (0: off)")
+    parser.add_argument(
+        "--profile", action="store_true", help="record per-turn search stats and print a summary per game"
+    )
+    args = parser.parse_args(argv)
+    if args.games < 0 or not 1 <= args.players <= 4 or args.workers < 0 or args.cache < 0:
+        parser.error("--games, --workers and --cache must be >= 0 and --players between 1 and 4")
+    if args.leaves is not None or args.equity:
+        try:
+            load_leaves(args.leaves)
+        except FileNotFoundError:
+            if args.leaves is not None:
+                parser.error(f"no leave table at {args.leaves}")
+            parser.error("no leave table; run `squabble fit-leaves` first or pass --leaves")
+
+    started = time.perf_counter()
+    totals: list[GameResult] = []
+
+    def counted(results: Iterable[GameResult]) -> Iterator[GameResult]:
+        for result in results:
+            totals.append(result)
+            if args.profile:
+                print(_profile_summary(result), file=sys.stderr)
+            yield result
+
+    workers = args.workers or default_workers()
+    settings = ComputerSettings(
+        generator=args.generator,
+        search=args.search,
+        scoring=args.scoring,
+        leaves=args.leaves if args.leaves is not None else ("" if args.equity else None),
+        endgame=args.endgame,
+        cache_size=args.cache,
+        profile=args.profile,
+    )
+    gm = settings.game_master(args.players) if workers == 1 and args.replay is None else None
+    results: Iterable[GameResult]
+    if args.replay is not None:
+        results = [replay_game(args.replay, args.players, settings=settings)]
+    else:
+        results = run_games(
+            args.games,
+            args.players,
+            args.seed,
+            workers=workers,
+            settings=settings,
+            game_master=gm,
+            game_log=args.game_log,
+        )
+    columns = None
+    if args.columns:
+        from .columnar import ColumnarWriter
+
+        columns = ColumnarWriter(args.columns, args.columns_format)
+        results = columns.add_all(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            write_results(counted(results), out)
+    else:
+        write_results(counted(results), sys.stdout)
+    if columns is not None:
+        columns.close()
+        print(
+            f"{columns.format} tables: {columns.rows['turns']} turns, {columns.rows['games']} games in {args.columns}",
+            file=sys.stderr,
+        )
+
+    elapsed = time.perf_counter() - started
+    turns = sum(len(result.turns) for result in totals)
+    print(
+        f"{len(totals)} games, {turns} turns in {elapsed:.2f}s "
+        f"({len(totals) / elapsed if elapsed else 0.0:.2f} games/s)",
+        file=sys.stderr,
+    )
+    if gm is not None and gm.move_cache is not None:
+        stats = gm.move_cache.stats
+        print(
+            f"move cache: {stats.hits} hits, {stats.misses} misses, {stats.evictions} evictions "
+            f"({stats.hit_rate:.1%} hit rate)",
+            file=sys.stderr,
+        )
+    if gm is not None:
+        words = gm.rulebook.word_set.stats
+        print(
+            f"word checks: {words.lookups} lookups, {words.hit_rate:.1%} valid, {words.fallback} long-word fallbacks",
+            file=sys.stderr,
+        )
+    return 0
+
+
+def _profile_summary(result: GameResult) -> str:
+    """One line of search counters and phase times summed over a game's computer turns."""
+    turns = [TurnStats(**turn["stats"]) for turn in result.turns if "stats" in turn]
+    total = TurnStats.total(turns)
+    return (
+        f"game {result.game}: {len(turns)} turns, {total.anchors} anchors, {total.nodes} nodes, "
+        f"{total.candidates} candidates, {total.rejected} rejected; locate {total.locate_seconds:.3f}s, "
+        f"search {total.search_seconds:.3f}s, score {total.score_seconds:.3f}s, "
+        f"total {total.total_seconds:.3f}s"
+    )
+
+
+def _fit_leaves(argv: list[str]) -> int:
+    """Fit a leave-value table from simulate records."""
+    parser = argparse.ArgumentParser(
+        prog="squabble fit-leaves",
+        description="Fit rack-leave values from `squabble simulate` JSON lines and write the leave table.",
+    )
+    parser.add_argument("records", nargs="+", help="JSON-lines files written by squabble simulate")
+    parser.add_argument("--output", help=f"leave table (default: DATA_ROOT/{LEAVES_NAME})")
+    parser.add_argument("--min-count", type=int, default=5, help="store leaves seen at least this often (default: 5)")
+    parser.add_argument("--prior", type=float, default=20.0, help="shrinkage toward per-tile values (default: 20)")
+    args = parser.parse_args(argv)
+
+    def games() -> Iterator[dict[str, Any]]:
+        for name in args.records:
+            with open(name, encoding="utf-8") as infile:
+                for line in infile:
+                    if line.strip():
+                        yield json.loads(line)
+
+    table = fit_leaves(leave_observations(games()), min_count=args.min_count, prior=args.prior)
+    target = args.output or data_path(LEAVES_NAME)
+    write_leaves(table, target)
+    print(f"Wrote {len(table)} leaves to {target}")
+    return 0
+
+
+def _bench(argv: list[str]) -> int:
+    """Time move generation, scoring and whole games on the benchmark corpus; print JSON."""
+    parser = argparse.ArgumentParser(
+        prog="squabble bench",
+        description="Run the benchmarks on a fixed corpus of mid-game positions and print a JSON report.",
+    )
+    parser.add_argument(
+        "benchmarks", nargs="*", metavar="NAME", help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)"
+    )
+    parser.add_argument("--corpus", help=f"positions file (default: DATA_ROOT/{BENCH_CORPUS_NAME})")
+    parser.add_argument("--rounds", type=int, default=3, help="passes over the corpus (default: 3)")
+    parser.add_argument("--games", type=int, default=1, help="games for full_game (default: 1)")
+    parser.add_argument("--generator", choices=("trie", "gaddag"), default="trie", help="move generator")
+    parser.add_argument("--search", choices=("full", "fused"), default="full", help="search mode")
+    parser.add_argument("--output", help="JSON file to write (default: stdout)")
+    parser.add_argument(
+        "--write-corpus", action="store_true", help="regenerate the corpus from seeded self-play instead of timing"
+    )
+    args = parser.parse_args(argv)
+    if args.rounds < 1 or args.games < 1:
+        parser.error("--rounds and --games must be at least 1")
+    unknown = sorted(set(args.benchmarks) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    if args.write_corpus:
+        target = args.corpus or data_path(BENCH_CORPUS_NAME)
+        positions = build_corpus()
+        write_corpus(positions, target)
+        print(f"Wrote {len(positions)} positions to {target}")
+        return 0
+
+    positions = load_corpus(args.corpus)
+    results = run_benchmarks(
+        positions,
+        generator=args.generator,
+        search=args.search,
+        rounds=args.rounds,
+        games=args.games,
+        only=args.benchmarks or None,
+    )
+    text = json.dumps(
+        report(
+            results,
+            corpus=len(positions),
+            rounds=args.rounds,
+            games=args.games,
+            generator=args.generator,
+            search=args.search,
+        ),
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as outfile:
+            outfile.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+_COMMANDS: dict[str, Callable[[list[str]], int]] = {
+    "bench": _bench,
+    "compile-lexicon": _compile_lexicon,
+    "fit-leaves": _fit_leaves,
+    "simulate": _simulate,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run from argv; exit 0 even when the player quits."""
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] in _COMMANDS:
+        return _COMMANDS[args[0]](args[1:])
+    return _play(args)
@@ -0,0 +1,200 @@
+"""Columnar export of self-play results: per-turn and per-game tables for vectorized analysis.
+
+Tables are written as Parquet when pyarrow is installed, otherwise as NumPy column bundles
+(one .npy file per column). NumPy is required either way (the "fast" extra).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError("Columnar export needs NumPy; install the 'fast' extra") from exc
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = pq = None
+
+if TYPE_CHECKING:
+    from .simulate import GameResult
+
+ColumnFormat = Literal["auto", "parquet", "npy"]
+Table = Literal["turns", "games"]
+
+# Turn table columns and their NumPy dtypes ("U" columns are fixed-width strings).
+TURN_COLUMNS: dict[str, str] = {
+    "game": "int64",
+    "turn": "int16",
+    "player": "U",
+    "row": "int8",
+    "col": "int8",
+    "dir": "U1",
+    "word": "U",
+    "score": "int32",
+    "rack": "U",
+    "leave": "U",
+    "bag": "int16",
+    "seconds": "float64",
+}
+_DEFAULT_CHUNK = 1 << 16
+
+
+def columnar_format(requested: ColumnFormat = "auto") -> Literal["parquet", "npy"]:
+    """Format to write: Parquet when asked for or available, else NumPy bundles."""
+    if requested == "parquet" and pa is None:
+        raise ImportError("Parquet export needs pyarrow")
+    if requested == "auto":
+        return "parquet" if pa is not None else "npy"
+    return requested
+
+
+def _turn_rows(result: GameResult) -> Iterator[dict[str, Any]]:
+    for turn in result.turns:
+        row, col = turn["coords"]
+        yield {
+            "game": result.game,
+            "turn": turn["turn"],
+            "player": turn["player"],
+            "row": row,
+            "col": col,
+            "dir": turn["dir"],
+            "word": turn["word"],
+            "score": turn["score"],
+            "rack": turn["rack"],
+            "leave": turn["leave"],
+            "bag": turn["bag"],
+            "seconds": turn["seconds"],
+        }
+
+
+def _game_row(result: GameResult) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "game": result.game,
+        "seed": result.seed,
+        "turns": len(result.turns),
+        "seconds": result.seconds,
+    }
+    for seat, (name, score) in enumerate(zip(result.players, result.scores)):
+        row[f"player_{seat}"] = name
+        row[f"score_{seat}"] = score
+    return row
+
+
+def game_columns(seats: int) -> dict[str, str]:
+    """Game table columns and dtypes for games of seats players (player_i / score_i by seat)."""
+    columns = {"game": "int64", "seed": "int64", "turns": "int16", "seconds": "float64"}
+    for seat in range(seats):
+        columns[f"player_{seat}"] = "U"
+        columns[f"score_{seat}"] = "int32"
+    return columns
+
+
+class ColumnarWriter:
+    """Collects GameResults into turns and games tables under a directory.
+
+    Rows are buffered column by column and written every chunk_rows turns, so memory stays
+    bounded however many games are added. Parquet tables are OUT/turns.parquet and
+    OUT/games.parquet (one row group per chunk); NumPy tables are OUT/turns/part-NNNNN/<column>.npy
+    and the same for games. load_columns reads either back. All games must have the same number
+    of players. Passes and exchanges keep their sentinel coordinates (-1 and -2).
+    """
+
+    def __init__(
+        self, directory: str | Path, format: ColumnFormat = "auto", chunk_rows: int = _DEFAULT_CHUNK
+    ) -> None:
+        """Write into directory (created if missing, but holding no tables yet) in format."""
+        self.directory = Path(directory)
+        self.format = columnar_format(format)
+        for table in ("turns", "games"):
+            if (self.directory / f"{table}.parquet").exists() or (self.directory / table).exists():
+                raise FileExistsError(f"{self.directory} already holds a {table} table")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.chunk_rows = chunk_rows
+        self._pending: dict[Table, list[dict[str, Any]]] = {"turns": [], "games": []}
+        self._dtypes: dict[Table, dict[str, str]] = {"turns": TURN_COLUMNS, "games": {}}
+        self._parts: dict[Table, int] = {"turns": 0, "games": 0}
+        self._parquet: dict[Table, Any] = {}
+        self.rows: dict[Table, int] = {"turns": 0, "games": 0}
+
+    def add(self, result: GameResult) -> None:
+        """Buffer one game's rows, writing a chunk once enough turns are pending."""
+        if not self._dtypes["games"]:
+            self._dtypes["games"] = game_columns(len(result.players))
+        self._pending["games"].append(_game_row(result))
+        self._pending["turns"].extend(_turn_rows(result))
+        if len(self._pending["turns"]) >= self.chunk_rows:
+            self.flush()
+
+    def add_all(self, results: Iterable[GameResult]) -> Iterator[GameResult]:
+        """Pass results through, adding each one (for chaining with write_results)."""
+        for result in results:
+            self.add(result)
+            yield result
+
+    def flush(self) -> None:
+        """Write the buffered rows of both tables."""
+        for table in ("turns", "games"):
+            rows = self._pending[table]
+            if rows:
+                self._write_chunk(table, self._columns(table, rows))
+                self.rows[table] += len(rows)
+                rows.clear()
+
+    def _columns(self, table: Table, rows: list[dict[str, Any]]) -> dict[str, npt.NDArray[Any]]:
+        return {
+            name: np.array([row[name] for row in rows], dtype=None if dtype == "U" else dtype)
+            for name, dtype in self._dtypes[table].items()
+        }
+
+    def _write_chunk(self, table: Table, columns: dict[str, npt.NDArray[Any]]) -> None:
+        if self.format == "parquet":
+            chunk = pa.table({name: pa.array(values) for name, values in columns.items()})
+            writer = self._parquet.get(table)
+            if writer is None:
+                writer = self._parquet[table] = pq.ParquetWriter(self.directory / f"{table}.parquet", chunk.schema)
+            writer.write_table(chunk)
+            return
+        part = self.directory / table / f"part-{self._parts[table]:05d}"
+        part.mkdir(parents=True, exist_ok=True)
+        for name, values in columns.items():
+            np.save(part / f"{name}.npy", values)
+        self._parts[table] += 1
+
+    def close(self) -> None:
+        """Write what is still buffered and finish the files."""
+        self.flush()
+        for writer in self._parquet.values():
+            writer.close()
+        self._parquet.clear()
+
+    def __enter__(self) -> ColumnarWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def load_columns(directory: str | Path, table: Table = "turns") -> dict[str, npt.NDArray[Any]]:
+    """One table written by ColumnarWriter, as a NumPy array per column."""
+    directory = Path(directory)
+    parquet = directory / f"{table}.parquet"
+    if parquet.is_file():
+        if pq is None:
+            raise ImportError("Reading Parquet tables needs pyarrow")
+        loaded = pq.read_table(parquet)
+        columns = {name: loaded.column(name).to_numpy() for name in loaded.column_names}
+        # Strings come back as objects; match the fixed-width arrays of the NumPy format.
+        return {name: values.astype(str) if values.dtype == object else values for name, values in columns.items()}
+
+    parts = sorted((directory / table).glob("part-*"))
+    if not parts:
+        raise FileNotFoundError(f"No {table} table under {directory}")
+    names = [path.stem for path in sorted(parts[0].glob("*.npy"))]
+    return {name: np.concatenate([np.load(part / f"{name}.npy") for part in parts]) for name in names}
@@ -0,0 +1,121 @@
+"""Flat 225-byte board with occupancy bitboards and in-place apply/undo."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import overload
+
+from .types import Move
+from .zobrist import square_key
+
+_EMPTY = ord(" ")
+
+
+class CompactBoard(Sequence[str]):
+    """Row-major bytearray of the 15×15 grid (b" " = empty, lower case = blank tile).
+
+    Indexing board[y] returns row y as a string, so a CompactBoard can be passed anywhere a
+    BoardState is read (Rulebook.score_move, ComputerPlayer, the Rich renderer). Row strings
+    are built lazily and cached until a move touches the row. occupied and blanks are 225-bit
+    bitboards (bit y * 15 + x). apply/undo change the grid in place without copying it, and
+    keep key (the Zobrist key of the tiles, see zobrist.board_key) current.
+    """
+
+    __slots__ = ("cells", "occupied", "blanks", "key", "_rows")
+
+    def __init__(self, rows: Iterable[str] | None = None) -> None:
+        """Empty board, or a copy of rows (fifteen strings of fifteen characters)."""
+        self.cells = bytearray(b" " * 225)
+        self.occupied = 0
+        self.blanks = 0
+        self.key = 0
+        self._rows: list[str | None] = [None] * 15
+        if rows is not None:
+            for y, row in enumerate(rows):
+                for x, ch in enumerate(row):
+                    if ch != " ":
+                        self._set(y * 15 + x, ch)
+
+    def _set(self, sq: int, ch: str) -> None:
+        self.cells[sq] = ord(ch)
+        self.occupied |= 1 << sq
+        self.key ^= square_key(sq, ch)
+        if ch.islower():
+            self.blanks |= 1 << sq
+        self._rows[sq // 15] = None
+
+    def __len__(self) -> int:
+        """Always 15 rows."""
+        return 15
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Row string (cached), or a list of rows for a slice."""
+        if isinstance(index, slice):
+            return [self[y] for y in range(15)[index]]
+        if index < 0:
+            index += 15
+        row = self._rows[index]
+        if row is None:
+            row = self.cells[index * 15 : index * 15 + 15].decode("ascii")
+            self._rows[index] = row
+        return row
+
+    def at(self, y: int, x: int) -> str:
+        """Character on (y, x); " " when empty."""
+        return chr(self.cells[y * 15 + x])
+
+    def is_empty(self) -> bool:
+        """True when no tile has been placed."""
+        return not self.occupied
+
+    def apply(self, move: Move) -> list[int]:
+        """Place move's letters on empty squares; return those squares (pass to undo)."""
+        y, x = move.coords
+        step = 15 if move.dir == "D" else 1
+        sq = y * 15 + x
+        placed: list[int] = []
+        for ch in move.word:
+            if not (self.occupied >> sq) & 1:
+                self._set(sq, ch)
+                placed.append(sq)
+            sq += step
+        return placed
+
+    def undo(self, placed: Iterable[int]) -> None:
+        """Lift the tiles apply put on placed."""
+        for sq in placed:
+            self.key ^= square_key(sq, chr(self.cells[sq]))
+            self.cells[sq] = _EMPTY
+            self.occupied &= ~(1 << sq)
+            self.blanks &= ~(1 << sq)
+            self._rows[sq // 15] = None
+
+    def copy(self) -> CompactBoard:
+        """Independent copy (shares no buffers)."""
+        other = CompactBoard()
+        other.cells[:] = self.cells
+        other.occupied = self.occupied
+        other.blanks = self.blanks
+        other.key = self.key
+        other._rows = list(self._rows)
+        return other
+
+    def to_rows(self) -> list[str]:
+        """Plain list-of-strings BoardState."""
+        return [self[y] for y in range(15)]
+
+    def __eq__(self, other: object) -> bool:
+        """Same tiles as another CompactBoard or sequence of rows."""
+        if isinstance(other, CompactBoard):
+            return self.cells == other.cells
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(other) == 15 and all(self[y] == other[y] for y in range(15))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
@@ -0,0 +1,192 @@
+"""Per-square cross-check letter masks, cross-word partial scores, and anchors for one board."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+from .lexicon import TERMINAL, Dawg
+from .types import BoardState
+
+ALL_LETTERS = (1 << 26) - 1
+NO_CROSS_WORD = -1
+
+_A_ORD = ord("A")
+
+
+class MoveParam(NamedTuple):
+    """One candidate start square: position, direction, length bounds, and board-fixed letters."""
+
+    coords: tuple[int, int]
+    dir: str
+    min_len: int
+    max_len: int
+    fixed: list[tuple[str, int]]
+
+
+class CrossChecks:
+    """Which letters may go on each empty square, per main-word direction, plus anchor squares.
+
+    For a main word along "R", mask["R"][y * 15 + x] holds bit i when letter i placed at (y, x)
+    makes a valid vertical cross-word (ALL_LETTERS when there is no vertical neighbour), and
+    cross_score["R"][y * 15 + x] is the face-value sum of the tiles already in that cross-word,
+    or NO_CROSS_WORD. "D" is the same with the roles of rows and columns swapped.
+
+    anchors[y * 15 + x] marks empty squares next to a tile (and the empty centre square).
+    A Board that owns one calls refresh_squares after each move, which refreshes only the squares
+    and lines the new tiles can affect.
+    """
+
+    def __init__(self, lexicon: Dawg, tile_scores: Mapping[str, int], board_state: BoardState) -> None:
+        """Compute masks, partial scores, and anchors for every square in board_state."""
+        self.lexicon = lexicon
+        self.tile_scores = tile_scores
+        self.mask: dict[str, list[int]] = {"R": [ALL_LETTERS] * 225, "D": [ALL_LETTERS] * 225}
+        self.cross_score: dict[str, list[int]] = {"R": [NO_CROSS_WORD] * 225, "D": [NO_CROSS_WORD] * 225}
+        self.anchors: list[bool] = [False] * 225
+        # Start squares per (direction, line, rack size); dropped when a move touches the line.
+        self.line_params: dict[tuple[str, int, int], list[MoveParam]] = {}
+        for y in range(15):
+            for x in range(15):
+                self.update_square(board_state, y, x)
+                self.anchors[y * 15 + x] = self._is_anchor(board_state, y, x)
+
+    @staticmethod
+    def _is_anchor(board_state: BoardState, y: int, x: int) -> bool:
+        if board_state[y][x] != " ":
+            return False
+        return (
+            (y, x) == (7, 7)
+            or (x > 0 and board_state[y][x - 1] != " ")
+            or (x < 14 and board_state[y][x + 1] != " ")
+            or (y > 0 and board_state[y - 1][x] != " ")
+            or (y < 14 and board_state[y + 1][x] != " ")
+        )
+
+    def refresh_squares(self, board_state: BoardState, squares: Iterable[tuple[int, int]]) -> None:
+        """Refresh after tiles landed on (or were lifted from) squares; board_state already reflects it."""
+        for y, x in squares:
+            self.update_square(board_state, y, x)
+            for ny, nx in ((y, x), (y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                if 0 <= ny < 15 and 0 <= nx < 15:
+                    self.anchors[ny * 15 + nx] = self._is_anchor(board_state, ny, nx)
+
+            # Cross-words change only on the empty squares closing this tile's runs.
+            for dy, dx in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                ny, nx = y + dy, x + dx
+                while 0 <= ny < 15 and 0 <= nx < 15 and board_state[ny][nx] != " ":
+                    ny, nx = ny + dy, nx + dx
+                if 0 <= ny < 15 and 0 <= nx < 15:
+                    self.update_square(board_state, ny, nx)
+
+            stale = {("R", line) for line in (y - 1, y, y + 1)} | {("D", line) for line in (x - 1, x, x + 1)}
+            for key in [k for k in self.line_params if (k[0], k[1]) in stale]:
+                del self.line_params[key]
+
+    def start_squares(
+        self, board_state: BoardState, direction: str, line: int, rack_size: int
+    ) -> list[MoveParam]:
+        """Start squares along one row ("R") or column ("D") for a rack of rack_size tiles.
+
+        Same result as scanning ComputerPlayer.get_move_params over the line, but anchors come
+        from the cache and the list is reused until a move touches the line.
+        """
+        key = (direction, line, rack_size)
+        cached = self.line_params.get(key)
+        if cached is not None:
+            return cached
+
+        if direction == "R":
+            cells = board_state[line]
+            squares = [line * 15 + i for i in range(15)]
+        else:
+            cells = "".join(board_state[i][line] for i in range(15))
+            squares = [i * 15 + line for i in range(15)]
+        anchors = self.anchors
+
+        params: list[MoveParam] = []
+        for start in range(15):
+            if start > 0 and cells[start - 1] != " ":
+                continue
+            fixed: list[tuple[str, int]] = []
+            tiles_rem = rack_size
+            tiles_to_validity = -1
+            i = start
+            while i < 15 and (tiles_rem or cells[i] != " "):
+                if tiles_to_validity == -1 and (cells[i] != " " or anchors[squares[i]]):
+                    tiles_to_validity = i - start + 1
+                if cells[i] == " ":
+                    tiles_rem -= 1
+                else:
+                    fixed.append((cells[i], i - start))
+                i += 1
+            if tiles_to_validity != -1:
+                coords = (line, start) if direction == "R" else (start, line)
+                params.append(MoveParam(coords, direction, tiles_to_validity, 15 - start, fixed))
+        self.line_params[key] = params
+        return params
+
+    def update_square(self, board_state: BoardState, y: int, x: int) -> None:
+        """Recompute both directions' entries for (y, x)."""
+        sq = y * 15 + x
+        if board_state[y][x] != " ":
+            for direction in ("R", "D"):
+                self.mask[direction][sq] = 0
+                self.cross_score[direction][sq] = NO_CROSS_WORD
+            return
+
+        # Main word along R: the cross-word runs down column x.
+        top = y
+        while top > 0 and board_state[top - 1][x] != " ":
+            top -= 1
+        bottom = y
+        while bottom < 14 and board_state[bottom + 1][x] != " ":
+            bottom += 1
+        before = "".join(board_state[r][x] for r in range(top, y))
+        after = "".join(board_state[r][x] for r in range(y + 1, bottom + 1))
+        self._set(sq, "R", before, after)
+
+        # Main word along D: the cross-word runs along row y.
+        row = board_state[y]
+        left = x
+        while left > 0 and row[left - 1] != " ":
+            left -= 1
+        right = x
+        while right < 14 and row[right + 1] != " ":
+            right += 1
+        self._set(sq, "D", row[left:x], row[x + 1 : right + 1])
+
+    def _set(self, sq: int, direction: str, before: str, after: str) -> None:
+        if not before and not after:
+            self.mask[direction][sq] = ALL_LETTERS
+            self.cross_score[direction][sq] = NO_CROSS_WORD
+            return
+        self.mask[direction][sq] = self.allowed_letters(before, after)
+        self.cross_score[direction][sq] = sum(
+            self.tile_scores["?" if ch.islower() else ch] for ch in before + after
+        )
+
+    def allowed_letters(self, before: str, after: str) -> int:
+        """Bitmask of letters L such that before + L + after is a word."""
+        lexicon = self.lexicon
+        node = lexicon.walk(before)
+        if node == -1:
+            return 0
+        allowed = 0
+        for letter, child in lexicon.children(node):
+            end = lexicon.walk(after, child) if after else child
+            if end != -1 and lexicon.node_mask[end] & TERMINAL:
+                allowed |= 1 << letter
+        return allowed
+
+    def line_masks(self, coords: tuple[int, int], direction: str, length: int) -> list[int]:
+        """Masks for length squares starting at coords along direction (ALL_LETTERS past the edge)."""
+        y, x = coords
+        masks = self.mask[direction]
+        if direction == "R":
+            return [masks[y * 15 + x + i] if x + i < 15 else ALL_LETTERS for i in range(length)]
+        return [masks[(y + i) * 15 + x] if y + i < 15 else ALL_LETTERS for i in range(length)]
+
+    def allows(self, y: int, x: int, direction: str, letter: str) -> bool:
+        """True if letter (a blank's lower-case letter counts as that letter) may go on (y, x)."""
+        return bool((self.mask[direction][y * 15 + x] >> (ord(letter.upper()) - _A_ORD)) & 1)
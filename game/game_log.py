@@ -0,0 +1,142 @@
+"""Append-only game logs: one JSON line per record, optionally gzip- or zstd-compressed.
+
+A game is a "game" record (game number, seed, player names), one "turn" record per turn
+written as it is played (rack before the move, the move, score, leave, tiles drawn, tiles left
+in the bag, think time), and an "end" record with the final scores. Files ending in .gz or .zst
+are compressed; each writer appends a new gzip member or zstd frame, and readers decode the
+concatenation as one stream, so runs can keep adding to the same log.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from .game_master import TurnRecord
+
+Codec = Literal["none", "gzip", "zstd"]
+
+_SUFFIX_CODECS: dict[str, Codec] = {".gz": "gzip", ".zst": "zstd"}
+
+
+def codec_for(path: str | Path) -> Codec:
+    """Codec implied by path's suffix: .gz is gzip, .zst is zstd, anything else plain text."""
+    return _SUFFIX_CODECS.get(Path(path).suffix, "none")
+
+
+def shard_path(path: str | Path, shard: int) -> Path:
+    """path with -shard before its suffixes (games.jsonl.gz -> games-3.jsonl.gz)."""
+    path = Path(path)
+    suffixes = "".join(path.suffixes)
+    stem = path.name[: len(path.name) - len(suffixes)] if suffixes else path.name
+    return path.with_name(f"{stem}-{shard}{suffixes}")
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("zstd game logs need the zstandard package") from exc
+    return zstandard
+
+
+def _open_binary(path: str | Path, mode: Literal["ab", "rb"], codec: Codec) -> IO[bytes]:
+    if codec == "gzip":
+        return gzip.open(path, mode)  # type: ignore[return-value]
+    if codec == "zstd":
+        zstandard = _zstandard()
+        raw = open(path, mode)
+        if mode == "ab":
+            return zstandard.ZstdCompressor().stream_writer(raw)  # type: ignore[no-any-return]
+        return zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)  # type: ignore[no-any-return]
+    return open(path, mode)
+
+
+class GameLogWriter:
+    """Streams game, turn and end records to a log file opened for appending.
+
+    Records go to a buffered (and, for .gz/.zst, compressing) stream as the game is played and
+    are flushed at the end of each game, so memory use does not grow with the run.
+    GameMaster writes to one when given game_log.
+    """
+
+    def __init__(self, path: str | Path, codec: Codec | None = None) -> None:
+        """Open path for appending; codec defaults to codec_for(path)."""
+        self.path = Path(path)
+        self.codec: Codec = codec if codec is not None else codec_for(path)
+        self._out = _open_binary(self.path, "ab", self.codec)
+        self.records = 0
+
+    def _write(self, record: dict[str, Any]) -> None:
+        self._out.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+        self.records += 1
+
+    def begin_game(self, game: int, seed: int | None, players: list[str]) -> None:
+        """Record the start of a game and its seating order."""
+        self._write({"type": "game", "game": game, "seed": seed, "players": players})
+
+    def turn(self, game: int, rec: TurnRecord) -> None:
+        """Record one turn of game."""
+        self._write(
+            {
+                "type": "turn",
+                "game": game,
+                "turn": rec.turn,
+                "player": rec.player,
+                "rack": rec.rack,
+                "coords": list(rec.move.coords),
+                "dir": rec.move.dir,
+                "word": rec.move.word,
+                "score": rec.score,
+                "leave": rec.leave,
+                "drawn": rec.drawn,
+                "bag": rec.bag,
+                "seconds": round(rec.seconds, 6),
+            }
+        )
+
+    def end_game(self, game: int, scores: list[int]) -> None:
+        """Record final scores (seating order) and flush the game to the file."""
+        self._write({"type": "end", "game": game, "scores": scores})
+        self._out.flush()
+
+    def close(self) -> None:
+        """Finish the compressed member/frame and close the file."""
+        if not self._out.closed:
+            self._out.close()
+
+    def __enter__(self) -> GameLogWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def read_game_log(path: str | Path, codec: Codec | None = None) -> Iterator[dict[str, Any]]:
+    """Every record in a log, in file order, decoded one line at a time.
+
+    The file is streamed, never loaded whole. A log cut short (a run killed before closing its
+    writer) yields the complete records up to the break.
+    """
+    codec = codec if codec is not None else codec_for(path)
+    with _open_binary(path, "rb", codec) as raw, io.TextIOWrapper(raw, encoding="utf-8") as lines:
+        try:
+            for line in lines:
+                if line.endswith("\n"):
+                    yield json.loads(line)
+        except EOFError:
+            return
+
+
+def read_turns(paths: str | Path | Iterable[str | Path]) -> Iterator[dict[str, Any]]:
+    """The turn records of one log, or of several (e.g. a pooled run's shards) one after another."""
+    for path in [paths] if isinstance(paths, (str, os.PathLike)) else paths:
+        for record in read_game_log(path):
+            if record["type"] == "turn":
+                yield record
@@ -2,44 +2,118 @@
 
 from __future__ import annotations
 
-from random import shuffle
+import random
+import time
+from typing import NamedTuple
 
 from .board import Board
 from .exceptions import QuitGame
+from .game_log import GameLogWriter
+from .leaves import LeaveTable
+from .move_cache import MoveCache
 from .players import ComputerPlayer, HumanPlayer
+from .players.computer import MoveGenerator, ScoringMode, SearchMode
+from .players.endgame import EndgameSolver
 from .rulebook import Rulebook
 from .tile_bag import TileBag
+from .turn_stats import TurnStats
+from .types import Move
 from .ui import GamePresenter, info, show_launch_splash, success, warn
+from .zobrist import SIDE_KEYS, seat_key
+
+
+class TurnRecord(NamedTuple):
+    """One turn: who moved, the move (pass/exchange sentinels included), points, think time,
+    the sorted tiles kept on the rack before drawing, the mover's view of the position
+    (board key xor rack key) before the move, the rack before the move, the tiles drawn
+    afterwards, the tiles left in the bag after drawing, and the search's TurnStats when
+    profiling."""
+
+    turn: int
+    player: str
+    move: Move
+    score: int
+    seconds: float
+    leave: str
+    position: int
+    rack: str = ""
+    drawn: str = ""
+    bag: int = 0
+    stats: TurnStats | None = None
 
 
 class GameMaster:
     """Turn loop and scoring until someone goes out or everyone passes."""
 
-    def __init__(self, human_count: int = 0, computer_count: int = 0) -> None:
-        """New game master; reset_game runs when play_game starts."""
-        self.rulebook = Rulebook()
+    def __init__(
+        self,
+        human_count: int = 0,
+        computer_count: int = 0,
+        *,
+        rulebook: Rulebook | None = None,
+        generator: MoveGenerator = "trie",
+        search: SearchMode = "full",
+        scoring: ScoringMode = "loop",
+        leaves: LeaveTable | None = None,
+        endgame: bool = False,
+        move_cache: MoveCache | None = None,
+        profile: bool = False,
+        game_log: GameLogWriter | None = None,
+    ) -> None:
+        """New game master; reset_game runs when play_game starts.
+
+        rulebook shares an already-loaded lexicon; generator, search, scoring, leaves (equity
+        play) and endgame (solve two-player endgames once the bag is empty) configure computer
+        players, which share move_cache when given. With profile, computer turns record TurnStats.
+        With game_log, every game is appended to it turn by turn.
+        """
+        self.rulebook = rulebook if rulebook is not None else Rulebook()
         self.board: Board | None = None
         self.bag: TileBag | None = None
         self.players: list[HumanPlayer | ComputerPlayer] = []
         self.player_scores: list[int] = []
+        self.turn_log: list[TurnRecord] = []
+        self.seed: int | None = None
+        self.rng = random.Random()
         self.human_count = human_count
         self.computer_count = computer_count
+        self.generator: MoveGenerator = generator
+        self.search: SearchMode = search
+        self.scoring: ScoringMode = scoring
+        self.leaves = leaves
+        self.endgame = endgame
+        self.move_cache = move_cache
+        self.profile = profile
+        self.game_log = game_log
         self.presenter = GamePresenter()
 
-    def reset_game(self) -> None:
-        """Build a fresh board, bag, player list, and zeroed scores."""
+    def reset_game(self, seed: int | None = None) -> None:
+        """Build a fresh board, bag, player list, and zeroed scores.
+
+        The game's draws, turn order and computer tie-breaks all come from one random.Random;
+        the same seed replays the same game.
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
         self.board = Board()
-        self.bag = TileBag()
+        self.bag = TileBag(self.rng)
         self.players = []
         for i in range(self.computer_count):
-            self.players.append(
-                ComputerPlayer(
-                    player_id=1 + self.human_count + i,
-                    init_tiles=self.bag.grab(7),
-                    rulebook=self.rulebook,
-                    name="Computer {}".format(i + 1),
-                )
+            computer = ComputerPlayer(
+                player_id=1 + self.human_count + i,
+                init_tiles=self.bag.grab(7),
+                rulebook=self.rulebook,
+                name="Computer {}".format(i + 1),
+                generator=self.generator,
+                search=self.search,
+                scoring=self.scoring,
+                rng=self.rng,
+                leaves=self.leaves,
+                endgame=EndgameSolver(self.rulebook) if self.endgame else None,
+                cache=self.move_cache,
             )
+            computer.profile = self.profile
+            self.players.append(computer)
         for i in range(self.human_count):
             self.players.append(
                 HumanPlayer(
@@ -49,18 +123,30 @@ class GameMaster:
                 )
             )
         self.player_scores = [0 for _ in range(len(self.players))]
+        self.turn_log = []
         self.presenter.reset()
 
-    def play_game(self, verbose: bool = False) -> None:
-        """Play until passes or a player goes out, then apply endgame adjustments."""
-        show_launch_splash()
-        self.reset_game()
+    def play_game(
+        self, verbose: bool = False, *, headless: bool = False, seed: int | None = None, game: int = 0
+    ) -> None:
+        """Play until passes or a player goes out, then apply endgame adjustments.
+
+        headless skips the splash, the computer-move animation and all console output
+        (verbose is ignored), for batch self-play. seed makes the game reproducible; game is
+        the number its game_log records carry.
+        """
+        verbose = verbose and not headless
+        if not headless:
+            show_launch_splash()
+        self.reset_game(seed)
 
         consecutive_skips = 0
 
-        shuffle(self.players)
+        self.rng.shuffle(self.players)
         if verbose:
             self.presenter.announce_turn_order(self.players)
+        if self.game_log is not None:
+            self.game_log.begin_game(game, seed, [player.name for player in self.players])
 
         id_of_first_empty: int | None = None
 
@@ -72,30 +158,42 @@ class GameMaster:
             for i, player in enumerate(self.players):
                 turn_number += 1
                 is_human = isinstance(player, HumanPlayer)
-                if is_human:
+                if is_human and not headless:
                     self.presenter.print_turn_header(turn_number, player.name, is_human)
                     self.presenter.print_sidebar(self.players, self.player_scores)
 
+                if isinstance(player, ComputerPlayer):
+                    player.opponent_tiles = self._known_opponent_tiles(player)
+                position = self.board.key ^ player.rack_key
+                rack = "".join(player.tiles)
+
+                started = time.perf_counter()
                 try:
                     move = player.prompt_move(self.board.state, board=self.board)
                 except QuitGame:
                     if verbose:
                         warn(f"[bold]{player.name}[/] ends the game.")
                     raise
+                seconds = time.perf_counter() - started
+                leave = "".join(sorted(player.tiles))
+                gained = 0
+                drawn: list[str] = []
 
                 if move.coords == (-1, -1):
                     consecutive_skips += 1
                     if verbose:
                         self.presenter.announce_pass(player.name)
                 elif move.coords == (-2, -2):
-                    self.presenter.announce_exchange(player.name, len(move.word))
-                    player.receive_tiles(self.bag.grab(len(move.word)))
+                    if not headless:
+                        self.presenter.announce_exchange(player.name, len(move.word))
+                    drawn = self.bag.switch(list(move.word))
+                    player.receive_tiles(drawn)
                 else:
                     consecutive_skips = 0
 
                     gained = self.rulebook.score_move(move, self.board.state)
 
-                    if isinstance(player, ComputerPlayer):
+                    if isinstance(player, ComputerPlayer) and not headless:
                         self.presenter.animate_computer_move(
                             self.board,
                             self.players,
@@ -109,11 +207,31 @@ class GameMaster:
                         self.board.play_move(move)
 
                     num_new_tiles = 7 - len(player.tiles)
-                    player.receive_tiles(self.bag.grab(num_new_tiles))
+                    drawn = self.bag.grab(num_new_tiles)
+                    player.receive_tiles(drawn)
 
                     if verbose:
                         self.presenter.announce_move(player.name, move.word, gained)
 
+                stats = player.stats if isinstance(player, ComputerPlayer) else None
+                record = TurnRecord(
+                    turn_number,
+                    player.name,
+                    move,
+                    gained,
+                    seconds,
+                    leave,
+                    position,
+                    rack,
+                    "".join(drawn),
+                    len(self.bag),
+                    stats,
+                )
+                self.turn_log.append(record)
+                if self.game_log is not None:
+                    self.game_log.turn(game, record)
+
+                if move.coords not in ((-1, -1), (-2, -2)):
                     if len(player.tiles) == 0:
                         id_of_first_empty = player.id
                         if verbose:
@@ -121,10 +239,28 @@ class GameMaster:
                         break
 
         self._apply_endgame_scoring(id_of_first_empty, verbose)
+        if self.game_log is not None:
+            self.game_log.end_game(game, list(self.player_scores))
 
         if verbose:
             self.presenter.print_final_board(self.board, self.players, self.player_scores)
 
+    def position_key(self, to_move: int) -> int:
+        """Zobrist key of the full position: board, every rack by seat, and the side to move."""
+        assert self.board is not None
+        key = self.board.key ^ SIDE_KEYS[to_move]
+        for seat, player in enumerate(self.players):
+            key ^= seat_key(player.rack_key, seat)
+        return key
+
+    def _known_opponent_tiles(self, player: HumanPlayer | ComputerPlayer) -> list[str] | None:
+        """The opponent's rack once the bag is empty in a two-player game (it can be deduced)."""
+        assert self.bag is not None
+        if len(self.bag) or len(self.players) != 2:
+            return None
+        opponent = self.players[1] if self.players[0] is player else self.players[0]
+        return list(opponent.tiles)
+
     def _apply_endgame_scoring(self, id_of_first_empty: int | None, verbose: bool) -> None:
         """Subtract unplayed racks; if someone emptied their rack, credit them opponents' totals."""
         if id_of_first_empty is None:
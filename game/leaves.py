@@ -0,0 +1,203 @@
+"""Rack-leave values: what the tiles kept after a play are worth on later turns."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .paths import data_path
+from .tile_bag import TILE_KINDS, tile_index
+
+LEAVES_NAME = "leaves.bin"
+
+# File: header, then keys (u64 × n, ascending) and values (f32 × n), native byte order.
+_MAGIC = b"SQLEAVE\x01"
+_HEADER = struct.Struct("<8s4sI")  # magic, byte order, entries
+_BYTE_ORDER = b"LE\x00\x00" if sys.byteorder == "little" else b"BE\x00\x00"
+
+
+def leave_key(tiles: Iterable[str]) -> int:
+    """Integer key of a tile multiset: sorted slot numbers (1-27) as base-32 digits."""
+    key = 0
+    for slot in sorted(tile_index(tile) for tile in tiles):
+        key = (key << 5) | (slot + 1)
+    return key
+
+
+def key_tiles(key: int) -> str:
+    """The sorted tiles a leave_key encodes."""
+    tiles = []
+    while key:
+        tiles.append(TILE_KINDS[(key & 31) - 1])
+        key >>= 5
+    return "".join(reversed(tiles))
+
+
+class LeaveTable:
+    """Leave values in a sorted key array with a parallel value array (both may be mmap views).
+
+    value() memoises every key it has seen, so after warm-up a lookup is a dict hit. A leave
+    missing from the table is valued as the sum of its single-tile entries.
+    """
+
+    def __init__(self, keys: Sequence[int], values: Sequence[float]) -> None:
+        """keys ascending and unique; values[i] belongs to keys[i]."""
+        self.keys = keys
+        self.values = values
+        self._memo: dict[int, float] = {}
+        self._singles = [self._find(slot + 1) or 0.0 for slot in range(len(TILE_KINDS))]
+
+    def __len__(self) -> int:
+        """Number of stored leaves."""
+        return len(self.keys)
+
+    def _find(self, key: int) -> float | None:
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return float(self.values[i])
+        return None
+
+    def value(self, tiles: Iterable[str]) -> float:
+        """Points the leave tiles are expected to add over an average leave."""
+        key = leave_key(tiles)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+        found = self._find(key)
+        if found is None:
+            found = 0.0
+            rest = key
+            while rest:
+                found += self._singles[(rest & 31) - 1]
+                rest >>= 5
+        self._memo[key] = found
+        return found
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        """(sorted tiles, value) for every stored leave."""
+        for key, value in zip(self.keys, self.values):
+            yield key_tiles(key), float(value)
+
+
+def build_leave_table(values: Mapping[str, float]) -> LeaveTable:
+    """Table from a mapping of leave (any tile order) to value."""
+    entries = sorted((leave_key(tiles), value) for tiles, value in values.items())
+    return LeaveTable(array("Q", [k for k, _ in entries]), array("f", [v for _, v in entries]))
+
+
+def write_leaves(table: LeaveTable, path: str | Path) -> None:
+    """Serialize table (written atomically)."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as outfile:
+        outfile.write(_HEADER.pack(_MAGIC, _BYTE_ORDER, len(table)))
+        outfile.write(array("Q", table.keys).tobytes())
+        outfile.write(array("f", table.values).tobytes())
+    os.replace(tmp, path)
+
+
+def open_leaves(path: str | Path) -> LeaveTable | None:
+    """Memory-map a leave file zero-copy; None if missing or foreign."""
+    try:
+        with open(path, "rb") as infile:
+            buf = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(buf) < _HEADER.size:
+        return None
+    magic, byte_order, count = _HEADER.unpack_from(buf)
+    if magic != _MAGIC or byte_order != _BYTE_ORDER or len(buf) != _HEADER.size + 12 * count:
+        return None
+    view = memoryview(buf)
+    keys_end = _HEADER.size + 8 * count
+    return LeaveTable(view[_HEADER.size : keys_end].cast("Q"), view[keys_end:].cast("f"))
+
+
+@lru_cache(maxsize=None)
+def load_leaves(path: str | Path | None = None) -> LeaveTable:
+    """Leave table at path (default: DATA_ROOT/leaves.bin), loaded once per process."""
+    target = Path(path) if path is not None else data_path(LEAVES_NAME)
+    table = open_leaves(target)
+    if table is None:
+        raise FileNotFoundError(f"No leave table at {target}; build one with `squabble fit-leaves`.")
+    return table
+
+
+def leave_observations(games: Iterable[Mapping[str, Any]]) -> Iterator[tuple[str, int]]:
+    """(leave, points on that player's next turn) for every turn in simulate records that has one."""
+    for game in games:
+        pending: dict[str, str] = {}
+        for turn in game["turns"]:
+            player = turn["player"]
+            if player in pending:
+                yield pending[player], turn["score"]
+            pending[player] = turn["leave"]
+
+
+def fit_leaves(
+    observations: Iterable[tuple[str, int]],
+    *,
+    min_count: int = 1,
+    prior: float = 20.0,
+    epochs: int = 25,
+) -> LeaveTable:
+    """Fit leave values from (leave, next-turn points) pairs.
+
+    Each tile gets an additive value (least squares by coordinate descent); each leave seen at
+    least min_count times then gets its mean next-turn points over the average, shrunk toward
+    the additive estimate with prior pseudo-observations. Single tiles are always stored.
+    """
+    leaves: list[list[int]] = []
+    targets: list[float] = []
+    for leave, points in observations:
+        leaves.append([tile_index(tile) for tile in leave])
+        targets.append(float(points))
+    if not targets:
+        raise ValueError("No leave observations to fit.")
+    mean = sum(targets) / len(targets)
+    residual = [t - mean for t in targets]
+
+    # Additive per-tile values: Gauss-Seidel on the tile-count regression.
+    # by_tile[slot] lists row i once per copy of the tile, so sums over it weight rows by count.
+    weights = [0.0] * len(TILE_KINDS)
+    by_tile: list[list[int]] = [[] for _ in TILE_KINDS]
+    scale = [1.0] * len(TILE_KINDS)  # 1 + sum of squared counts (ridge-damped step size)
+    for i, slots in enumerate(leaves):
+        for slot in slots:
+            by_tile[slot].append(i)
+        for slot in set(slots):
+            scale[slot] += slots.count(slot) ** 2
+    predicted = [0.0] * len(leaves)
+    for _ in range(epochs):
+        for slot, rows in enumerate(by_tile):
+            if not rows:
+                continue
+            step = sum(residual[i] - predicted[i] for i in rows) / scale[slot]
+            weights[slot] += step
+            for i in rows:
+                predicted[i] += step
+
+    sums: dict[int, float] = defaultdict(float)
+    counts: dict[int, int] = defaultdict(int)
+    for slots, r in zip(leaves, residual):
+        key = leave_key(TILE_KINDS[s] for s in slots)
+        sums[key] += r
+        counts[key] += 1
+
+    values: dict[str, float] = {tile: weights[slot] for slot, tile in enumerate(TILE_KINDS)}
+    for key, n in counts.items():
+        if n < min_count or key == 0:
+            continue
+        tiles = key_tiles(key)
+        additive = sum(weights[tile_index(t)] for t in tiles)
+        values[tiles] = (sums[key] + prior * additive) / (n + prior)
+    return build_leave_table(values)
@@ -0,0 +1,296 @@
+"""Minimized DAWG lexicon stored as flat integer arrays."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from pathlib import Path
+
+from .paths import data_path
+
+LETTER_COUNT = 26
+TERMINAL = 1 << 31
+SEPARATOR = 26  # GADDAG "reverse prefix ends here" letter; spelled "[" (the character after Z).
+LETTER_BITS = (1 << 27) - 1  # Bits 0-25 are letters, bit 26 is the GADDAG separator.
+
+_A_ORD = ord("A")
+_SEPARATOR_CHAR = chr(_A_ORD + SEPARATOR)
+
+COMPILED_LEXICON_NAME = "lexicon.dawg"
+COMPILED_GADDAG_NAME = "lexicon.gaddag"
+
+# Compiled file: header, then node_mask (u32 × n), node_edges (u32 × n+1),
+# edge_target (u32 × m) and edge_letter (u8 × m), all in native byte order.
+_MAGIC = b"SQDAWG\x00\x01"
+_HEADER = struct.Struct("<8s4sIIII")  # magic, byte order, nodes, edges, root, source crc32
+_BYTE_ORDER = b"LE\x00\x00" if sys.byteorder == "little" else b"BE\x00\x00"
+
+
+class Dawg:
+    """Word graph in compressed-sparse-row form.
+
+    Node n owns edges node_edges[n] .. node_edges[n + 1] (sorted by letter). node_mask[n]
+    has bit i set when the node has a child on letter i, plus TERMINAL when the path from
+    the root to n spells a complete word. edge_letter / edge_target describe each edge.
+    """
+
+    __slots__ = ("node_mask", "node_edges", "edge_letter", "edge_target", "root")
+
+    def __init__(
+        self,
+        node_mask: Sequence[int],
+        node_edges: Sequence[int],
+        edge_letter: Sequence[int],
+        edge_target: Sequence[int],
+        root: int,
+    ) -> None:
+        self.node_mask = node_mask
+        self.node_edges = node_edges
+        self.edge_letter = edge_letter
+        self.edge_target = edge_target
+        self.root = root
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.node_mask)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the graph."""
+        return len(self.edge_target)
+
+    def is_terminal(self, node: int) -> bool:
+        """True if the path to node spells a complete word."""
+        return bool(self.node_mask[node] & TERMINAL)
+
+    def child(self, node: int, letter: int) -> int:
+        """Node reached from node along letter (0-based index), or -1."""
+        mask = self.node_mask[node]
+        if not (mask >> letter) & 1:
+            return -1
+        return self.edge_target[self.node_edges[node] + (mask & ((1 << letter) - 1)).bit_count()]
+
+    def children(self, node: int) -> Iterator[tuple[int, int]]:
+        """(letter, child) pairs leaving node, in letter order."""
+        letters, targets = self.edge_letter, self.edge_target
+        for e in range(self.node_edges[node], self.node_edges[node + 1]):
+            yield letters[e], targets[e]
+
+    def walk(self, word: str, node: int | None = None) -> int:
+        """Follow word (case-insensitive) from node (default root); -1 if it leaves the graph."""
+        if node is None:
+            node = self.root
+        mask_of, edges_of, targets = self.node_mask, self.node_edges, self.edge_target
+        for ch in word.upper():
+            letter = ord(ch) - _A_ORD
+            if not 0 <= letter < LETTER_COUNT:
+                return -1
+            mask = mask_of[node]
+            if not (mask >> letter) & 1:
+                return -1
+            node = targets[edges_of[node] + (mask & ((1 << letter) - 1)).bit_count()]
+        return node
+
+    def __contains__(self, word: object) -> bool:
+        """True if word (a str) is a complete word in the graph."""
+        if not isinstance(word, str):
+            return False
+        node = self.walk(word)
+        return node != -1 and bool(self.node_mask[node] & TERMINAL)
+
+    def words(self) -> Iterator[str]:
+        """Every word in the graph, in sorted order."""
+        stack: list[tuple[int, str]] = [(self.root, "")]
+        while stack:
+            node, prefix = stack.pop()
+            if self.node_mask[node] & TERMINAL:
+                yield prefix
+            for letter, child in reversed(list(self.children(node))):
+                stack.append((child, prefix + chr(_A_ORD + letter)))
+
+
+def build_dawg(words: Iterable[str]) -> Dawg:
+    """Build a minimized DAWG (incremental construction over the sorted, upper-cased word list)."""
+    register: dict[tuple[bool, tuple[tuple[int, int], ...]], int] = {}
+    frozen: list[tuple[bool, tuple[tuple[int, int], ...]]] = []
+    # Unfrozen nodes along the previous word: [terminal, {letter: child id}]. The edge on
+    # prev[i] out of path[i] leads to path[i + 1] and is filled in when that node freezes.
+    path: list[tuple[list[bool], dict[int, int]]] = [([False], {})]
+    prev: list[int] = []
+
+    def freeze_down_to(depth: int) -> None:
+        while len(path) > depth + 1:
+            terminal, edges = path.pop()
+            key = (terminal[0], tuple(edges.items()))
+            node_id = register.get(key)
+            if node_id is None:
+                node_id = len(frozen)
+                register[key] = node_id
+                frozen.append(key)
+            path[-1][1][prev[len(path) - 1]] = node_id
+
+    for word in sorted({w.strip().upper() for w in words if w.strip()}):
+        letters = [ord(ch) - _A_ORD for ch in word]
+        common = 0
+        limit = min(len(letters), len(prev))
+        while common < limit and letters[common] == prev[common]:
+            common += 1
+        freeze_down_to(common)
+        for letter in letters[common:]:
+            path[-1][1][letter] = -1
+            path.append(([False], {}))
+        path[-1][0][0] = True
+        prev = letters
+    freeze_down_to(0)
+    root_terminal, root_edges = path[0]
+    frozen.append((root_terminal[0], tuple(root_edges.items())))
+
+    node_mask = array("I", bytes(4 * len(frozen)))
+    node_edges = array("I", bytes(4 * (len(frozen) + 1)))
+    edge_letter = array("B")
+    edge_target = array("I")
+    for node_id, (terminal, edges) in enumerate(frozen):
+        mask = TERMINAL if terminal else 0
+        node_edges[node_id] = len(edge_target)
+        for letter, target in edges:
+            mask |= 1 << letter
+            edge_letter.append(letter)
+            edge_target.append(target)
+        node_mask[node_id] = mask
+    node_edges[len(frozen)] = len(edge_target)
+    return Dawg(node_mask, node_edges, edge_letter, edge_target, root=len(frozen) - 1)
+
+
+def gaddag_entries(words: Iterable[str]) -> Iterator[str]:
+    """GADDAG paths for each word: reversed prefix, separator, then the rest (no separator when the prefix is the whole word)."""
+    for word in words:
+        word = word.strip().upper()
+        n = len(word)
+        for i in range(1, n + 1):
+            yield word[i - 1 :: -1] + (_SEPARATOR_CHAR + word[i:] if i < n else "")
+
+
+def build_gaddag(words: Iterable[str]) -> Dawg:
+    """Build a minimized GADDAG; letter SEPARATOR marks the switch from leftward to rightward."""
+    return build_dawg(gaddag_entries(words))
+
+
+def read_word_list(path: str | Path) -> list[str]:
+    """Upper-cased words from a newline-separated word list."""
+    with open(path, encoding="utf-8") as infile:
+        return [line.strip().upper() for line in infile if line.strip()]
+
+
+def _source_crc(path: Path) -> int:
+    return zlib.crc32(path.read_bytes())
+
+
+def write_dawg(dawg: Dawg, path: str | Path, source_crc: int = 0) -> None:
+    """Serialize dawg to the compiled lexicon format (written atomically)."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as outfile:
+        outfile.write(_HEADER.pack(_MAGIC, _BYTE_ORDER, dawg.node_count, dawg.edge_count, dawg.root, source_crc))
+        for values, typecode in (
+            (dawg.node_mask, "I"),
+            (dawg.node_edges, "I"),
+            (dawg.edge_target, "I"),
+            (dawg.edge_letter, "B"),
+        ):
+            outfile.write(array(typecode, values).tobytes())
+    os.replace(tmp, path)
+
+
+def open_dawg(path: str | Path, expected_crc: int | None = None) -> Dawg | None:
+    """Memory-map a compiled lexicon zero-copy; None if missing, foreign, or stale."""
+    try:
+        with open(path, "rb") as infile:
+            buf = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(buf) < _HEADER.size:
+        return None
+    magic, byte_order, nodes, edges, root, crc = _HEADER.unpack_from(buf)
+    if magic != _MAGIC or byte_order != _BYTE_ORDER:
+        return None
+    if expected_crc is not None and crc != expected_crc:
+        return None
+    if len(buf) != _HEADER.size + 4 * (2 * nodes + 1 + edges) + edges:
+        return None
+
+    view = memoryview(buf)
+    offset = _HEADER.size
+
+    def words32(count: int) -> memoryview:
+        nonlocal offset
+        part = view[offset : offset + 4 * count].cast("I")
+        offset += 4 * count
+        return part
+
+    node_mask = words32(nodes)
+    node_edges = words32(nodes + 1)
+    edge_target = words32(edges)
+    edge_letter = view[offset : offset + edges]
+    return Dawg(node_mask, node_edges, edge_letter, edge_target, root=root)
+
+
+def compile_lexicon(
+    dict_path: str | Path | None = None,
+    out_path: str | Path | None = None,
+    gaddag_path: str | Path | None = None,
+    *,
+    gaddag: bool = True,
+) -> list[Path]:
+    """Build the DAWG (and GADDAG) for a word list and write them next to it (default: the packaged lexicon)."""
+    source = Path(dict_path) if dict_path is not None else data_path("dictionary.txt")
+    words = read_word_list(source)
+    crc = _source_crc(source)
+    target = Path(out_path) if out_path is not None else source.with_name(COMPILED_LEXICON_NAME)
+    write_dawg(build_dawg(words), target, crc)
+    written = [target]
+    if gaddag:
+        gaddag_target = Path(gaddag_path) if gaddag_path is not None else source.with_name(COMPILED_GADDAG_NAME)
+        write_dawg(build_gaddag(words), gaddag_target, crc)
+        written.append(gaddag_target)
+    return written
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: Path, compiled_name: str) -> Dawg:
+    compiled = path.with_name(compiled_name)
+    build = build_gaddag if compiled_name == COMPILED_GADDAG_NAME else build_dawg
+    if path.is_file():
+        dawg = open_dawg(compiled, expected_crc=_source_crc(path)) if compiled.is_file() else None
+        return dawg if dawg is not None else build(read_word_list(path))
+    dawg = open_dawg(compiled)
+    if dawg is None:
+        raise FileNotFoundError(f"Neither {path} nor a compiled {compiled} was found.")
+    return dawg
+
+
+def load_lexicon(dict_path: str | Path | None = None) -> Dawg:
+    """DAWG for a word list (default: data_path("dictionary.txt")), loaded once per process.
+
+    A compiled lexicon.dawg beside the word list is memory-mapped when it was built from the
+    current word list; otherwise the graph is built in memory (run `squabble compile-lexicon`).
+    """
+    path = Path(dict_path) if dict_path is not None else data_path("dictionary.txt")
+    return _load_cached(path.resolve(), COMPILED_LEXICON_NAME)
+
+
+def load_gaddag(dict_path: str | Path | None = None) -> Dawg:
+    """GADDAG for a word list, from a current compiled lexicon.gaddag or built in memory (slow)."""
+    path = Path(dict_path) if dict_path is not None else data_path("dictionary.txt")
+    return _load_cached(path.resolve(), COMPILED_GADDAG_NAME)
+
+
+def clear_lexicon_cache() -> None:
+    """Forget the lexicons and GADDAGs loaded so far, so the next load reads them again."""
+    _load_cached.cache_clear()
@@ -0,0 +1,70 @@
+"""Bounded LRU cache of ranked candidate moves, keyed by Zobrist position keys."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+
+from .types import Move
+
+Candidates = Sequence[tuple[Move, float]]
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters since the cache was created (or cleared)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MoveCache:
+    """Least-recently-used map from a position key to its ranked candidate list.
+
+    Keys are built by the caller from the board and rack Zobrist keys plus whatever else
+    changes the ranking (list length, generator, search, leave table). Holds at most
+    capacity entries; the least recently used entry is dropped first.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """capacity: entries kept (at least 1)."""
+        if capacity < 1:
+            raise ValueError("Cache capacity must be at least 1")
+        self.capacity = capacity
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, Candidates] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Entries currently held."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Candidates | None:
+        """Cached candidates for key (marking them recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def put(self, key: Hashable, candidates: Candidates) -> None:
+        """Store candidates for key, evicting the oldest entry when full."""
+        self._entries[key] = tuple(candidates)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.stats = CacheStats()
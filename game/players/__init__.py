@@ -5,5 +5,6 @@ from __future__ import annotations
 from .base import Player
 from .computer import ComputerPlayer
 from .human import HumanPlayer
+from .simulating import SimulatingComputerPlayer
 
-__all__ = ["Player", "HumanPlayer", "ComputerPlayer"]
+__all__ = ["Player", "HumanPlayer", "ComputerPlayer", "SimulatingComputerPlayer"]
@@ -4,10 +4,16 @@ from __future__ import annotations
 
 from ..rulebook import Rulebook
 from ..types import BoardState, Move
+from ..zobrist import rack_key, rack_tile_key
 
 
 class Player:
-    """Common player state: rack, rulebook, and optional score/word history."""
+    """Common player state: rack, rulebook, and optional score/word history.
+
+    rack_key is the seat-free Zobrist key of the rack (zobrist.rack_key), kept current by
+    assigning tiles, receive_tiles and remove_tile; mutate the tiles list directly only to
+    reorder it.
+    """
 
     def __init__(
         self,
@@ -25,9 +31,19 @@ class Player:
         self.id = player_id
         self.score_hist: list[int] = []
         self.word_hist: list[str] = []
-        self.tiles: list[str] = init_tiles
+        self.tiles = init_tiles
         self.rulebook = rulebook
 
+    @property
+    def tiles(self) -> list[str]:
+        """The rack."""
+        return self._tiles
+
+    @tiles.setter
+    def tiles(self, tiles: list[str]) -> None:
+        self._tiles = tiles
+        self.rack_key = rack_key(tiles)
+
     def __str__(self) -> str:
         """Return the player's display name."""
         return self.name
@@ -45,7 +61,7 @@ class Player:
 
             if coords == (-2, -2):
                 for tile in move.word:
-                    self.tiles.remove(tile)
+                    self.remove_tile(tile)
             else:
                 is_d, is_r = (direction == "D", direction == "R")
                 y, x = coords
@@ -53,7 +69,7 @@ class Player:
                     if board_state[y + i * is_d][x + i * is_r] == " ":
                         if tile not in self.tiles and "?" in self.tiles:
                             tile = "?"
-                        self.tiles.remove(tile)
+                        self.remove_tile(tile)
 
         move = self.get_move(board_state, board=board)
 
@@ -64,7 +80,14 @@ class Player:
 
     def receive_tiles(self, new_tiles: list[str]) -> None:
         """Append newly drawn tiles to the rack."""
-        self.tiles += new_tiles
+        for tile in new_tiles:
+            self.rack_key ^= rack_tile_key(tile, self._tiles.count(tile))
+            self._tiles.append(tile)
+
+    def remove_tile(self, tile: str) -> None:
+        """Take one tile off the rack (ValueError if it is not there)."""
+        self._tiles.remove(tile)
+        self.rack_key ^= rack_tile_key(tile, self._tiles.count(tile))
 
     def set_tiles(self, tiles: list[str]) -> None:
         """Replace the rack (testing or setup)."""
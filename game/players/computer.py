@@ -2,81 +2,155 @@
 
 from __future__ import annotations
 
-from typing import Any, NamedTuple
-
+import random
+import time
+from collections import Counter
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Literal
+
+from ..anagrams import MAX_RACK_WORD
+from ..board import Board
+from ..compact_board import CompactBoard
+from ..cross_checks import ALL_LETTERS, CrossChecks, MoveParam
+from ..leaves import LeaveTable
+from ..lexicon import TERMINAL, Dawg
+from ..move_cache import MoveCache
 from ..rulebook import Rulebook
+from ..turn_stats import TurnStats, count_nodes
 from ..types import BoardState, Move
+from ..zobrist import board_key
 from .base import Player
+from .fused import top_scoring_moves
+from .gaddag import gaddag_moves
+
+if TYPE_CHECKING:
+    from ..batch_scoring import BatchScorer
+    from .endgame import EndgameResult, EndgameSolver
 
 _A_ORD = ord("A")
 _BLANK_IDX = 26
 _RACK_VEC_LEN = 27
-_TRIE_CHILDREN_KEY = "_C"
+_UPPER = [chr(_A_ORD + i) for i in range(26)]
+_LOWER = [ch.lower() for ch in _UPPER]
+# _SLOT_ONE[slot] is one tile of rack slot slot (A-Z, blank) in a rack packed four bits per slot.
+_SLOT_ONE = [1 << (slot << 2) for slot in range(_RACK_VEC_LEN)]
+# Equal-best plays considered when breaking ties with the player's rng.
+_TIE_POOL = 8
+# move_heuristic's value for a play score_move rejects.
+_ILLEGAL = float("-inf")
+
+MoveGenerator = Literal["trie", "gaddag"]
+SearchMode = Literal["full", "fused"]
+ScoringMode = Literal["loop", "batch"]
 
 
 def _find_words_dfs(
-    node: dict[str, Any],
+    lexicon: Dawg,
+    node: int,
     counts: list[int],
     fixed_at: list[str | None],
+    allowed: Sequence[int],
     pos: int,
     rack_used: int,
-    blank_mask: int,
+    letters: list[str],
     min_length: int,
     max_length: int,
     out: list[str],
+    stats: TurnStats | None = None,
 ) -> None:
-    """Depth-first trie walk: append finished words to out. counts and fixed_at are updated in place."""
-    if (
-        node["VALID"]
-        and pos >= min_length
-        and rack_used > 0
-        and fixed_at[pos] is None
-    ):
-        word: str = node["WORD"]
-        if blank_mask:
-            word = "".join(
-                c.lower() if (blank_mask >> i) & 1 else c for i, c in enumerate(word)
-            )
-        out.append(word)
-
-    if pos >= max_length:
-        return
-
-    forced = fixed_at[pos]
-    if forced is not None:
-        child = node.get(forced)
-        if child is not None:
-            _find_words_dfs(
-                child, counts, fixed_at, pos + 1, rack_used, blank_mask,
-                min_length, max_length, out,
-            )
-        return
-
-    for idx, child in node[_TRIE_CHILDREN_KEY]:
-        if counts[idx] > 0:
-            counts[idx] -= 1
-            _find_words_dfs(
-                child, counts, fixed_at, pos + 1, rack_used + 1, blank_mask,
-                min_length, max_length, out,
-            )
-            counts[idx] += 1
-        if counts[_BLANK_IDX] > 0:
-            counts[_BLANK_IDX] -= 1
-            _find_words_dfs(
-                child, counts, fixed_at, pos + 1, rack_used + 1,
-                blank_mask | (1 << pos), min_length, max_length, out,
-            )
-            counts[_BLANK_IDX] += 1
-
-
-class _MoveParam(NamedTuple):
-    """One candidate anchor: position, direction, length bounds, and board-fixed letters."""
-
-    coords: tuple[int, int]
-    dir: str
-    min_len: int
-    max_len: int
-    fixed: list[tuple[str, int]]
+    """Depth-first DAWG walk: append finished words to out (and count nodes expanded in stats).
+
+    Iterative, over an explicit stack of (node, pos, tiles used, rack, letters held, letter)
+    entries. rack packs counts (27 slots) four bits per slot and letters held has bit i set
+    while letter i is on it, so a child's rack is a subtraction, nothing is restored on the way
+    back, and only edges that are in the graph, allowed by the cross-checks and playable from
+    the rack are visited. letters is a reusable buffer (letters[:pos] spells the current path;
+    blanks are lower-case and board letters keep their case) and words are only joined when
+    found. A rack tile may only take letter i at pos when bit i of allowed[pos] is set.
+    Words come out in the same order as a recursive walk (edges in letter order, each letter
+    tile before a blank).
+    """
+    node_mask, node_edges, edge_target = lexicon.node_mask, lexicon.node_edges, lexicon.edge_target
+    upper, lower, slot_one = _UPPER, _LOWER, _SLOT_ONE
+    rack = held = 0
+    for slot, count in enumerate(counts):
+        rack += count * slot_one[slot]
+        if count and slot != _BLANK_IDX:
+            held |= 1 << slot
+    blank_one = slot_one[_BLANK_IDX]
+    stack: list[tuple[int, int, int, int, int, str]] = [(node, pos, rack_used, rack, held, "")]
+    push, pop = stack.append, stack.pop
+    if stats is not None:
+        pop = count_nodes(pop, stats)
+
+    while stack:
+        node, pos, used, rack, held, letter = pop()
+        if letter:
+            letters[pos - 1] = letter
+
+        mask = node_mask[node]
+        if mask & TERMINAL and pos >= min_length and used > 0 and fixed_at[pos] is None:
+            out.append("".join(letters[:pos]))
+        if pos >= max_length:
+            continue
+
+        forced = fixed_at[pos]
+        if forced is not None:
+            idx = ord(forced.upper()) - _A_ORD
+            if (mask >> idx) & 1:
+                child = edge_target[node_edges[node] + (mask & ((1 << idx) - 1)).bit_count()]
+                push((child, pos + 1, used, rack, held, forced))
+            continue
+
+        blank = rack >= blank_one
+        todo = allowed[pos] & mask & (ALL_LETTERS if blank else held)
+        if not todo:
+            continue
+        first_edge = node_edges[node]
+        pos += 1
+        used += 1
+        if blank:
+            blank_rack = rack - blank_one
+        # Highest letter first, so edges pop in letter order with each letter tile before a blank.
+        while todo:
+            idx = todo.bit_length() - 1
+            bit = 1 << idx
+            todo ^= bit
+            child = edge_target[first_edge + (mask & (bit - 1)).bit_count()]
+            if blank:
+                push((child, pos, used, blank_rack, held, lower[idx]))
+            if held & bit:
+                shift = idx << 2
+                left = rack - slot_one[idx]
+                push((child, pos, used, left, held if (left >> shift) & 15 else held ^ bit, upper[idx]))
+
+
+def _blank_spellings(word: str, rack: Counter[str]) -> list[str]:
+    """Every way to spell word (upper case) from rack, blanks in lower case, each letter tile
+    before a blank position by position."""
+    spellings = [("", rack["?"])]
+    for ch in word:
+        have, blank = rack[ch], ch.lower()
+        grown = []
+        for spelled, blanks in spellings:
+            if spelled.count(ch) < have:
+                grown.append((spelled + ch, blanks))
+            if blanks:
+                grown.append((spelled + blank, blanks - 1))
+        spellings = grown
+    return [spelled for spelled, _ in spellings]
+
+
+def _walk_order(word: str) -> str:
+    """Sort key putting words in _find_words_dfs output order (a prefix first, then by letter,
+    each letter tile before a blank)."""
+    return "".join(chr(2 * ord(ch.upper()) + ch.islower()) for ch in word)
+
+
+def _board_is_empty(board_state: BoardState) -> bool:
+    if isinstance(board_state, CompactBoard):
+        return board_state.is_empty()
+    return not any(row.strip() for row in board_state)
 
 
 class ComputerPlayer(Player):
@@ -88,26 +162,78 @@ class ComputerPlayer(Player):
         init_tiles: list[str],
         rulebook: Rulebook,
         name: str | None = None,
+        generator: MoveGenerator = "trie",
+        search: SearchMode = "full",
+        rng: random.Random | None = None,
+        leaves: LeaveTable | None = None,
+        endgame: EndgameSolver | None = None,
+        cache: MoveCache | None = None,
+        scoring: ScoringMode = "loop",
     ) -> None:
+        """generator picks the search: "trie" (every start square) or "gaddag" (anchor squares).
+
+        search="full" ranks every candidate by move_heuristic (override it to change the
+        ranking); "fused" scores plays during the trie walk and keeps only the best few (trie
+        generator only, ignoring move_heuristic). With rng, equal-best
+        plays are chosen between at random; without it the first one generated wins. With
+        leaves, plays are ranked by equity (score plus the value of the tiles kept). With endgame,
+        the solver picks the move whenever opponent_tiles is known (bag empty, two players).
+        cache (shareable between players) remembers ranked candidates per position.
+        scoring="batch" scores the full search's candidates in one NumPy pass (the "fast" extra).
+        """
         super().__init__(player_id, init_tiles, rulebook, name)
+        if generator not in ("trie", "gaddag"):
+            raise ValueError(f"Unknown move generator {generator!r}")
+        if search not in ("full", "fused"):
+            raise ValueError(f"Unknown search mode {search!r}")
+        if search == "fused" and generator != "trie":
+            raise ValueError("Fused search runs on the trie generator")
+        if search == "fused" and leaves is not None:
+            raise ValueError("Equity play needs the full search")
+        if scoring not in ("loop", "batch"):
+            raise ValueError(f"Unknown scoring mode {scoring!r}")
+        self.scoring: ScoringMode = scoring
+        self._batch_scorer: BatchScorer | None = None
+        if scoring == "batch":
+            from ..batch_scoring import BatchScorer
+
+            self._batch_scorer = BatchScorer(rulebook)
+        self.generator: MoveGenerator = generator
+        self.search: SearchMode = search
+        self.rng = rng
+        self.leaves = leaves
+        self.endgame = endgame
+        self.cache = cache
+        # Set by GameMaster once the bag is empty in a two-player game; None otherwise.
+        self.opponent_tiles: list[str] | None = None
+        self.last_endgame: EndgameResult | None = None
+        # With profile set, get_move fills a fresh TurnStats each turn; stats is None otherwise.
+        self.profile = False
+        self.stats: TurnStats | None = None
 
     def find_words(
         self,
         tiles: list[str] | None = None,
-        starting_branch: dict[str, Any] | None = None,
+        prefix: str = "",
         fixed_tiles: tuple[tuple[str, int], ...] = (),
-        pos: int = 0,
         min_length: int = 2,
         max_length: int = 15,
+        cross_masks: Sequence[int] | None = None,
     ) -> list[str]:
-        """Words from the rack, optional fixed board letters, and length bounds."""
+        """Words from the rack, optional prefix and fixed board letters, and length bounds.
+
+        cross_masks[i], when given, limits which letters a rack tile may take at position i.
+        """
+        pos = len(prefix)
         if pos > max_length:
             return []
 
         if tiles is None:
             tiles = self.tiles
-        if starting_branch is None:
-            starting_branch = self.rulebook.dictionary_root
+        lexicon = self.rulebook.lexicon
+        start = lexicon.walk(prefix)
+        if start == -1:
+            return []
 
         assert len(fixed_tiles) <= 1 or all(
             fixed_tiles[i][1] < fixed_tiles[i + 1][1] for i in range(len(fixed_tiles) - 1)
@@ -125,20 +251,57 @@ class ComputerPlayer(Player):
         for letter, fp in fixed_tiles:
             fixed_at[fp] = letter
 
+        letters = list(prefix) + [""] * (len(fixed_at) - pos)
+        allowed = [ALL_LETTERS] * len(fixed_at)
+        if cross_masks is not None:
+            allowed[: len(cross_masks)] = cross_masks
         out: list[str] = []
         _find_words_dfs(
-            starting_branch,
+            lexicon,
+            start,
             counts,
             fixed_at,
+            allowed,
             pos,
             0,
-            0,
+            letters,
             min_length,
             max_length,
             out,
+            self.stats,
         )
         return out
 
+    def playable_words(self, tiles: list[str] | None = None) -> list[str]:
+        """Sorted words of two or more letters the rack (default: own tiles) can spell alone.
+
+        Looked up in Rulebook.anagrams, a binary search per signature prefix rather than a
+        lexicon walk; racks longer than seven tiles only get words of up to seven letters.
+        """
+        return self.rulebook.anagrams.playable(self.tiles if tiles is None else tiles)
+
+    def opening_moves(self, locations: Sequence[MoveParam]) -> list[Move]:
+        """The trie generator's plays for an empty board, from the anagram index.
+
+        locations are get_valid_locations on the empty board; plays come out in the same order
+        as the find_words loop would produce them.
+        """
+        rack = Counter(self.tiles)
+        spellings = sorted(
+            (spelled for word in self.playable_words() for spelled in _blank_spellings(word, rack)),
+            key=_walk_order,
+        )
+        # Empty-board locations share a handful of length bounds; filter once per bounds.
+        by_bounds: dict[tuple[int, int], list[str]] = {}
+        moves = []
+        for vl in locations:
+            bounds = (max(2, vl.min_len), vl.max_len)
+            words = by_bounds.get(bounds)
+            if words is None:
+                words = by_bounds[bounds] = [w for w in spellings if bounds[0] <= len(w) <= bounds[1]]
+            moves += [Move(vl.coords, vl.dir, word) for word in words]
+        return moves
+
     def get_move_params(
         self, coords: tuple[int, int], direction: str, board_state: BoardState
     ) -> tuple[int, list[tuple[str, int]]]:
@@ -197,9 +360,23 @@ class ComputerPlayer(Player):
             x += 1
         return tiles_to_validity, fixed_tiles
 
-    def get_valid_locations(self, board_state: BoardState) -> list[_MoveParam]:
-        """List every anchor square and direction where a word may legally start."""
-        valid_move_params: list[_MoveParam] = []
+    def get_valid_locations(
+        self, board_state: BoardState, cross_checks: CrossChecks | None = None
+    ) -> list[MoveParam]:
+        """List every square and direction where a word may legally start.
+
+        With a board's cached CrossChecks, anchors and per-line results are reused across turns.
+        """
+        if cross_checks is not None:
+            rack_size = len(self.tiles)
+            return [
+                param
+                for direction in ("D", "R")
+                for line in range(15)
+                for param in cross_checks.start_squares(board_state, direction, line, rack_size)
+            ]
+
+        valid_move_params: list[MoveParam] = []
 
         for y in range(15):
             for x in range(15):
@@ -208,11 +385,11 @@ class ComputerPlayer(Player):
                     if min_len != -1:
                         if direction == "D":
                             valid_move_params.append(
-                                _MoveParam((y, x), direction, min_len, 15 - y, fixed_tiles)
+                                MoveParam((y, x), direction, min_len, 15 - y, fixed_tiles)
                             )
                         else:
                             valid_move_params.append(
-                                _MoveParam((y, x), direction, min_len, 15 - x, fixed_tiles)
+                                MoveParam((y, x), direction, min_len, 15 - x, fixed_tiles)
                             )
 
         return valid_move_params
@@ -220,33 +397,175 @@ class ComputerPlayer(Player):
     def get_move(
         self,
         board_state: BoardState,
-        board: Board | None = None,
+        board: object | None = None,
         *,
         scores: list[tuple[str, int]] | None = None,
         turn: int | None = None,
     ) -> Move:
-        """Choose the highest-scoring valid move or pass when none score positively."""
-        valid_locations = self.get_valid_locations(board_state)
-
-        valid_moves: list[Move] = []
-        for vl in valid_locations:
-            valid_words = self.find_words(
-                fixed_tiles=tuple(vl.fixed),
-                min_length=max(2, vl.min_len),
-                max_length=vl.max_len,
-            )
-            valid_moves += [Move(vl.coords, vl.dir, word) for word in valid_words]
-
-        move_scores = [(move, self.move_heuristic(move, board_state)) for move in valid_moves]
-        move_scores = sorted(move_scores, key=lambda x: x[1], reverse=True)
-
-        if move_scores and move_scores[0][1] > 0:
-            best = move_scores[0][0]
-            self.word_hist.append(best.word)
-            self.score_hist.append(move_scores[0][1])
-            return best
-        return Move((-1, -1), "", "")
-
-    def move_heuristic(self, move: Move, board_state: BoardState) -> int:
-        """Rulebook score for this move on the given board."""
-        return self.rulebook.score_move(move, board_state)
+        """Choose the best valid move (by score, or equity with a leave table); pass when none scores."""
+        stats = self.stats = TurnStats() if self.profile else None
+        started = time.perf_counter() if stats is not None else 0.0
+        try:
+            solved = self.endgame_move(board_state, board)
+            if solved is not None:
+                return solved
+            cross_checks = None
+            if isinstance(board, Board) and board.state is board_state:
+                cross_checks = self.rulebook.analyse(board)
+            move_scores = self.top_moves(board_state, 1 if self.rng is None else _TIE_POOL, cross_checks)
+
+            if move_scores and (self.leaves is not None or move_scores[0][1] > 0):
+                best, best_score = move_scores[0]
+                tied = [move for move, score in move_scores if score == best_score]
+                if len(tied) > 1 and self.rng is not None:
+                    best = tied[self.rng.randrange(len(tied))]
+                if self.leaves is not None:
+                    best_score = self.rulebook.score_move(best, board_state, cross_checks=cross_checks)
+                self.word_hist.append(best.word)
+                self.score_hist.append(int(best_score))
+                return best
+            return Move((-1, -1), "", "")
+        finally:
+            if stats is not None:
+                stats.total_seconds = time.perf_counter() - started
+
+    def endgame_move(self, board_state: BoardState, board: object | None) -> Move | None:
+        """The endgame solver's move when it applies (and record it), else None."""
+        if self.endgame is None or self.opponent_tiles is None:
+            return None
+        if not isinstance(board, Board) or board.state is not board_state:
+            return None
+        result = self.endgame.solve(board, self.tiles, self.opponent_tiles)
+        self.last_endgame = result
+        if self.stats is not None:
+            self.stats.endgame = True
+        if result.move.coords != (-1, -1):
+            self.word_hist.append(result.move.word)
+            self.score_hist.append(self.rulebook.score_move(result.move, board_state, cross_checks=board.analysis))
+        return result.move
+
+    def top_moves(
+        self, board_state: BoardState, k: int, cross_checks: CrossChecks | None = None
+    ) -> Sequence[tuple[Move, float]]:
+        """The k best candidates with their heuristic values, best first (ties in generation order).
+
+        With a move cache, results are looked up by board and rack key before searching.
+        """
+        cache_key: tuple[object, ...] | None = None
+        if self.cache is not None:
+            board_hash = board_state.key if isinstance(board_state, CompactBoard) else board_key(board_state)
+            cache_key = (board_hash, self.rack_key, k, self.generator, self.search, self.leaves)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self.stats is not None:
+                    self.stats.cached = True
+                return cached
+
+        if cross_checks is None:
+            cross_checks = self.rulebook.cross_checks(board_state)
+        move_scores: Sequence[tuple[Move, float]]
+        stats = self.stats
+        if self.search == "fused":
+            started = time.perf_counter() if stats is not None else 0.0
+            locations = self.get_valid_locations(board_state, cross_checks)
+            located = time.perf_counter() if stats is not None else 0.0
+            move_scores = top_scoring_moves(self.rulebook, board_state, self.tiles, locations, cross_checks, k, stats)
+            if stats is not None:
+                stats.anchors += len(locations)
+                stats.candidates += len(move_scores)
+                stats.locate_seconds += located - started
+                stats.search_seconds += time.perf_counter() - located
+        else:
+            valid_moves = self.generate_moves(board_state, cross_checks)
+            started = time.perf_counter() if stats is not None else 0.0
+            ranked = self._rank_moves(valid_moves, board_state, cross_checks)
+            ranked.sort(key=lambda x: x[1], reverse=True)
+            move_scores = ranked[:k]
+            if stats is not None:
+                stats.score_seconds += time.perf_counter() - started
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.put(cache_key, move_scores)
+        return move_scores
+
+    def generate_moves(self, board_state: BoardState, cross_checks: CrossChecks | None = None) -> list[Move]:
+        """Legal plays for the rack: main word and every cross-word valid, touching the board."""
+        if cross_checks is None:
+            cross_checks = self.rulebook.cross_checks(board_state)
+        stats = self.stats
+        started = time.perf_counter() if stats is not None else 0.0
+        if self.generator == "gaddag":
+            valid_moves = gaddag_moves(self.rulebook.gaddag, board_state, self.tiles, cross_checks, stats)
+            if stats is not None:
+                stats.anchors += 2 * sum(cross_checks.anchors)
+                stats.candidates += len(valid_moves)
+                stats.search_seconds += time.perf_counter() - started
+            return valid_moves
+
+        locations = self.get_valid_locations(board_state, cross_checks)
+        located = time.perf_counter() if stats is not None else 0.0
+        valid_moves = []
+        if len(self.tiles) <= MAX_RACK_WORD and _board_is_empty(board_state):
+            # Opening: no board letters or cross-checks, so the anagram index has every word.
+            valid_moves = self.opening_moves(locations)
+        else:
+            for vl in locations:
+                valid_words = self.find_words(
+                    fixed_tiles=tuple(vl.fixed),
+                    min_length=max(2, vl.min_len),
+                    max_length=vl.max_len,
+                    cross_masks=cross_checks.line_masks(vl.coords, vl.dir, vl.max_len),
+                )
+                valid_moves += [Move(vl.coords, vl.dir, word) for word in valid_words]
+        if stats is not None:
+            stats.anchors += len(locations)
+            stats.candidates += len(valid_moves)
+            stats.locate_seconds += located - started
+            stats.search_seconds += time.perf_counter() - located
+        return valid_moves
+
+    def _rank_moves(
+        self, moves: list[Move], board_state: BoardState, cross_checks: CrossChecks
+    ) -> list[tuple[Move, float]]:
+        """Each move with its move_heuristic value; moves it rates -inf (score_move rejects them)
+        are dropped, so with a leave table (where a legal play can be worth less than -1) none can
+        outrank a legal one."""
+        heuristic = self.move_heuristic
+        if self._batch_scorer is None:
+            values = [heuristic(move, board_state, cross_checks) for move in moves]
+        else:
+            from ..batch_scoring import encode_moves
+
+            scores = self._batch_scorer.scores(encode_moves(moves), board_state, cross_checks).tolist()
+            values = [heuristic(move, board_state, cross_checks, score) for move, score in zip(moves, scores)]
+        ranked = [(move, value) for move, value in zip(moves, values) if value != _ILLEGAL]
+        if self.stats is not None:
+            self.stats.rejected += len(moves) - len(ranked)
+        return ranked
+
+    def move_heuristic(
+        self, move: Move, board_state: BoardState, cross_checks: CrossChecks | None = None, score: int | None = None
+    ) -> float:
+        """Rulebook score for this move on the given board (score, when already computed), plus
+        the leave value in equity mode; -inf for an illegal move, below any legal one.
+
+        The full search ranks candidates by this, so subclasses can override it to change what
+        the computer prefers (batch scoring passes score in).
+        """
+        if score is None:
+            score = self.rulebook.score_move(move, board_state, cross_checks=cross_checks)
+        if score < 0:
+            return _ILLEGAL
+        if self.leaves is None:
+            return score
+        return score + self.leaves.value(self.leave_after(move, board_state))
+
+    def leave_after(self, move: Move, board_state: BoardState) -> list[str]:
+        """Rack tiles left over after playing move (blanks stay "?")."""
+        rack = list(self.tiles)
+        y, x = move.coords
+        is_d, is_r = move.dir == "D", move.dir == "R"
+        for i, ch in enumerate(move.word):
+            if board_state[y + i * is_d][x + i * is_r] == " ":
+                rack.remove("?" if ch.islower() else ch)
+        return rack
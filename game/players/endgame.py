@@ -0,0 +1,185 @@
+"""Endgame search: with the bag empty and both racks known, play for the best final spread."""
+
+from __future__ import annotations
+
+import time
+from typing import NamedTuple
+
+from ..board import Board
+from ..rulebook import Rulebook
+from ..types import Move
+from ..zobrist import PASS_KEY, SIDE_KEYS, rack_key
+from .computer import ComputerPlayer
+
+PASS = Move((-1, -1), "", "")
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+_SOLVED = 1 << 30  # table depth for values searched to the end of the game (no horizon below)
+
+
+class EndgameResult(NamedTuple):
+    """Chosen move, its value (final spread change for the mover), and how the search went."""
+
+    move: Move
+    value: int
+    depth: int
+    nodes: int
+    complete: bool
+
+
+class _Abort(Exception):
+    pass
+
+
+class EndgameSolver:
+    """Negamax alpha-beta over the two known racks, with iterative deepening and a transposition table.
+
+    Values are the points the side to move gains over its opponent from here to the end,
+    including GameMaster._apply_endgame_scoring (going out earns twice the opponent's rack;
+    two passes in a row end the game with each side losing its own rack). Moves are ordered by
+    score, with the table's best move first. When the node or time limit cuts a search short,
+    the last fully searched depth decides; if none finished, the highest-scoring play is taken.
+    """
+
+    def __init__(
+        self,
+        rulebook: Rulebook,
+        *,
+        node_limit: int = 20_000,
+        time_limit: float = 2.0,
+        max_depth: int = 16,
+    ) -> None:
+        """Limits apply to each solve call."""
+        self.rulebook = rulebook
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        # Fused search returns every play with its score, best first.
+        self._generator = ComputerPlayer(0, [], rulebook, name="endgame", search="fused")
+
+    def solve(self, board: Board, rack: list[str], opponent_rack: list[str]) -> EndgameResult:
+        """Best move for the player holding rack; board is not modified."""
+        self._board = Board()
+        self._board.grid = board.grid.copy()
+        self.rulebook.analyse(self._board)
+        self._racks = [list(rack), list(opponent_rack)]
+        self._table: dict[int, tuple[int, int, int, Move | None]] = {}
+        self._nodes = 0
+        self._deadline = time.perf_counter() + self.time_limit
+
+        best: EndgameResult | None = None
+        for depth in range(1, self.max_depth + 1):
+            self._horizons = 0
+            try:
+                value, move = self._search_root(depth)
+            except _Abort:
+                break
+            best = EndgameResult(move, value, depth, self._nodes, not self._horizons)
+            if not self._horizons:
+                break
+        if best is None:
+            moves = self._ordered_moves(0, None)
+            move = moves[0][0] if moves else PASS
+            return EndgameResult(move, 0, 0, self._nodes, False)
+        return best._replace(nodes=self._nodes)
+
+    def _penalty(self, seat: int) -> int:
+        return self.rulebook.calculate_penalty(self._racks[seat])
+
+    def _position_key(self, mover: int, passes: int) -> int:
+        key = self._board.key ^ SIDE_KEYS[mover] ^ rack_key(self._racks[0], 0) ^ rack_key(self._racks[1], 1)
+        return key ^ PASS_KEY if passes else key
+
+    def _ordered_moves(self, mover: int, first: Move | None) -> list[tuple[Move, int]]:
+        board = self._board
+        self._generator.tiles = self._racks[mover]
+        moves = [(move, int(score)) for move, score in self._generator.top_moves(board.state, 1 << 30, board.analysis)]
+        if first is not None and first in (m for m, _ in moves):
+            moves.sort(key=lambda m: m[0] != first)
+        return moves
+
+    def _play(self, move: Move, mover: int) -> tuple[list[int], list[str]]:
+        placed = self._board.apply_move(move)
+        rack = self._racks[mover]
+        used = []
+        for sq in placed:
+            ch = chr(self._board.grid.cells[sq])
+            tile = "?" if ch.islower() else ch
+            rack.remove(tile)
+            used.append(tile)
+        return placed, used
+
+    def _unplay(self, placed: list[int], used: list[str], mover: int) -> None:
+        self._board.undo_move(placed)
+        self._racks[mover].extend(used)
+
+    def _search_root(self, depth: int) -> tuple[int, Move]:
+        alpha, beta = -(10**9), 10**9
+        best_move = PASS
+        key = self._position_key(0, 0)
+        entry = self._table.get(key)
+        for move, score in self._ordered_moves(0, entry[3] if entry else None):
+            value = self._child_value(move, score, 0, depth, alpha, beta)
+            if value > alpha:
+                alpha, best_move = value, move
+        pass_value = -self._negamax(depth - 1, -beta, -alpha, 1, 1)
+        if pass_value > alpha:
+            alpha, best_move = pass_value, PASS
+        self._table[key] = (depth, alpha, _EXACT, best_move)
+        return alpha, best_move
+
+    def _child_value(self, move: Move, score: int, mover: int, depth: int, alpha: int, beta: int) -> int:
+        placed, used = self._play(move, mover)
+        try:
+            if not self._racks[mover]:
+                return score + 2 * self._penalty(1 - mover)
+            return score - self._negamax(depth - 1, -beta, -alpha, 1 - mover, 0)
+        finally:
+            self._unplay(placed, used, mover)
+
+    def _negamax(self, depth: int, alpha: int, beta: int, mover: int, passes: int) -> int:
+        self._nodes += 1
+        if self._nodes > self.node_limit or (
+            not self._nodes & 255 and time.perf_counter() > self._deadline
+        ):
+            raise _Abort
+
+        if depth <= 0:
+            self._horizons += 1
+            return self._penalty(1 - mover) - self._penalty(mover)
+
+        key = self._position_key(mover, passes)
+        entry = self._table.get(key)
+        if entry is not None and entry[0] >= depth:
+            entry_depth, value, flag, _ = entry
+            if entry_depth != _SOLVED:
+                self._horizons += 1
+            if flag == _EXACT:
+                return value
+            if flag == _LOWER:
+                alpha = max(alpha, value)
+            elif flag == _UPPER:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        original_alpha, horizons = alpha, self._horizons
+        best, best_move = -(10**9), None
+        for move, score in self._ordered_moves(mover, entry[3] if entry else None):
+            value = self._child_value(move, score, mover, depth, alpha, beta)
+            if value > best:
+                best, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        if alpha < beta:
+            if passes:
+                value = self._penalty(1 - mover) - self._penalty(mover)
+            else:
+                value = -self._negamax(depth - 1, -beta, -alpha, 1 - mover, 1)
+            if value > best:
+                best, best_move = value, PASS
+
+        flag = _UPPER if best <= original_alpha else _LOWER if best >= beta else _EXACT
+        self._table[key] = (depth if self._horizons != horizons else _SOLVED, best, flag, best_move)
+        return best
@@ -0,0 +1,117 @@
+"""Fused generate-and-score search: score plays while walking the DAWG, keep only the best k."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Sequence
+
+from ..cross_checks import NO_CROSS_WORD, CrossChecks, MoveParam
+from ..lexicon import TERMINAL
+from ..rulebook import Rulebook
+from ..turn_stats import TurnStats, count_nodes
+from ..types import BoardState, Move
+
+_A_ORD = ord("A")
+_BLANK_IDX = 26
+
+_UPPER = [chr(_A_ORD + i) for i in range(26)]
+_LOWER = [ch.lower() for ch in _UPPER]
+
+
+def top_scoring_moves(
+    rulebook: Rulebook,
+    board_state: BoardState,
+    tiles: list[str],
+    locations: Sequence[MoveParam],
+    cross_checks: CrossChecks,
+    k: int = 1,
+    stats: TurnStats | None = None,
+) -> list[tuple[Move, int]]:
+    """The k highest-scoring legal plays from locations, best first, with their scores.
+
+    Scores equal Rulebook.score_move: the running main-word letter sum, word multiplier and
+    cross-word totals are carried down the walk, so no candidate list is built or sorted.
+    Ties keep the play found first, matching a stable sort of the full candidate list.
+    With stats, the lexicon nodes expanded are added to stats.nodes.
+    """
+    lexicon = rulebook.lexicon
+    node_mask, node_edges = lexicon.node_mask, lexicon.node_edges
+    edge_letter, edge_target = lexicon.edge_letter, lexicon.edge_target
+    tile_scores = rulebook.tile_scores
+    points = [tile_scores[ch] for ch in _UPPER]
+    blank_points = tile_scores["?"]
+
+    counts = [0] * 27
+    for tile in tiles:
+        counts[_BLANK_IDX if tile == "?" else ord(tile) - _A_ORD] += 1
+
+    heap: list[tuple[int, int, tuple[int, int], str, str]] = []
+    seq = 0
+    letters = [""] * 16
+
+    for loc in locations:
+        y, x = loc.coords
+        is_d, is_r = loc.dir == "D", loc.dir == "R"
+        max_len = loc.max_len
+        min_len = max(2, loc.min_len)
+        fixed_at: list[str | None] = [None] * (max_len + 1)
+        for letter, fp in loc.fixed:
+            fixed_at[fp] = letter
+        squares = [(y + i * is_d, x + i * is_r) for i in range(max_len)]
+        letter_mul = [rulebook.letter_mul[sy * 15 + sx] for sy, sx in squares]
+        word_mul_at = [rulebook.word_mul[sy * 15 + sx] for sy, sx in squares]
+        masks = cross_checks.line_masks(loc.coords, loc.dir, max_len)
+        partials = [cross_checks.cross_score[loc.dir][sy * 15 + sx] for sy, sx in squares]
+        coords, direction = loc.coords, loc.dir
+
+        def dfs(node: int, pos: int, used: int, main_sum: int, word_mul: int, cross_sum: int) -> None:
+            nonlocal seq
+            mask = node_mask[node]
+            if mask & TERMINAL and pos >= min_len and used > 0 and fixed_at[pos] is None:
+                score = main_sum * word_mul + cross_sum + (50 if used == 7 else 0)
+                seq += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, (score, -seq, coords, direction, "".join(letters[:pos])))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, -seq, coords, direction, "".join(letters[:pos])))
+
+            if pos >= max_len:
+                return
+
+            forced = fixed_at[pos]
+            if forced is not None:
+                letter = ord(forced.upper()) - _A_ORD
+                if (mask >> letter) & 1:
+                    letters[pos] = forced
+                    child = edge_target[node_edges[node] + (mask & ((1 << letter) - 1)).bit_count()]
+                    face = blank_points if forced.islower() else points[letter]
+                    dfs(child, pos + 1, used, main_sum + face, word_mul, cross_sum)
+                return
+
+            allowed, lm, wm, partial = masks[pos], letter_mul[pos], word_mul_at[pos], partials[pos]
+            for e in range(node_edges[node], node_edges[node + 1]):
+                letter = edge_letter[e]
+                if not (allowed >> letter) & 1:
+                    continue
+                child = edge_target[e]
+                if counts[letter] > 0:
+                    counts[letter] -= 1
+                    letters[pos] = _UPPER[letter]
+                    value = points[letter] * lm
+                    cross = 0 if partial == NO_CROSS_WORD else (partial + value) * wm
+                    dfs(child, pos + 1, used + 1, main_sum + value, word_mul * wm, cross_sum + cross)
+                    counts[letter] += 1
+                if counts[_BLANK_IDX] > 0:
+                    counts[_BLANK_IDX] -= 1
+                    letters[pos] = _LOWER[letter]
+                    value = blank_points * lm
+                    cross = 0 if partial == NO_CROSS_WORD else (partial + value) * wm
+                    dfs(child, pos + 1, used + 1, main_sum + value, word_mul * wm, cross_sum + cross)
+                    counts[_BLANK_IDX] += 1
+
+        if stats is not None:
+            dfs = count_nodes(dfs, stats)
+        dfs(lexicon.root, 0, 0, 0, 1, 0)
+
+    ranked = sorted(heap, reverse=True)
+    return [(Move(coords, direction, word), score) for score, _, coords, direction, word in ranked]
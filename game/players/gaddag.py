@@ -0,0 +1,131 @@
+"""GADDAG move generation: grow each placement leftward from an anchor, then rightward."""
+
+from __future__ import annotations
+
+from ..cross_checks import ALL_LETTERS, CrossChecks
+from ..lexicon import SEPARATOR, TERMINAL, Dawg
+from ..turn_stats import TurnStats, count_nodes
+from ..types import BoardState, Move
+
+_A_ORD = ord("A")
+_BLANK_IDX = 26
+
+
+def anchor_squares(board_state: BoardState) -> list[list[bool]]:
+    """Empty squares next to a tile (or the empty centre square): every play covers one."""
+    anchors = [[False] * 15 for _ in range(15)]
+    for y in range(15):
+        row = board_state[y]
+        for x in range(15):
+            if row[x] != " ":
+                continue
+            anchors[y][x] = (
+                (y, x) == (7, 7)
+                or (x > 0 and row[x - 1] != " ")
+                or (x < 14 and row[x + 1] != " ")
+                or (y > 0 and board_state[y - 1][x] != " ")
+                or (y < 14 and board_state[y + 1][x] != " ")
+            )
+    return anchors
+
+
+def gaddag_moves(
+    gaddag: Dawg,
+    board_state: BoardState,
+    tiles: list[str],
+    cross_checks: CrossChecks | None = None,
+    stats: TurnStats | None = None,
+) -> list[Move]:
+    """Every placement of rack tiles forming a dictionary main word that touches the board.
+
+    With cross_checks, rack tiles only take letters allowed by the perpendicular words, so every
+    returned play is legal.
+
+    Words use the same spelling as ComputerPlayer.find_words: blanks are lower-case and board
+    letters keep their case. Each play is generated once, from its leftmost (topmost) anchor,
+    by refusing to extend leftward across another anchor. With stats, the GADDAG nodes
+    expanded are added to stats.nodes.
+    """
+    counts = [0] * 27
+    for tile in tiles:
+        counts[_BLANK_IDX if tile == "?" else ord(tile) - _A_ORD] += 1
+
+    node_mask, node_edges = gaddag.node_mask, gaddag.node_edges
+    edge_letter, edge_target = gaddag.edge_letter, gaddag.edge_target
+    anchors = anchor_squares(board_state)
+    out: list[Move] = []
+    placed = [""] * 15
+
+    for direction in ("R", "D"):
+        for line_idx in range(15):
+            if direction == "R":
+                line = board_state[line_idx]
+                line_anchors = anchors[line_idx]
+            else:
+                line = "".join(board_state[y][line_idx] for y in range(15))
+                line_anchors = [anchors[y][line_idx] for y in range(15)]
+            if cross_checks is not None:
+                start = (line_idx, 0) if direction == "R" else (0, line_idx)
+                line_masks = cross_checks.line_masks(start, direction, 15)
+            else:
+                line_masks = [ALL_LETTERS] * 15
+
+            def record(lo: int, hi: int) -> None:
+                word = "".join(placed[lo : hi + 1])
+                coords = (line_idx, lo) if direction == "R" else (lo, line_idx)
+                out.append(Move(coords, direction, word))
+
+            def step(i: int, node: int, leftward: bool, anchor: int, lo: int) -> None:
+                """Fill square i from node, then continue in the current direction."""
+                ch = line[i]
+                if ch != " ":
+                    mask = node_mask[node]
+                    letter = ord(ch.upper()) - _A_ORD
+                    if (mask >> letter) & 1:
+                        placed[i] = ch
+                        child = edge_target[node_edges[node] + (mask & ((1 << letter) - 1)).bit_count()]
+                        advance(i, child, leftward, anchor, lo)
+                    return
+                allowed = line_masks[i]
+                for e in range(node_edges[node], node_edges[node + 1]):
+                    letter = edge_letter[e]
+                    if not (allowed >> letter) & 1:
+                        continue
+                    child = edge_target[e]
+                    if counts[letter] > 0:
+                        counts[letter] -= 1
+                        placed[i] = chr(_A_ORD + letter)
+                        advance(i, child, leftward, anchor, lo)
+                        counts[letter] += 1
+                    if counts[_BLANK_IDX] > 0:
+                        counts[_BLANK_IDX] -= 1
+                        placed[i] = chr(_A_ORD + letter).lower()
+                        advance(i, child, leftward, anchor, lo)
+                        counts[_BLANK_IDX] += 1
+
+            def advance(i: int, node: int, leftward: bool, anchor: int, lo: int) -> None:
+                """Square i is filled; record a finished word and extend left, switch, or extend right."""
+                mask = node_mask[node]
+                if leftward:
+                    left_open = i == 0 or line[i - 1] == " "
+                    right_open = anchor == 14 or line[anchor + 1] == " "
+                    if mask & TERMINAL and left_open and right_open and anchor > i:
+                        record(i, anchor)
+                    if i > 0 and (line[i - 1] != " " or not line_anchors[i - 1]):
+                        step(i - 1, node, True, anchor, lo)
+                    if left_open and anchor < 14 and (mask >> SEPARATOR) & 1:
+                        sep = edge_target[node_edges[node] + (mask & ((1 << SEPARATOR) - 1)).bit_count()]
+                        step(anchor + 1, sep, False, anchor, i)
+                else:
+                    if mask & TERMINAL and (i == 14 or line[i + 1] == " "):
+                        record(lo, i)
+                    if i < 14:
+                        step(i + 1, node, False, anchor, lo)
+
+            if stats is not None:
+                advance = count_nodes(advance, stats)
+            for anchor in range(15):
+                if line_anchors[anchor]:
+                    step(anchor, gaddag.root, True, anchor, anchor)
+
+    return out
@@ -0,0 +1,238 @@
+"""Computer opponent that checks its best candidates with two-ply Monte Carlo rollouts."""
+
+from __future__ import annotations
+
+import multiprocessing
+import random
+import time
+from collections.abc import Sequence
+from multiprocessing.pool import Pool
+
+from ..board import Board
+from ..compact_board import CompactBoard
+from ..leaves import LeaveTable
+from ..lexicon import build_dawg
+from ..move_cache import MoveCache
+from ..rulebook import Rulebook
+from ..tile_bag import TILE_KINDS, load_tile_counts, tile_index
+from ..turn_stats import TurnStats
+from ..types import BoardState, Move
+from .computer import ComputerPlayer, MoveGenerator
+from .endgame import EndgameSolver
+
+# Rulebook for rollout workers; set before the pool forks so workers inherit the loaded lexicon.
+_pool_rulebook: Rulebook | None = None
+
+
+def _init_rollout_worker(words: list[str] | None) -> None:
+    """Spawned workers rebuild the player's rulebook: the packaged one, or one over words."""
+    global _pool_rulebook
+    if _pool_rulebook is None:
+        _pool_rulebook = Rulebook() if words is None else Rulebook(lexicon=build_dawg(words))
+
+
+def rollout(
+    rulebook: Rulebook,
+    rows: Sequence[str],
+    candidates: Sequence[Move],
+    unseen: Sequence[int],
+    seed: int,
+    budget: float | None,
+    max_rounds: int,
+) -> tuple[list[float], list[int]]:
+    """Sum of the opponent's best reply to each candidate over sampled opponent racks.
+
+    Each round draws one opponent rack from unseen (27 counts) and answers every candidate with
+    it, so candidates are compared on the same draws. Candidates are played and lifted with
+    Board.apply_move / undo_move. Stops after max_rounds, or as soon as budget seconds have
+    passed, checked after every reply, so the last round may cover only the first candidates
+    (the first always gets one reply). Returns the per-candidate totals and reply counts.
+    """
+    deadline = None if budget is None else time.perf_counter() + budget
+    board = Board()
+    board.grid = CompactBoard(rows)
+    rulebook.analyse(board)
+    opponent = ComputerPlayer(0, [], rulebook, name="rollout", search="fused")
+    pool = [TILE_KINDS[slot] for slot, count in enumerate(unseen) for _ in range(count)]
+    rack_size = min(7, len(pool))
+    rng = random.Random(seed)
+    totals = [0.0] * len(candidates)
+    counts = [0] * len(candidates)
+    for _ in range(max_rounds):
+        rack = rng.sample(pool, rack_size)
+        for i, move in enumerate(candidates):
+            placed = board.apply_move(move)
+            opponent.tiles = list(rack)
+            reply = opponent.top_moves(board.state, 1, board.analysis)
+            if reply:
+                totals[i] += reply[0][1]
+            board.undo_move(placed)
+            counts[i] += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                return totals, counts
+    return totals, counts
+
+
+def _rollout_task(
+    rows: Sequence[str],
+    candidates: Sequence[Move],
+    unseen: Sequence[int],
+    seed: int,
+    budget: float | None,
+    max_rounds: int,
+) -> tuple[list[float], list[int]]:
+    assert _pool_rulebook is not None
+    return rollout(_pool_rulebook, rows, candidates, unseen, seed, budget, max_rounds)
+
+
+class SimulatingComputerPlayer(ComputerPlayer):
+    """Computer opponent: rank the top candidates by score (or equity) minus the expected reply.
+
+    The static search proposes candidates; for each, opponent racks are sampled from the unseen
+    tiles (bag plus opponents' racks) and the opponent's best reply is averaged. Sampling stops
+    budget seconds after get_move starts (or after rollouts rounds), optionally spread over a
+    process pool. Use the player as a context manager, or call close(), to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        player_id: int,
+        init_tiles: list[str],
+        rulebook: Rulebook,
+        name: str | None = None,
+        generator: MoveGenerator = "trie",
+        rng: random.Random | None = None,
+        leaves: LeaveTable | None = None,
+        endgame: EndgameSolver | None = None,
+        cache: MoveCache | None = None,
+        *,
+        candidates: int = 8,
+        budget: float | None = 1.0,
+        rollouts: int = 200,
+        workers: int = 1,
+    ) -> None:
+        """candidates: plays to simulate; budget: seconds per move (None: run all rollouts rounds)."""
+        super().__init__(player_id, init_tiles, rulebook, name, generator, "full", rng, leaves, endgame, cache)
+        if candidates < 1 or rollouts < 1 or workers < 1:
+            raise ValueError("candidates, rollouts and workers must be at least 1")
+        self.candidates = candidates
+        self.budget = budget
+        self.rollouts = rollouts
+        self.workers = workers
+        self._pool: Pool | None = None
+        self.last_rounds = 0
+
+    def unseen_tiles(self, board_state: BoardState) -> list[int]:
+        """Counts (A-Z, blank) of tiles not on the board or this rack: the bag plus opponents' racks."""
+        unseen = [0] * len(TILE_KINDS)
+        for tile, count in load_tile_counts().items():
+            unseen[tile_index(tile)] = count
+        for y in range(15):
+            for ch in board_state[y]:
+                if ch != " ":
+                    unseen[tile_index("?" if ch.islower() else ch)] -= 1
+        for tile in self.tiles:
+            unseen[tile_index(tile)] -= 1
+        return [max(0, n) for n in unseen]
+
+    def get_move(
+        self,
+        board_state: BoardState,
+        board: object | None = None,
+        *,
+        scores: list[tuple[str, int]] | None = None,
+        turn: int | None = None,
+    ) -> Move:
+        """Best candidate after rollouts (or the endgame solver's move); pass when no play scores."""
+        stats = self.stats = TurnStats() if self.profile else None
+        started = time.perf_counter()
+        try:
+            solved = self.endgame_move(board_state, board)
+            if solved is not None:
+                return solved
+            if isinstance(board, Board) and board.state is board_state:
+                cross_checks = self.rulebook.analyse(board)
+            else:
+                cross_checks = self.rulebook.cross_checks(board_state)
+            ranked = list(self.top_moves(board_state, self.candidates, cross_checks))
+            if not ranked or (self.leaves is None and ranked[0][1] <= 0):
+                return Move((-1, -1), "", "")
+
+            best = ranked[0][0]
+            unseen = self.unseen_tiles(board_state)
+            if len(ranked) > 1 and any(unseen):
+                deadline = None if self.budget is None else started + self.budget
+                replies = self.simulate([m for m, _ in ranked], board_state, unseen, deadline)
+                values = {
+                    i: value - reply for i, ((_, value), reply) in enumerate(zip(ranked, replies)) if reply is not None
+                }
+                best = ranked[max(values, key=lambda i: (values[i], -i))][0]
+
+            self.word_hist.append(best.word)
+            self.score_hist.append(self.rulebook.score_move(best, board_state, cross_checks=cross_checks))
+            return best
+        finally:
+            if stats is not None:
+                stats.total_seconds = time.perf_counter() - started
+
+    def simulate(
+        self,
+        candidates: Sequence[Move],
+        board_state: BoardState,
+        unseen: Sequence[int],
+        deadline: float | None = None,
+    ) -> list[float | None]:
+        """Mean best-reply score against each candidate; None for those time ran out before.
+
+        Sampling stops at deadline (a time.perf_counter() value; default: budget seconds from
+        now); pool workers get the time left when the jobs are sent. Sets last_rounds to the
+        rounds started.
+        """
+        if deadline is None and self.budget is not None:
+            deadline = time.perf_counter() + self.budget
+        rows = [board_state[y] for y in range(15)]
+        seed = (self.rng if self.rng is not None else random.Random()).getrandbits(63)
+        if self.workers == 1:
+            left = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            totals, counts = rollout(self.rulebook, rows, candidates, unseen, seed, left, self.rollouts)
+            rounds = counts[0]
+        else:
+            pool = self._worker_pool()
+            left = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            per_worker = -(-self.rollouts // self.workers)
+            jobs = [(rows, list(candidates), list(unseen), seed + i, left, per_worker) for i in range(self.workers)]
+            totals, counts, rounds = [0.0] * len(candidates), [0] * len(candidates), 0
+            for part, part_counts in pool.starmap(_rollout_task, jobs):
+                totals = [a + b for a, b in zip(totals, part)]
+                counts = [a + b for a, b in zip(counts, part_counts)]
+                rounds += part_counts[0]
+        self.last_rounds = rounds
+        return [total / count if count else None for total, count in zip(totals, counts)]
+
+    def _worker_pool(self) -> Pool:
+        global _pool_rulebook
+        if self._pool is None:
+            fork = "fork" in multiprocessing.get_all_start_methods()
+            words: list[str] | None = None
+            if fork:
+                _pool_rulebook = self.rulebook
+            elif not self.rulebook.packaged_lexicon:
+                words = list(self.rulebook.lexicon.words())
+            ctx = multiprocessing.get_context("fork" if fork else "spawn")
+            self._pool = ctx.Pool(self.workers, initializer=_init_rollout_worker, initargs=(words,))
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the rollout pool, if one was started."""
+        global _pool_rulebook
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            _pool_rulebook = None
+
+    def __enter__(self) -> SimulatingComputerPlayer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
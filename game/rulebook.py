@@ -3,55 +3,29 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
-from functools import lru_cache
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any, cast
 
+from .anagrams import AnagramIndex, build_anagram_index, load_anagram_index
+from .board import Board
+from .cross_checks import NO_CROSS_WORD, CrossChecks
 from .exceptions import InvalidPlacementError
+from .lexicon import Dawg, build_dawg, build_gaddag, load_gaddag, load_lexicon, read_word_list
 from .paths import data_path
 from .types import BoardState, Move
+from .word_set import WordSet, build_word_set, load_word_set
 
+LETTER_MUL = {"l": 2, "L": 3}
+WORD_MUL = {"w": 2, "*": 2, "W": 3}
 
-_TRIE_CHILDREN_KEY = "_C"
-
-
-def _annotate_trie_children(root: dict[str, Any]) -> None:
-    """Cache each trie node's letter children as (index, child) pairs for fast walks."""
-    a_ord = ord("A")
-    stack: list[dict[str, Any]] = [root]
-    while stack:
-        node = stack.pop()
-        if _TRIE_CHILDREN_KEY in node:
-            continue
-        children: list[tuple[int, dict[str, Any]]] = []
-        for letter, child in node.items():
-            if len(letter) == 1 and isinstance(child, dict):
-                children.append((ord(letter) - a_ord, child))
-                stack.append(child)
-        node[_TRIE_CHILDREN_KEY] = tuple(children)
-
-
-def _word_validity_checker(dictionary_root: dict[str, Any]) -> Callable[[str], bool]:
-    """Trie lookup with a small LRU cache."""
-
-    @lru_cache(maxsize=8192)
-    def check(w_upper: str) -> bool:
-        branch: dict[str, Any] = dictionary_root
-        for character in w_upper:
-            if character not in branch:
-                return False
-            branch = cast(dict[str, Any], branch[character])
-        return bool(branch["VALID"])
-
-    return check
+_A_ORD = ord("A")
 
 
 class Rulebook:
-    """Dictionary trie, English definitions, board bonuses, and move scoring."""
+    """Dictionary DAWG, English definitions, board bonuses, and move scoring."""
 
-    def __init__(self) -> None:
-        """Load tile scores, dictionary tree, and English lookup data."""
+    def __init__(self, lexicon: Dawg | None = None, gaddag: Dawg | None = None) -> None:
+        """Load tile scores and the word graph; pass lexicon (and gaddag) to share them between rulebooks."""
         self.board_special_tiles: list[str] = [
             "W  l   W   l  W",
             " w   L   L   w ",
@@ -73,11 +47,67 @@ class Rulebook:
         with open(data_path("tile_scores.json"), encoding="utf-8") as infile:
             self.tile_scores: dict[str, int] = json.loads(infile.read())
 
-        self.dictionary_root: dict[str, Any] = self.generate_dictionary_tree()
-        _annotate_trie_children(self.dictionary_root)
-        self._check_word: Callable[[str], bool] = _word_validity_checker(self.dictionary_root)
-        with open(data_path("english_dictionary.json"), encoding="utf-8") as infile:
-            self.english_dictionary: dict[str, str] = json.loads(infile.read())
+        # Per-square multipliers (y * 15 + x) and per-character points (blanks in lower case),
+        # the tables score_move reads when it has a board's CrossChecks.
+        squares = [ch for row in self.board_special_tiles for ch in row]
+        self.letter_mul: list[int] = [LETTER_MUL.get(ch, 1) for ch in squares]
+        self.word_mul: list[int] = [WORD_MUL.get(ch, 1) for ch in squares]
+        self._points: dict[str, int] = {}
+        for i in range(26):
+            letter = chr(_A_ORD + i)
+            self._points[letter] = self.tile_scores[letter]
+            self._points[letter.lower()] = self.tile_scores["?"]
+
+        self._packaged_lexicon = lexicon is None
+        self.lexicon: Dawg = lexicon if lexicon is not None else load_lexicon()
+        self._gaddag: Dawg | None = gaddag
+        self._word_set: WordSet | None = None
+        self._anagrams: AnagramIndex | None = None
+        self._english_dictionary: dict[str, str] | None = None
+
+    @property
+    def packaged_lexicon(self) -> bool:
+        """True when lexicon is the packaged word list (a fresh Rulebook() loads the same words)."""
+        return self._packaged_lexicon
+
+    @property
+    def gaddag(self) -> Dawg:
+        """GADDAG over the same words as lexicon, loaded on first use (anchor move generation)."""
+        if self._gaddag is None:
+            self._gaddag = load_gaddag() if self._packaged_lexicon else build_gaddag(self.lexicon.words())
+        return self._gaddag
+
+    @property
+    def word_set(self) -> WordSet:
+        """Packed-word membership set over the same words as lexicon, loaded on first use."""
+        if self._word_set is None:
+            if self._packaged_lexicon:
+                self._word_set = load_word_set(self.lexicon)
+            else:
+                self._word_set = build_word_set(self.lexicon.words(), self.lexicon)
+        return self._word_set
+
+    @property
+    def anagrams(self) -> AnagramIndex:
+        """Rack-signature index over lexicon's words of up to seven letters, loaded on first use."""
+        if self._anagrams is None:
+            if self._packaged_lexicon:
+                self._anagrams = load_anagram_index()
+            else:
+                self._anagrams = build_anagram_index(self.lexicon.words())
+        return self._anagrams
+
+    @property
+    def english_dictionary(self) -> dict[str, str]:
+        """Word definitions, loaded on first use; empty when the data file is absent."""
+        if self._english_dictionary is None:
+            path = data_path("english_dictionary.json")
+            if path.is_file():
+                with open(path, encoding="utf-8") as infile:
+                    self._english_dictionary = json.loads(infile.read())
+            else:
+                self._english_dictionary = {}
+        return self._english_dictionary
 
     def calculate_penalty(self, tiles: list[str]) -> int:
         """Sum face values of unplayed tiles (endgame penalty)."""
@@ -94,32 +124,38 @@ class Rulebook:
         return f"{word}: {definition}"
 
     @staticmethod
-    def generate_dictionary_tree(dict_path: str | Path | None = None) -> dict[str, Any]:
-        """Load the packaged trie, or build one from a word list file."""
-        default_txt = data_path("dictionary.txt")
-        path = Path(dict_path) if dict_path is not None else default_txt
-        path = path.resolve()
-
-        if path == default_txt.resolve():
-            with open(data_path("dictionary_tree.json"), encoding="utf-8") as infile:
-                return cast(dict[str, Any], json.load(infile))
-
-        with open(path, encoding="utf-8") as infile:
-            dictionary_lines = [word[:-1] for word in infile]
-        dictionary_tree: dict[str, Any] = {"VALID": False, "WORD": ""}
-        for word in dictionary_lines:
-            active_branch = dictionary_tree
-            for i, character in enumerate(word):
-                if character not in active_branch:
-                    active_branch[character] = {"VALID": False, "WORD": active_branch["WORD"] + character}
-                active_branch = cast(dict[str, Any], active_branch[character])
-                if i == len(word) - 1:
-                    active_branch["VALID"] = True
-
-        return dictionary_tree
-
-    def score_move(self, move: Move, board_state: BoardState, allow_illegal: bool = False) -> int:
-        """Score the main word and cross-words, or return -1 if the placement is illegal."""
+    def build_lexicon(dict_path: str | Path | None = None) -> Dawg:
+        """Load the packaged lexicon, or build a fresh one from a word list file."""
+        if dict_path is None:
+            return load_lexicon()
+        return build_dawg(read_word_list(dict_path))
+
+    def cross_checks(self, board_state: BoardState) -> CrossChecks:
+        """Cross-check masks and cross-word partial scores for board_state."""
+        return CrossChecks(self.lexicon, self.tile_scores, board_state)
+
+    def analyse(self, board: Board) -> CrossChecks:
+        """The board's cached CrossChecks, attached on first use and kept current by play_move."""
+        if board.analysis is None or board.analysis.lexicon is not self.lexicon:
+            board.analysis = self.cross_checks(board.state)
+        return board.analysis
+
+    def score_move(
+        self,
+        move: Move,
+        board_state: BoardState,
+        allow_illegal: bool = False,
+        cross_checks: CrossChecks | None = None,
+    ) -> int:
+        """Score the main word and cross-words, or return -1 if the placement is illegal.
+
+        With cross_checks for this board, the play is scored in one pass over table lookups:
+        each cross-word is a mask test and its precomputed partial sum, and no cross-word string
+        is rebuilt. The tables live on the CrossChecks, so a Board's analysis carries them from
+        candidate to candidate and Board.play_move refreshes only the lines a move touches.
+        """
+        if cross_checks is not None:
+            return self._score_from_checks(move, board_state, allow_illegal, cross_checks)
 
         def neighbor_x(y: int, x: int) -> bool:
             """True if (y, x) has a horizontal neighbor letter on the board."""
@@ -191,6 +227,60 @@ class Rulebook:
             return -1
         return total_score
 
+    def _score_from_checks(
+        self, move: Move, board_state: BoardState, allow_illegal: bool, cross_checks: CrossChecks
+    ) -> int:
+        """score_move for a board described by cross_checks (same result, same errors)."""
+        word = move.word
+        if not allow_illegal and not self.word_is_valid(word):
+            return -1
+        y, x = move.coords
+        is_d = move.dir == "D"
+        step = 15 if is_d else 1
+        row = board_state[y]
+        masks, partials = cross_checks.mask[move.dir], cross_checks.cross_score[move.dir]
+        letter_mul, word_mul, points = self.letter_mul, self.word_mul, self._points
+
+        main_sum = cross_sum = used = 0
+        mul = 1
+        touches, legal = False, True
+        sq = y * 15 + x
+        for i, tile in enumerate(word):
+            cell = board_state[y + i][x] if is_d else row[x + i]
+            if cell != " ":
+                if cell != tile and not (cell.islower() and tile.islower()):
+                    raise InvalidPlacementError(
+                        word=word, true_tile=cell, attempted_tile="?" if tile.islower() else tile
+                    )
+                main_sum += points[tile]
+                touches = touches or sq == 112 or self._has_cross_neighbor(board_state, sq, step)
+            else:
+                used += 1
+                letters = points[tile] * letter_mul[sq]
+                main_sum += letters
+                mul *= word_mul[sq]
+                partial = partials[sq]
+                if partial != NO_CROSS_WORD:
+                    touches = True
+                    if not (masks[sq] >> (ord(tile.upper()) - _A_ORD)) & 1:
+                        legal = False
+                    cross_sum += (partial + letters) * word_mul[sq]
+                elif sq == 112:
+                    touches = True
+            sq += step
+
+        if not allow_illegal and not (legal and touches):
+            return -1
+        return main_sum * mul + cross_sum + (50 if used == 7 else 0)
+
+    @staticmethod
+    def _has_cross_neighbor(board_state: BoardState, sq: int, step: int) -> bool:
+        """True if square sq has a tile beside it across the main word's direction (step 1 or 15)."""
+        y, x = divmod(sq, 15)
+        if step == 15:
+            return (x > 0 and board_state[y][x - 1] != " ") or (x < 14 and board_state[y][x + 1] != " ")
+        return (y > 0 and board_state[y - 1][x] != " ") or (y < 14 and board_state[y + 1][x] != " ")
+
     def score_word(self, y: int, x: int, direction: str, word: str, board_state: BoardState) -> int:
         """Score a single word segment with letter/word multipliers and the seven-tile bonus."""
         score = 0
@@ -238,5 +328,9 @@ class Rulebook:
         return score
 
     def word_is_valid(self, word: str) -> bool:
-        """True if word is in the game dictionary."""
-        return self._check_word(word.upper())
+        """True if word is in the game dictionary (any case)."""
+        return word in self.word_set
+
+    def words_are_valid(self, words: Iterable[str]) -> list[bool]:
+        """word_is_valid for each of words, in order; word_set.stats counts the lookups."""
+        return self.word_set.contains_all(words)
@@ -0,0 +1,221 @@
+"""Headless self-play: computer-only games with no rendering, one result record per game."""
+
+from __future__ import annotations
+
+import gc
+import json
+import multiprocessing
+import os
+import random
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from multiprocessing.util import Finalize
+from typing import IO, Any
+
+from .game_log import GameLogWriter, shard_path
+from .game_master import GameMaster
+from .leaves import load_leaves
+from .move_cache import MoveCache
+from .players.computer import MoveGenerator, ScoringMode, SearchMode
+from .rulebook import Rulebook
+
+
+@dataclass
+class GameResult:
+    """Outcome of one simulated game; turns holds one dict per TurnRecord."""
+
+    game: int
+    seed: int
+    players: list[str]
+    scores: list[int]
+    winners: list[str]
+    seconds: float
+    turns: list[dict[str, Any]] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        """One-line JSON record."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+
+def game_seed(base_seed: int, game: int) -> int:
+    """Seed for game number game of a run started with base_seed (stable across runs)."""
+    return random.Random(f"{base_seed}:{game}").getrandbits(63)
+
+
+def play_one(gm: GameMaster, game: int, seed: int) -> GameResult:
+    """Play one headless game on gm from seed and summarise it (the same seed replays it exactly)."""
+    started = time.perf_counter()
+    gm.play_game(headless=True, seed=seed, game=game)
+    seconds = time.perf_counter() - started
+
+    names = [player.name for player in gm.players]
+    best = max(gm.player_scores)
+    turns = [
+        {
+            "turn": rec.turn,
+            "player": rec.player,
+            "coords": list(rec.move.coords),
+            "dir": rec.move.dir,
+            "word": rec.move.word,
+            "score": rec.score,
+            "seconds": round(rec.seconds, 6),
+            "rack": rec.rack,
+            "leave": rec.leave,
+            "bag": rec.bag,
+            "position": f"{rec.position:016x}",
+            **({"stats": rec.stats.to_dict()} if rec.stats is not None else {}),
+        }
+        for rec in gm.turn_log
+    ]
+    return GameResult(
+        game=game,
+        seed=seed,
+        players=names,
+        scores=list(gm.player_scores),
+        winners=[name for name, score in zip(names, gm.player_scores) if score == best],
+        seconds=round(seconds, 6),
+        turns=turns,
+    )
+
+
+@dataclass(frozen=True)
+class ComputerSettings:
+    """How the computer players in simulated games search and rank plays.
+
+    leaves is a leave-table path for equity play ("" for DATA_ROOT/leaves.bin; None plays for
+    score); cache_size > 0 gives each process a move cache of that many entries; profile adds
+    each computer turn's TurnStats to the records.
+    """
+
+    generator: MoveGenerator = "trie"
+    search: SearchMode = "full"
+    scoring: ScoringMode = "loop"
+    leaves: str | None = None
+    endgame: bool = False
+    cache_size: int = 0
+    profile: bool = False
+
+    def game_master(self, players: int, rulebook: Rulebook | None = None) -> GameMaster:
+        """A GameMaster for players computer players configured by these settings."""
+        return GameMaster(
+            computer_count=players,
+            rulebook=rulebook,
+            generator=self.generator,
+            search=self.search,
+            scoring=self.scoring,
+            leaves=load_leaves(self.leaves or None) if self.leaves is not None else None,
+            endgame=self.endgame,
+            move_cache=MoveCache(self.cache_size) if self.cache_size > 0 else None,
+            profile=self.profile,
+        )
+
+
+def replay_game(
+    seed: int,
+    players: int = 2,
+    *,
+    game: int = 0,
+    rulebook: Rulebook | None = None,
+    settings: ComputerSettings = ComputerSettings(),
+) -> GameResult:
+    """Replay the game a record with this seed describes (same players and settings)."""
+    return play_one(settings.game_master(players, rulebook), game, seed)
+
+
+# Worker state: the parent sets _shared_rulebook before forking so children inherit the loaded
+# lexicon; each worker builds its GameMaster once in _init_worker.
+_shared_rulebook: Rulebook | None = None
+_worker_gm: GameMaster | None = None
+_worker_seed = 0
+
+
+def _init_worker(players: int, seed: int, settings: ComputerSettings, game_log: str | None) -> None:
+    global _worker_gm, _worker_seed
+    _worker_gm = settings.game_master(players, _shared_rulebook)
+    _worker_seed = seed
+    if game_log is not None:
+        # Each worker appends to its own shard, closed when the pool shuts the worker down.
+        writer = GameLogWriter(shard_path(game_log, os.getpid()))
+        Finalize(writer, writer.close, exitpriority=10)
+        _worker_gm.game_log = writer
+
+
+def _play_in_worker(game: int) -> GameResult:
+    assert _worker_gm is not None
+    return play_one(_worker_gm, game, game_seed(_worker_seed, game))
+
+
+def run_games(
+    games: int,
+    players: int = 2,
+    seed: int = 0,
+    *,
+    workers: int = 1,
+    rulebook: Rulebook | None = None,
+    settings: ComputerSettings = ComputerSettings(),
+    game_master: GameMaster | None = None,
+    game_log: str | None = None,
+) -> Iterator[GameResult]:
+    """Play games computer-only games, yielding each result as it finishes.
+
+    With workers > 1 games run in a process pool and arrive in completion order; game i always
+    uses game_seed(seed, i), so results match a single-process run game for game. Where fork is
+    available the rulebook is loaded once here and inherited by every worker. A single-process
+    run plays on game_master when one is given (e.g. to read its move cache counters afterwards).
+    game_log appends every turn to that game log (game_log.GameLogWriter) as it is played; in a
+    pool each worker writes its own shard_path(game_log, pid).
+    """
+    if workers <= 1 or games <= 1:
+        gm = game_master if game_master is not None else settings.game_master(players, rulebook)
+        writer = GameLogWriter(game_log) if game_log is not None else None
+        gm.game_log = writer
+        try:
+            for game in range(games):
+                yield play_one(gm, game, game_seed(seed, game))
+        finally:
+            if writer is not None:
+                gm.game_log = None
+                writer.close()
+        return
+
+    global _shared_rulebook
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    if fork:
+        _shared_rulebook = rulebook if rulebook is not None else Rulebook()
+        if settings.generator == "gaddag":
+            _ = _shared_rulebook.gaddag  # load it before forking so workers share its pages
+        if settings.leaves is not None:
+            load_leaves(settings.leaves or None)
+        # Keep the loaded tables out of the collector's reach so children don't copy their pages.
+        gc.freeze()
+    ctx = multiprocessing.get_context("fork" if fork else "spawn")
+    try:
+        with ctx.Pool(
+            min(workers, games),
+            initializer=_init_worker,
+            initargs=(players, seed, settings, game_log),
+        ) as pool:
+            yield from pool.imap_unordered(_play_in_worker, range(games))
+            # Let workers exit normally (closing their game logs) rather than be terminated.
+            pool.close()
+            pool.join()
+    finally:
+        if fork:
+            gc.unfreeze()
+            _shared_rulebook = None
+
+
+def default_workers() -> int:
+    """Cores available to this process."""
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+
+def write_results(results: Iterable[GameResult], out: IO[str]) -> int:
+    """Write results as JSON lines (flushing each); return how many were written."""
+    count = 0
+    for result in results:
+        out.write(result.to_json() + "\n")
+        out.flush()
+        count += 1
+    return count
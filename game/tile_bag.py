@@ -5,42 +5,104 @@ from __future__ import annotations
 import json
 import random
 import sys
-from collections import Counter
+from functools import lru_cache
 
 from .paths import data_path
 
+TILE_KINDS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ?"
+_INDEX = {tile: i for i, tile in enumerate(TILE_KINDS)}
+
+
+def tile_index(tile: str) -> int:
+    """Slot of tile in a 27-entry count vector (A-Z, then the blank "?")."""
+    return _INDEX[tile]
+
+
+@lru_cache(maxsize=None)
+def _read_tile_counts() -> tuple[tuple[str, int], ...]:
+    with open(data_path("tile_counts.json"), encoding="utf-8") as infile:
+        counts: dict[str, int] = json.load(infile)
+    return tuple(counts.items())
+
+
+def load_tile_counts() -> dict[str, int]:
+    """Full tile distribution from tile_counts.json (a fresh dict; the file is read once)."""
+    return dict(_read_tile_counts())
+
 
 class TileBag:
-    """Shuffled pool of letter tiles drawn by players."""
+    """Pool of letter tiles drawn by players, kept as 27 counts (A-Z, blank) plus a total.
 
-    def __init__(self) -> None:
-        """Load letter counts from tile_counts.json."""
-        with open(data_path("tile_counts.json"), encoding="utf-8") as infile:
-            self.tile_counts: dict[str, int] = json.load(infile)
+    Draws pick uniformly among the remaining tiles, so no list is shuffled or sliced; per-letter
+    counts, the total, and snapshot/restore are constant-time.
+    """
 
-        self.bag: list[str] = []
+    def __init__(self, rng: random.Random | None = None) -> None:
+        """Load letter counts from tile_counts.json; draws use rng (a fresh unseeded one by default)."""
+        self.rng = rng if rng is not None else random.Random()
+        self.tile_counts = load_tile_counts()
+
+        self.counts = [0] * len(TILE_KINDS)
         for letter, count in self.tile_counts.items():
-            self.bag += [letter for _ in range(count)]
+            self.counts[_INDEX[letter]] = count
+        self.total = sum(self.counts)
+
+    @property
+    def bag(self) -> list[str]:
+        """Remaining tiles as a list (A-Z, then blanks); built on demand."""
+        return [tile for tile, count in zip(TILE_KINDS, self.counts) for _ in range(count)]
+
+    def __len__(self) -> int:
+        """Tiles left."""
+        return self.total
+
+    def count(self, tile: str) -> int:
+        """How many of tile ("A"-"Z" or "?") are left."""
+        return self.counts[_INDEX[tile]]
 
     def __str__(self) -> str:
         """Return a comma-separated count listing (blank tile shown last)."""
-        pairs = sorted(Counter(self.bag).items(), key=lambda x: x[0])
-        pairs = pairs[1:] + pairs[:1]
-        return ", ".join([letter + ": " + str(count) for letter, count in pairs])
+        return ", ".join(
+            tile + ": " + str(count) for tile, count in zip(TILE_KINDS, self.counts) if count
+        )
 
     def grab(self, num_tiles: int) -> list[str]:
-        """Shuffle the bag, then take up to num_tiles from the front."""
-        random.shuffle(self.bag)
-        new_tiles, self.bag = self.bag[:num_tiles], self.bag[num_tiles:]
+        """Draw up to num_tiles tiles at random."""
+        counts, randrange = self.counts, self.rng.randrange
+        new_tiles: list[str] = []
+        for _ in range(min(num_tiles, self.total)):
+            pick = randrange(self.total)
+            slot = 0
+            while pick >= counts[slot]:
+                pick -= counts[slot]
+                slot += 1
+            counts[slot] -= 1
+            self.total -= 1
+            new_tiles.append(TILE_KINDS[slot])
         return new_tiles
 
+    def put_back(self, tiles: list[str]) -> None:
+        """Return tiles to the bag."""
+        for tile in tiles:
+            self.counts[_INDEX[tile]] += 1
+        self.total += len(tiles)
+
     def switch(self, discarded_tiles: list[str]) -> list[str]:
         """Swap discarded tiles for new draws if the bag has enough left; else return them unchanged."""
-        if len(self.bag) <= 7:
+        if self.total <= 7:
             sys.stderr.write("ERROR: Tiles can only be exchanged when there are more than 7 tiles in the bag.")
             return discarded_tiles
 
         new_tiles = self.grab(len(discarded_tiles))
-        self.bag += discarded_tiles
+        self.put_back(discarded_tiles)
 
         return new_tiles
+
+    def snapshot(self) -> tuple[int, ...]:
+        """Current counts, for restore."""
+        return tuple(self.counts)
+
+    def restore(self, snapshot: tuple[int, ...]) -> None:
+        """Reset the bag to a snapshot taken earlier."""
+        self.counts = list(snapshot)
+        self.total = sum(snapshot)
@@ -0,0 +1,66 @@
+"""Per-turn search counters and phase timings for profiling computer moves."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, fields
+from typing import Any, ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+@dataclass
+class TurnStats:
+    """What one computer turn's search did, and where its time went.
+
+    anchors: start squares (trie) or anchor squares per direction (GADDAG) considered;
+    nodes: lexicon nodes expanded by the trie, GADDAG or fused walk (0 for anagram openings);
+    candidates: legal plays generated (or kept, for the fused search);
+    rejected: candidates Rulebook.score_move turned down as illegal;
+    locate/search/score_seconds: time finding start squares, walking the lexicon and scoring
+    (the fused search reports its combined walk-and-score time as search); total_seconds: the
+    whole get_move call. cached is True when the candidates came from the move cache and
+    endgame when the endgame solver chose the move (the counters then stay zero).
+    """
+
+    anchors: int = 0
+    nodes: int = 0
+    candidates: int = 0
+    rejected: int = 0
+    locate_seconds: float = 0.0
+    search_seconds: float = 0.0
+    score_seconds: float = 0.0
+    total_seconds: float = 0.0
+    cached: bool = False
+    endgame: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready copy (times rounded to microseconds)."""
+        return {
+            name: round(value, 6) if isinstance(value, float) else value for name, value in asdict(self).items()
+        }
+
+    @classmethod
+    def total(cls, turns: Iterable[TurnStats]) -> TurnStats:
+        """Counters and times summed over turns (cached and endgame: any turn)."""
+        result = cls()
+        for stats in turns:
+            for f in fields(cls):
+                current, value = getattr(result, f.name), getattr(stats, f.name)
+                setattr(result, f.name, (current or value) if isinstance(value, bool) else current + value)
+        return result
+
+
+def count_nodes(expand: Callable[_P, _R], stats: TurnStats) -> Callable[_P, _R]:
+    """expand, adding one to stats.nodes per call.
+
+    Searches rebind their per-node function (a recursive step, or the stack pop) to this only
+    while profiling, so the walk itself carries no counter when stats are off.
+    """
+
+    def counted(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        stats.nodes += 1
+        return expand(*args, **kwargs)
+
+    return counted
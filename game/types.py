@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Literal, NamedTuple
 
 
@@ -13,5 +14,5 @@ class Move(NamedTuple):
     word: str
 
 
-BoardState = list[str]  # Fifteen strings of fifteen characters (rows).
+BoardState = Sequence[str]  # Fifteen rows of fifteen characters (a list[str] or a CompactBoard).
 Direction = Literal["R", "D"]
@@ -14,13 +14,13 @@ from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
 
+from ..types import Move
 from .console import console
 from .highlight import Highlight
 from .panels import legend
 
 if TYPE_CHECKING:
     from ..board import Board
-    from ..types import Move
 
 
 class _NamedPlayer(Protocol):
@@ -118,7 +118,7 @@ class GamePresenter:
         score_duration: float = 0.55,
         hold_after: float = 0.35,
     ) -> None:
-        """Animate tiles landing and a score tick; mutates board.state and scores in place."""
+        """Animate tiles landing and a score tick; plays the move on board and updates scores in place."""
         before = scores[player_idx]
         after = before + gained
 
@@ -150,8 +150,7 @@ class GamePresenter:
                 for i, c in enumerate(move.word):
                     cy, cx = (y + i, x) if is_d else (y, x + i)
                     if board.state[cy][cx] == " ":
-                        row = board.state[cy]
-                        board.state[cy] = row[:cx] + c + row[cx + 1 :]
+                        board.play_move(Move((cy, cx), move.dir, c))
                         live.update(frame(running_scores, None), refresh=True)
                         time.sleep(tile_delay)
 
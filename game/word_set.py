@@ -0,0 +1,173 @@
+"""Word membership as a sorted array of words packed into 64-bit integers."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from .lexicon import Dawg, _source_crc, read_word_list
+from .paths import data_path
+
+COMPILED_WORDS_NAME = "lexicon.words"
+MAX_PACKED_LENGTH = 12  # 5 bits per letter in a 64-bit key
+
+# Letters (either case) map to base-32 digits 1-26, so int(word.encode().translate(_DIGITS), 32)
+# packs a word in a few C calls; any other byte maps to "!" and makes int() fail.
+_DIGITS = bytearray(b"!" * 256)
+for _i in range(26):
+    _DIGITS[ord("A") + _i] = _DIGITS[ord("a") + _i] = b"123456789abcdefghijklmnopq"[_i]
+
+# Compiled file: header, then the sorted keys (u64 × count) in native byte order.
+_MAGIC = b"SQWORDS\x01"
+_HEADER = struct.Struct("<8s4sII")  # magic, byte order, keys, source crc32
+_BYTE_ORDER = b"LE\x00\x00" if sys.byteorder == "little" else b"BE\x00\x00"
+
+
+def pack_word(word: str) -> int:
+    """64-bit key of a word of at most MAX_PACKED_LENGTH letters (case-insensitive); -1 if
+    it has another character or is too long."""
+    if len(word) > MAX_PACKED_LENGTH or not word:
+        return -1
+    try:
+        return int(word.encode().translate(_DIGITS), 32)
+    except ValueError:
+        return -1
+
+
+@dataclass
+class WordSetStats:
+    """Lookups since the set was loaded (or reset): how many were words, and how many went
+    to the DAWG because they were too long to pack."""
+
+    lookups: int = 0
+    found: int = 0
+    fallback: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were words."""
+        return self.found / self.lookups if self.lookups else 0.0
+
+
+class WordSet:
+    """Case-insensitive word membership over packed words.
+
+    Words of up to MAX_PACKED_LENGTH letters are packed into an integer and binary-searched in
+    keys (sorted u64: an array, or the compiled file memory-mapped and shared through the page
+    cache), so a lookup costs one translate, one int() and about 18 probes, and opening the set
+    copies nothing. Longer words (rare in play) fall back to the lexicon DAWG.
+    """
+
+    __slots__ = ("keys", "lexicon", "stats")
+
+    def __init__(self, keys: Sequence[int], lexicon: Dawg) -> None:
+        """keys: sorted packed words; lexicon: the same words as a DAWG, for longer ones."""
+        self.keys = keys
+        self.lexicon = lexicon
+        self.stats = WordSetStats()
+
+    def __len__(self) -> int:
+        """Packed words held (words longer than MAX_PACKED_LENGTH are not counted)."""
+        return len(self.keys)
+
+    def _lookup(self, word: str) -> bool:
+        if len(word) > MAX_PACKED_LENGTH:
+            self.stats.fallback += 1
+            return word in self.lexicon
+        key = pack_word(word)
+        keys = self.keys
+        i = bisect_left(keys, key)
+        return i < len(keys) and keys[i] == key
+
+    def __contains__(self, word: object) -> bool:
+        """True if word (a str) is in the set."""
+        if not isinstance(word, str):
+            return False
+        found = self._lookup(word)
+        self.stats.lookups += 1
+        self.stats.found += found
+        return found
+
+    def contains_all(self, words: Iterable[str]) -> list[bool]:
+        """Membership of each word, in order (counted once for the whole batch)."""
+        lookup = self._lookup
+        result = [lookup(word) for word in words]
+        self.stats.lookups += len(result)
+        self.stats.found += sum(result)
+        return result
+
+
+def pack_words(words: Iterable[str]) -> array[int]:
+    """Sorted, distinct keys of the packable words."""
+    return array("Q", sorted({key for key in map(pack_word, words) if key >= 0}))
+
+
+def build_word_set(words: Iterable[str], lexicon: Dawg) -> WordSet:
+    """WordSet over words (lexicon must hold the same words)."""
+    return WordSet(pack_words(words), lexicon)
+
+
+def write_word_set(keys: Sequence[int], path: str | Path, source_crc: int = 0) -> None:
+    """Serialize packed keys (written atomically)."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as outfile:
+        outfile.write(_HEADER.pack(_MAGIC, _BYTE_ORDER, len(keys), source_crc))
+        outfile.write(array("Q", keys).tobytes())
+    os.replace(tmp, path)
+
+
+def open_word_set(path: str | Path, lexicon: Dawg, expected_crc: int | None = None) -> WordSet | None:
+    """Memory-map compiled keys zero-copy; None if missing, foreign, or stale."""
+    try:
+        with open(path, "rb") as infile:
+            buf = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(buf) < _HEADER.size:
+        return None
+    magic, byte_order, count, crc = _HEADER.unpack_from(buf)
+    if magic != _MAGIC or byte_order != _BYTE_ORDER:
+        return None
+    if expected_crc is not None and crc != expected_crc:
+        return None
+    if len(buf) != _HEADER.size + 8 * count:
+        return None
+    return WordSet(memoryview(buf)[_HEADER.size :].cast("Q"), lexicon)
+
+
+def compile_word_set(dict_path: str | Path | None = None, out_path: str | Path | None = None) -> Path:
+    """Write the packed key file for a word list (default: beside the packaged lexicon)."""
+    source = Path(dict_path) if dict_path is not None else data_path("dictionary.txt")
+    target = Path(out_path) if out_path is not None else source.with_name(COMPILED_WORDS_NAME)
+    write_word_set(pack_words(read_word_list(source)), target, _source_crc(source))
+    return target
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: Path, lexicon: Dawg) -> WordSet:
+    compiled = path.with_name(COMPILED_WORDS_NAME)
+    if path.is_file():
+        word_set = open_word_set(compiled, lexicon, expected_crc=_source_crc(path)) if compiled.is_file() else None
+        return word_set if word_set is not None else build_word_set(read_word_list(path), lexicon)
+    word_set = open_word_set(compiled, lexicon)
+    return word_set if word_set is not None else build_word_set(lexicon.words(), lexicon)
+
+
+def load_word_set(lexicon: Dawg, dict_path: str | Path | None = None) -> WordSet:
+    """WordSet for a word list (default: data_path("dictionary.txt")) whose DAWG is lexicon.
+
+    A compiled lexicon.words beside the word list is memory-mapped when it was built from the
+    current word list; otherwise keys are packed in memory (run `squabble compile-lexicon`).
+    Loaded once per process.
+    """
+    path = Path(dict_path) if dict_path is not None else data_path("dictionary.txt")
+    return _load_cached(path.resolve(), lexicon)
@@ -0,0 +1,75 @@
+"""64-bit Zobrist keys for board squares, rack multisets, side to move, and a pending pass."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable
+
+from .tile_bag import TILE_KINDS, tile_index
+from .types import BoardState
+
+MAX_SEATS = 4
+_MAX_COPIES = 16  # more than any tile's count in the bag
+
+_rng = random.Random(0x5A0B_B1E5)
+
+# SQUARE_KEYS[sq][code]: code 0-25 is a letter tile, 26-51 a blank showing that letter.
+SQUARE_KEYS = [[_rng.getrandbits(64) for _ in range(52)] for _ in range(225)]
+# RACK_KEYS[slot][k] is xor-ed in for the (k + 1)-th copy of tile slot on a rack.
+RACK_KEYS = [[_rng.getrandbits(64) for _ in range(_MAX_COPIES)] for _ in TILE_KINDS]
+# A rack key is multiplied by its seat's odd constant (a bijection), so equal racks on
+# different seats get different keys while each player still updates one seat-free key.
+_SEAT_MULTIPLIERS = [1] + [_rng.getrandbits(64) | 1 for _ in range(MAX_SEATS - 1)]
+SIDE_KEYS = [_rng.getrandbits(64) for _ in range(MAX_SEATS)]
+PASS_KEY = _rng.getrandbits(64)
+
+_MASK = (1 << 64) - 1
+
+_A_ORD = ord("A")
+
+
+def square_key(sq: int, ch: str) -> int:
+    """Key for tile ch (lower case = blank) on square sq (y * 15 + x)."""
+    code = ord(ch) - _A_ORD if ch.isupper() else 26 + ord(ch) - ord("a")
+    return SQUARE_KEYS[sq][code]
+
+
+def board_key(board_state: BoardState) -> int:
+    """Key of every tile on the board."""
+    key = 0
+    for y in range(15):
+        row = board_state[y]
+        for x in range(15):
+            if row[x] != " ":
+                key ^= square_key(y * 15 + x, row[x])
+    return key
+
+
+def rack_tile_key(tile: str, copies_before: int) -> int:
+    """Key to xor into a seat-free rack key when the rack goes from copies_before to
+    copies_before + 1 of tile (or back)."""
+    return RACK_KEYS[tile_index(tile)][copies_before]
+
+
+def seat_key(key: int, seat: int) -> int:
+    """A seat-free rack key as seen from seat (seat 0 leaves it unchanged)."""
+    return (key * _SEAT_MULTIPLIERS[seat]) & _MASK
+
+
+def rack_key(tiles: Iterable[str], seat: int = 0) -> int:
+    """Key of a rack multiset on seat (tile order does not matter)."""
+    seen = [0] * len(TILE_KINDS)
+    key = 0
+    for tile in tiles:
+        slot = tile_index(tile)
+        key ^= RACK_KEYS[slot][seen[slot]]
+        seen[slot] += 1
+    return seat_key(key, seat)
+
+
+def position_key(board_state: BoardState, racks: Iterable[Iterable[str]], to_move: int) -> int:
+    """Key of a whole position: board, each seat's rack, and whose turn it is."""
+    key = board_key(board_state) ^ SIDE_KEYS[to_move]
+    for seat, rack in enumerate(racks):
+        key ^= rack_key(rack, seat)
+    return key
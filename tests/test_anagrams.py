@@ -0,0 +1,84 @@
+"""Anagram index tests."""
+
+from __future__ import annotations
+
+import tempfile
+from collections import Counter
+from pathlib import Path
+from unittest import TestCase
+
+from game.anagrams import build_anagram_index, compile_anagram_index, open_anagram_index, signature
+from game.board import Board
+from game.lexicon import build_dawg, read_word_list
+from game.paths import data_path
+from game.players.computer import ComputerPlayer
+from game.rulebook import Rulebook
+from game.types import Move
+
+WORDS = ["AA", "AT", "TA", "CAT", "ACT", "CATS", "SCAT", "CASTS", "QUIZ", "ABCDEFGH"]
+
+
+class TestAnagramIndex(TestCase):
+    def test_lookup(self) -> None:
+        index = build_anagram_index(WORDS)
+        self.assertEqual(len(index), 9)
+        self.assertEqual(signature("cats"), "ACST")
+        self.assertEqual(index.anagrams("TCA"), ["ACT", "CAT"])
+        self.assertEqual(index.anagrams("stac"), ["CATS", "SCAT"])
+        self.assertEqual(index.anagrams("ABCDEFGH"), [])
+        self.assertEqual(index.anagrams("DOG"), [])
+
+    def test_playable_with_blanks(self) -> None:
+        index = build_anagram_index(WORDS)
+        self.assertEqual(index.playable("CATX"), ["ACT", "AT", "CAT", "TA"])
+        self.assertEqual(index.playable("CA?"), ["AA", "ACT", "AT", "CAT", "TA"])
+        self.assertEqual(index.playable("Q??Z"), ["AA", "AT", "QUIZ", "TA"])
+        self.assertEqual(index.playable("A"), [])
+
+    def test_playable_matches_brute_force(self) -> None:
+        words = [word for word in read_word_list(data_path("dictionary.txt")) if 2 <= len(word) <= 7]
+        index = build_anagram_index(words)
+        for rack in ("AERST??", "QZXJK??", "EIRST?", "AEINRST", "??", "QI"):
+            have = Counter(rack)
+            expected = sorted(
+                {
+                    word.upper()
+                    for word in words
+                    if len(word) <= len(rack)
+                    and sum(max(0, n - have[ch]) for ch, n in Counter(word.upper()).items()) <= have["?"]
+                }
+            )
+            self.assertEqual(index.playable(rack), expected, rack)
+
+    def test_compiled_file_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "words.txt"
+            source.write_text("\n".join(WORDS) + "\n", encoding="utf-8")
+            target = compile_anagram_index(source, Path(tmp) / "words.anagrams")
+            mapped = open_anagram_index(target, expected_crc=None)
+            assert mapped is not None
+            self.assertEqual(list(mapped.keys), list(build_anagram_index(WORDS).keys))
+            self.assertEqual(mapped.playable("STAC"), ["ACT", "AT", "CAT", "CATS", "SCAT", "TA"])
+            self.assertIsNone(open_anagram_index(target, expected_crc=1))
+            self.assertIsNone(open_anagram_index(Path(tmp) / "missing"))
+
+    def test_opening_moves_match_trie_search(self) -> None:
+        rulebook = Rulebook(lexicon=build_dawg(WORDS))
+        player = ComputerPlayer(player_id=1, rulebook=rulebook, init_tiles=list("CAST?XZ"), name="test")
+        board = Board().state
+        cross_checks = rulebook.cross_checks(board)
+        locations = player.get_valid_locations(board, cross_checks)
+        expected = [
+            Move(vl.coords, vl.dir, word)
+            for vl in locations
+            for word in player.find_words(
+                fixed_tiles=tuple(vl.fixed),
+                min_length=max(2, vl.min_len),
+                max_length=vl.max_len,
+                cross_masks=cross_checks.line_masks(vl.coords, vl.dir, vl.max_len),
+            )
+        ]
+        self.assertTrue(expected)
+        self.assertEqual(player.opening_moves(locations), expected)
+        self.assertEqual(player.generate_moves(board), expected)
+        self.assertIn("CASTS", player.playable_words())
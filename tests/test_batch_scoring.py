@@ -0,0 +1,61 @@
+"""Batch scoring tests."""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+from typing import ClassVar
+from unittest import TestCase, skipUnless
+
+from game.board import Board
+from game.players import ComputerPlayer
+from game.rulebook import Rulebook
+from game.tile_bag import TileBag
+from game.types import Move
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+@skipUnless(HAS_NUMPY, "NumPy is not installed")
+class TestBatchScoring(TestCase):
+    rulebook: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+
+    def test_matches_score_move_over_a_game(self) -> None:
+        from game.batch_scoring import BatchScorer, encode_moves
+
+        scorer = BatchScorer(self.rulebook)
+        board = Board()
+        bag = TileBag(random.Random(11))
+        player = ComputerPlayer(1, bag.grab(6) + ["?"], self.rulebook, name="c")
+        for _ in range(8):
+            cross_checks = self.rulebook.analyse(board)
+            moves = player.generate_moves(board.state, cross_checks)
+            expected = [self.rulebook.score_move(m, board.state, cross_checks=cross_checks) for m in moves]
+            got = scorer.scores(encode_moves(moves), board.state, cross_checks).tolist()
+            self.assertEqual(got, expected)
+            if not moves:
+                break
+            board.play_move(moves[expected.index(max(expected))])
+            player.tiles = bag.grab(7)
+
+    def test_empty_batch(self) -> None:
+        from game.batch_scoring import BatchScorer, encode_moves
+
+        board = Board()
+        scores = BatchScorer(self.rulebook).scores(encode_moves([]), board.state, self.rulebook.analyse(board))
+        self.assertEqual(len(scores), 0)
+
+    def test_player_ranking_unchanged(self) -> None:
+        board = Board()
+        board.play_move(Move((7, 4), "R", "ZEBRA"))
+        loop = ComputerPlayer(1, list("QUIETER"), self.rulebook, name="a")
+        batch = ComputerPlayer(1, list("QUIETER"), self.rulebook, name="b", scoring="batch")
+        cross_checks = self.rulebook.analyse(board)
+        self.assertEqual(
+            list(batch.top_moves(board.state, 20, cross_checks)),
+            list(loop.top_moves(board.state, 20, cross_checks)),
+        )
@@ -0,0 +1,45 @@
+"""Benchmark suite tests."""
+
+from __future__ import annotations
+
+import json
+from typing import ClassVar
+from unittest import TestCase
+
+from game.bench import BENCHMARKS, load_corpus, report, run_benchmarks
+from game.rulebook import Rulebook
+
+
+class TestBench(TestCase):
+    rulebook: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+
+    def test_corpus_positions_are_mid_game(self) -> None:
+        positions = load_corpus()
+        self.assertGreater(len(positions), 0)
+        for position in positions:
+            self.assertEqual(len(position.rows), 15)
+            self.assertTrue(all(len(row) == 15 for row in position.rows))
+            self.assertTrue(any(ch != " " for row in position.rows for ch in row))
+            self.assertTrue(1 <= len(position.rack) <= 7)
+
+    def test_report_is_json_with_counts(self) -> None:
+        positions = load_corpus()[:2]
+        names = [name for name in BENCHMARKS if name != "full_game"]
+        results = run_benchmarks(positions, rulebook=self.rulebook, rounds=1, only=names)
+        self.assertEqual([r.name for r in results], names)
+        by_name = {r.name: r for r in results}
+        self.assertEqual(by_name["find_words"].ops, 2)
+        self.assertGreater(by_name["find_words"].nodes or 0, 0)
+        self.assertEqual(by_name["get_move"].nodes, by_name["find_words"].nodes)
+        self.assertIsNone(by_name["score_move"].nodes)
+        data = json.loads(json.dumps(report(results, rounds=1)))
+        self.assertEqual(len(data["benchmarks"]), len(names))
+        self.assertIn("ops_per_sec", data["benchmarks"][0])
+
+    def test_unknown_benchmark(self) -> None:
+        with self.assertRaises(ValueError):
+            run_benchmarks([], rulebook=self.rulebook, only=["nope"])
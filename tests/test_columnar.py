@@ -0,0 +1,62 @@
+"""Columnar export tests."""
+
+from __future__ import annotations
+
+import importlib.util
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+from unittest import TestCase, skipUnless
+
+from game.rulebook import Rulebook
+from game.simulate import GameResult, run_games
+
+if TYPE_CHECKING:
+    from game.columnar import ColumnFormat
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+@skipUnless(HAS_NUMPY, "NumPy is not installed")
+class TestColumnar(TestCase):
+    rulebook: ClassVar[Rulebook]
+    results: ClassVar[list[GameResult]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+        cls.results = list(run_games(3, 2, seed=2, rulebook=cls.rulebook))
+
+    def check_round_trip(self, fmt: ColumnFormat) -> None:
+        from game.columnar import TURN_COLUMNS, ColumnarWriter, load_columns
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # A small chunk size so the turns table spans several parts / row groups.
+            with ColumnarWriter(tmp, fmt, chunk_rows=10) as writer:
+                list(writer.add_all(self.results))
+            turns = load_columns(tmp, "turns")
+            games = load_columns(tmp, "games")
+            with self.assertRaises(FileExistsError):
+                ColumnarWriter(tmp, fmt)
+
+        expected = [turn for result in self.results for turn in result.turns]
+        self.assertEqual(set(turns), set(TURN_COLUMNS))
+        self.assertEqual(turns["word"].tolist(), [turn["word"] for turn in expected])
+        self.assertEqual(turns["score"].tolist(), [turn["score"] for turn in expected])
+        self.assertEqual(turns["leave"].tolist(), [turn["leave"] for turn in expected])
+        self.assertEqual(turns["row"].tolist(), [turn["coords"][0] for turn in expected])
+        self.assertEqual(turns["bag"].tolist(), [turn["bag"] for turn in expected])
+        self.assertEqual(int(turns["score"].sum()), sum(turn["score"] for turn in expected))
+
+        self.assertEqual(games["game"].tolist(), [result.game for result in self.results])
+        self.assertEqual(games["seed"].tolist(), [result.seed for result in self.results])
+        self.assertEqual(games["score_1"].tolist(), [result.scores[1] for result in self.results])
+        self.assertEqual(games["turns"].tolist(), [len(result.turns) for result in self.results])
+
+    def test_npy_bundles(self) -> None:
+        self.check_round_trip("npy")
+
+    @skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet(self) -> None:
+        self.check_round_trip("parquet")
@@ -0,0 +1,59 @@
+"""CompactBoard tests."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+from game.board import Board
+from game.compact_board import CompactBoard
+from game.rulebook import Rulebook
+from game.types import Move
+
+
+class TestCompactBoard(TestCase):
+    def test_apply_and_undo(self) -> None:
+        grid = CompactBoard()
+        first = grid.apply(Move((7, 5), "R", "DOG"))
+        self.assertEqual(first, [110, 111, 112])
+        self.assertEqual(grid[7], "     DOG       ")
+        # Only empty squares are recorded, so undo leaves the D of DOG in place.
+        second = grid.apply(Move((7, 5), "D", "DoN"))
+        self.assertEqual(second, [125, 140])
+        self.assertEqual(grid.at(8, 5), "o")
+        self.assertTrue((grid.blanks >> 125) & 1)
+        self.assertEqual(bin(grid.occupied).count("1"), 5)
+
+        grid.undo(second)
+        self.assertEqual(grid, CompactBoard(["     DOG       " if y == 7 else " " * 15 for y in range(15)]))
+        grid.undo(first)
+        self.assertTrue(grid.is_empty())
+        self.assertEqual(grid.blanks, 0)
+
+    def test_reads_like_rows(self) -> None:
+        rows = [" " * 15 for _ in range(15)]
+        rows[1] = "    DOG        "
+        grid = CompactBoard(rows)
+        self.assertEqual(grid.to_rows(), rows)
+        self.assertEqual(grid[-14], rows[1])
+        self.assertEqual(grid[0:2], rows[0:2])
+        self.assertEqual(len(grid), 15)
+        copy = grid.copy()
+        copy.apply(Move((0, 0), "R", "HI"))
+        self.assertEqual(grid[0], " " * 15)
+
+    def test_scoring_reads_compact_board(self) -> None:
+        rb = Rulebook()
+        rows = [" " * 15 for _ in range(15)]
+        rows[8] = " " * 7 + "I" + " " * 7
+        self.assertEqual(rb.score_move(Move((7, 7), "R", "QI"), CompactBoard(rows)), 44)
+
+    def test_board_undo_restores_analysis(self) -> None:
+        rb = Rulebook()
+        board = Board()
+        board.play_move(Move((7, 5), "R", "DOG"))
+        analysis = rb.analyse(board)
+        placed = board.apply_move(Move((5, 8), "D", "ABS"))
+        board.undo_move(placed)
+        fresh = rb.cross_checks(board.state)
+        self.assertEqual(analysis.mask, fresh.mask)
+        self.assertEqual(analysis.anchors, fresh.anchors)
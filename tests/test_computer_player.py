@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import string
+from itertools import product
 from typing import ClassVar
 from unittest import TestCase
 
+from game.cross_checks import CrossChecks
+from game.lexicon import build_dawg, read_word_list
+from game.paths import data_path
 from game.players.computer import ComputerPlayer
 from game.rulebook import Rulebook
+from game.types import BoardState, Move
 
 
 class TestComputerPlayer(TestCase):
@@ -102,3 +107,122 @@ class TestComputerPlayer(TestCase):
         board_state[6] = " " * 13 + "NG"
         move_param = player.get_move_params((6, 7), "R", board_state)
         self.assertEqual(move_param, (1, [("N", 6), ("G", 7)]))
+
+
+class TestFindWords(TestCase):
+    def test_two_blanks_cover_every_spelling(self) -> None:
+        words = ["AT", "TA", "TAT", "CAT", "ACT", "TACT", "ATTACK"]
+        rb = Rulebook(lexicon=build_dawg(words))
+        player = ComputerPlayer(1, ["T", "?", "?"], rb, name="c")
+        found = player.find_words()
+        expected = set()
+        for word in words:
+            for choice in product((False, True), repeat=len(word)):
+                spelled = "".join(ch.lower() if blank else ch for ch, blank in zip(word, choice))
+                real = [ch for ch, blank in zip(word, choice) if not blank]
+                if sum(choice) <= 2 and real.count("T") <= 1 and set(real) <= {"T"}:
+                    expected.add(spelled)
+        self.assertEqual(len(found), len(set(found)))
+        self.assertEqual(set(found), expected)
+
+
+class TestGaddagGenerator(TestCase):
+    rb: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        words = [w for w in read_word_list(data_path("dictionary.txt")) if len(w) <= 5]
+        cls.rb = Rulebook(lexicon=build_dawg(words))
+
+    def assert_same_moves(self, board_state: list[str], tiles: list[str]) -> None:
+        trie = ComputerPlayer(1, list(tiles), self.rb, name="trie")
+        gaddag = ComputerPlayer(2, list(tiles), self.rb, name="gaddag", generator="gaddag")
+        trie_moves = trie.generate_moves(board_state)
+        gaddag_moves = gaddag.generate_moves(board_state)
+        self.assertEqual(len(gaddag_moves), len(set(gaddag_moves)))
+        self.assertEqual(set(trie_moves), set(gaddag_moves))
+
+    def test_opening_board(self) -> None:
+        board_state = [" " * 15 for _ in range(15)]
+        self.assert_same_moves(board_state, ["A", "P", "P", "L", "E", "?", "Z"])
+
+    def test_mid_game_board(self) -> None:
+        board_state = [" " * 15 for _ in range(15)]
+        board_state[7] = "    QUEST      "
+        board_state[8] = "        O      "
+        board_state[9] = "      FaN      "
+        board_state[10] = "        G      "
+        self.assert_same_moves(board_state, ["R", "A", "T", "E", "S", "I", "N"])
+        self.assert_same_moves(board_state, ["?", "?", "O", "X", "E", "D", "A"])
+
+    def test_edge_rows(self) -> None:
+        board_state = [" " * 15 for _ in range(15)]
+        board_state[0] = "CAT         ZOO"
+        board_state[1] = "  A         O  "
+        board_state[14] = "              A"
+        self.assert_same_moves(board_state, ["S", "E", "A", "T", "B", "R", "?"])
+
+    def test_reports_nodes_expanded(self) -> None:
+        board_state = [" " * 15 for _ in range(15)]
+        board_state[7] = "    QUEST      "
+        player = ComputerPlayer(1, ["R", "A", "T", "E", "S", "I", "N"], self.rb, name="gaddag", generator="gaddag")
+        player.profile = True
+        player.get_move(board_state)
+        assert player.stats is not None
+        self.assertGreater(player.stats.nodes, 0)
+
+    def test_unknown_generator_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            ComputerPlayer(1, [], self.rb, name="x", generator="bogus")  # type: ignore[arg-type]
+
+
+class TestFusedSearch(TestCase):
+    rb: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rb = Rulebook()
+
+    def test_fused_matches_full_scoring(self) -> None:
+        board_state = [" " * 15 for _ in range(15)]
+        board_state[7] = "    QUEST      "
+        board_state[8] = "        O      "
+        board_state[9] = "      FaN      "
+        board_state[10] = "        G      "
+        for tiles in (["R", "A", "T", "E", "S", "I", "N"], ["?", "?", "O", "X", "E", "D", "A"]):
+            full = ComputerPlayer(1, list(tiles), self.rb, name="full")
+            fused = ComputerPlayer(2, list(tiles), self.rb, name="fused", search="fused")
+            self.assertEqual(full.top_moves(board_state, 25), fused.top_moves(board_state, 25))
+            self.assertEqual(full.get_move(board_state), fused.get_move(board_state))
+
+    def test_fused_reports_nodes_expanded(self) -> None:
+        board_state = [" " * 15 for _ in range(15)]
+        board_state[7] = "    QUEST      "
+        tiles = ["R", "A", "T", "E", "S", "I", "N"]
+        full = ComputerPlayer(1, list(tiles), self.rb, name="full")
+        fused = ComputerPlayer(2, list(tiles), self.rb, name="fused", search="fused")
+        full.profile = fused.profile = True
+        full.get_move(board_state)
+        fused.get_move(board_state)
+        assert full.stats is not None and fused.stats is not None
+        self.assertGreater(fused.stats.nodes, 0)
+        self.assertLessEqual(fused.stats.nodes, full.stats.nodes)
+
+    def test_full_search_ranks_by_move_heuristic(self) -> None:
+        class ShortWords(ComputerPlayer):
+            def move_heuristic(
+                self, move: Move, board_state: BoardState, cross_checks: CrossChecks | None = None,
+                score: int | None = None,
+            ) -> float:
+                value = super().move_heuristic(move, board_state, cross_checks, score)
+                return value if value == float("-inf") else 100 - len(move.word)
+
+        board_state = [" " * 15 for _ in range(15)]
+        board_state[7] = "    QUEST      "
+        for scoring in ("loop", "batch"):
+            player = ShortWords(1, ["R", "A", "T", "E", "S", "I", "N"], self.rb, name="short", scoring=scoring)
+            self.assertEqual(len(player.get_move(board_state).word), 2)
+
+    def test_fused_requires_trie_generator(self) -> None:
+        with self.assertRaises(ValueError):
+            ComputerPlayer(1, [], self.rb, name="x", generator="gaddag", search="fused")
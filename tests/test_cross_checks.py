@@ -0,0 +1,74 @@
+"""Cross-check mask tests."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+from unittest import TestCase
+
+from game.board import Board
+from game.cross_checks import ALL_LETTERS, NO_CROSS_WORD
+from game.players.computer import ComputerPlayer
+from game.rulebook import Rulebook
+from game.types import Move
+
+
+def _board() -> list[str]:
+    board_state = [" " * 15 for _ in range(15)]
+    board_state[7] = "     DOG       "
+    return board_state
+
+
+class TestCrossChecks(TestCase):
+    rb: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rb = Rulebook()
+
+    def test_masks_and_partial_scores(self) -> None:
+        cc = self.rb.cross_checks(_board())
+        # Below the D of DOG, a letter L must make "D" + L a word for an across play.
+        self.assertTrue(cc.allows(8, 5, "R", "E"))
+        self.assertFalse(cc.allows(8, 5, "R", "Z"))
+        self.assertEqual(cc.cross_score["R"][8 * 15 + 5], 2)
+        # Right of DOG, a down play extends it: DOGS yes, DOGZ no.
+        self.assertTrue(cc.allows(7, 8, "D", "S"))
+        self.assertFalse(cc.allows(7, 8, "D", "Z"))
+        self.assertEqual(cc.cross_score["D"][7 * 15 + 8], 5)
+        # Away from tiles anything goes; occupied squares allow nothing.
+        self.assertEqual(cc.mask["R"][0], ALL_LETTERS)
+        self.assertEqual(cc.cross_score["R"][0], NO_CROSS_WORD)
+        self.assertEqual(cc.mask["R"][7 * 15 + 6], 0)
+
+    def test_score_move_matches_rebuilt_cross_words(self) -> None:
+        board_state = _board()
+        cc = self.rb.cross_checks(board_state)
+        for move in (Move((8, 4), "R", "BE"), Move((5, 8), "D", "ABS"), Move((8, 5), "R", "ZA")):
+            self.assertEqual(
+                self.rb.score_move(move, board_state),
+                self.rb.score_move(move, board_state, cross_checks=cc),
+            )
+
+    def test_generated_moves_are_legal(self) -> None:
+        board_state = _board()
+        player = ComputerPlayer(1, ["S", "A", "T", "I", "R", "E", "?"], self.rb, name="t")
+        moves = player.generate_moves(board_state)
+        self.assertTrue(moves)
+        self.assertTrue(all(self.rb.score_move(m, board_state) >= 0 for m in moves))
+
+    def test_board_keeps_analysis_current(self) -> None:
+        board = Board()
+        analysis = self.rb.analyse(board)
+        player = ComputerPlayer(1, ["S", "A", "T", "I", "R", "E", "?"], self.rb, name="t")
+        player.get_valid_locations(board.state, analysis)
+        for move in (Move((7, 5), "R", "DOG"), Move((5, 8), "D", "ABS"), Move((8, 4), "R", "BE")):
+            board.play_move(move)
+            self.assertIs(self.rb.analyse(board), analysis)
+            fresh = self.rb.cross_checks(board.state)
+            self.assertEqual(analysis.mask, fresh.mask)
+            self.assertEqual(analysis.cross_score, fresh.cross_score)
+            self.assertEqual(analysis.anchors, fresh.anchors)
+            self.assertEqual(
+                sorted(player.get_valid_locations(board.state, analysis)),
+                sorted(player.get_valid_locations(board.state)),
+            )
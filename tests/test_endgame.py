@@ -0,0 +1,50 @@
+"""Endgame solver tests."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+from unittest import TestCase
+
+from game.board import Board
+from game.players import ComputerPlayer
+from game.players.endgame import EndgameSolver
+from game.rulebook import Rulebook
+from game.types import Move
+
+
+class TestEndgameSolver(TestCase):
+    rulebook: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+
+    def setUp(self) -> None:
+        self.board = Board()
+        self.board.play_move(Move((7, 6), "R", "CAT"))
+
+    def test_goes_out_and_collects_opponent_rack(self) -> None:
+        before = self.board.state.to_rows()
+        result = EndgameSolver(self.rulebook).solve(self.board, ["S"], ["Q", "Z"])
+        self.assertTrue(result.complete)
+        score = self.rulebook.score_move(result.move, self.board.state)
+        self.assertEqual(result.value, score + 2 * 20)
+        self.assertEqual(self.board.state.to_rows(), before)
+
+    def test_falls_back_to_greedy_when_out_of_nodes(self) -> None:
+        rack = ["S", "E", "R"]
+        result = EndgameSolver(self.rulebook, node_limit=0).solve(self.board, rack, ["Q"])
+        self.assertFalse(result.complete)
+        self.assertEqual(result.depth, 0)
+        greedy = ComputerPlayer(1, list(rack), self.rulebook, name="greedy")
+        self.assertEqual(
+            self.rulebook.score_move(result.move, self.board.state),
+            greedy.top_moves(self.board.state, 1)[0][1],
+        )
+
+    def test_player_uses_solver_when_opponent_rack_known(self) -> None:
+        player = ComputerPlayer(1, ["S"], self.rulebook, name="cpu", endgame=EndgameSolver(self.rulebook))
+        player.opponent_tiles = ["Q", "Z"]
+        move = player.get_move(self.board.state, self.board)
+        self.assertIsNotNone(player.last_endgame)
+        self.assertIn("S", move.word.upper())
@@ -0,0 +1,64 @@
+"""Game log tests."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import ClassVar
+from unittest import TestCase
+
+from game.game_log import GameLogWriter, codec_for, read_game_log, read_turns, shard_path
+from game.game_master import GameMaster
+from game.rulebook import Rulebook
+from game.simulate import run_games
+
+
+class TestGameLog(TestCase):
+    rulebook: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+
+    def test_paths(self) -> None:
+        self.assertEqual(codec_for("games.jsonl.gz"), "gzip")
+        self.assertEqual(codec_for("games.zst"), "zstd")
+        self.assertEqual(codec_for("games.jsonl"), "none")
+        self.assertEqual(shard_path("logs/games.jsonl.gz", 3), Path("logs/games-3.jsonl.gz"))
+        self.assertEqual(shard_path("games", 3), Path("games-3"))
+
+    def test_game_master_logs_each_turn(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "games.jsonl.gz"
+            with GameLogWriter(path) as log:
+                gm = GameMaster(computer_count=2, rulebook=self.rulebook, game_log=log)
+                gm.play_game(headless=True, seed=4, game=9)
+            records = list(read_game_log(path))
+
+        self.assertEqual(records[0], {"type": "game", "game": 9, "seed": 4, "players": [p.name for p in gm.players]})
+        self.assertEqual(records[-1], {"type": "end", "game": 9, "scores": gm.player_scores})
+        turns = records[1:-1]
+        self.assertEqual([t["turn"] for t in turns], [rec.turn for rec in gm.turn_log])
+        for turn, rec in zip(turns, gm.turn_log):
+            self.assertEqual((turn["word"], turn["score"], turn["leave"]), (rec.move.word, rec.score, rec.leave))
+            self.assertEqual(sorted(turn["rack"]), sorted(rec.rack))
+        opening = turns[0]
+        self.assertEqual(len(opening["rack"]), 7)
+        self.assertEqual(len(opening["leave"]) + len(opening["drawn"]), 7)
+        self.assertEqual(opening["bag"], 100 - 14 - len(opening["drawn"]))
+
+    def test_appends_and_truncated_logs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "games.jsonl.gz"
+            for seed in (1, 2):
+                list(run_games(1, 2, seed=seed, rulebook=self.rulebook, game_log=str(path)))
+            records = list(read_game_log(path))
+            self.assertEqual([r["type"] for r in records].count("game"), 2)
+            turns = sum(1 for _ in read_turns(path))
+            self.assertEqual(turns, len(records) - 4)
+
+            cut = Path(tmp) / "cut.jsonl.gz"
+            cut.write_bytes(path.read_bytes()[:-200])
+            partial = list(read_game_log(cut))
+            self.assertLess(len(partial), len(records))
+            self.assertEqual(partial, records[: len(partial)])
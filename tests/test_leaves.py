@@ -0,0 +1,92 @@
+"""Leave table tests."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from game.board import Board
+from game.leaves import (
+    build_leave_table,
+    fit_leaves,
+    key_tiles,
+    leave_key,
+    leave_observations,
+    open_leaves,
+    write_leaves,
+)
+from game.players.computer import ComputerPlayer
+from game.rulebook import Rulebook
+from game.types import Move
+
+
+class TestLeaveTable(TestCase):
+    def test_key_is_order_independent(self) -> None:
+        self.assertEqual(leave_key("SER?"), leave_key("?RES"))
+        self.assertEqual(key_tiles(leave_key("SER?")), "ERS?")
+        self.assertEqual(leave_key(""), 0)
+
+    def test_lookup_and_single_tile_fallback(self) -> None:
+        table = build_leave_table({"S": 8.0, "?": 25.0, "Q": -7.0, "QU": 1.5})
+        self.assertEqual(table.value("UQ"), 1.5)
+        self.assertEqual(table.value("S?"), 33.0)
+        self.assertEqual(table.value(""), 0.0)
+
+    def test_file_round_trip(self) -> None:
+        table = build_leave_table({"S": 8.0, "ERS": 12.25, "VV": -9.5})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "leaves.bin"
+            write_leaves(table, path)
+            loaded = open_leaves(path)
+            assert loaded is not None
+            self.assertEqual(dict(loaded.items()), dict(table.items()))
+            self.assertEqual(loaded.value("SRE"), 12.25)
+            self.assertIsNone(open_leaves(Path(tmp) / "missing.bin"))
+
+    def test_fit_ranks_helpful_tiles_higher(self) -> None:
+        games = [
+            {
+                "turns": [
+                    {"player": "a", "leave": "S", "score": 0},
+                    {"player": "b", "leave": "Q", "score": 0},
+                    {"player": "a", "leave": "S", "score": 40},
+                    {"player": "b", "leave": "Q", "score": 10},
+                    {"player": "a", "leave": "", "score": 40},
+                    {"player": "b", "leave": "", "score": 10},
+                ]
+            }
+        ] * 5
+        table = fit_leaves(leave_observations(games))
+        self.assertGreater(table.value("S"), 0.0)
+        self.assertLess(table.value("Q"), 0.0)
+
+
+class TestEquityPlay(TestCase):
+    def test_equity_prefers_keeping_valuable_tiles(self) -> None:
+        rulebook = Rulebook()
+        board = Board()
+        board.play_move(Move((7, 7), "R", "AT"))
+        tiles = ["S", "Q", "E", "A", "T", "R", "I"]
+        greedy = ComputerPlayer(1, list(tiles), rulebook, name="greedy")
+        leaves = build_leave_table({"S": 500.0})
+        equity = ComputerPlayer(1, list(tiles), rulebook, name="equity", leaves=leaves)
+        greedy.get_move(board.state, board)
+        equity_move = equity.get_move(board.state, board)
+        self.assertIn("S", equity.leave_after(equity_move, board.state))
+        self.assertGreater(equity.score_hist[0], 0)
+        self.assertLessEqual(equity.score_hist[0], greedy.score_hist[0])
+
+    def test_rejected_candidates_never_outrank_legal_ones(self) -> None:
+        rulebook = Rulebook()
+        board = Board()
+        board.play_move(Move((7, 7), "R", "AT"))
+        cross_checks = rulebook.analyse(board)
+        leaves = build_leave_table({"Q": -50.0, "S": -50.0})
+        player = ComputerPlayer(1, ["Q", "S", "E", "A", "T", "R", "I"], rulebook, name="equity", leaves=leaves)
+        legal = Move((6, 7), "D", "EAR")  # EAR through the A, keeping Q and S: equity far below -1
+        illegal = Move((0, 0), "R", "RAT")  # touches nothing
+        ranked = player._rank_moves([illegal, legal], board.state, cross_checks)
+        self.assertEqual([move for move, _ in ranked], [legal])
+        self.assertLess(ranked[0][1], -1)
+        self.assertEqual(player.move_heuristic(illegal, board.state, cross_checks), float("-inf"))
@@ -0,0 +1,61 @@
+"""DAWG lexicon tests."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from game.lexicon import build_dawg, compile_lexicon, load_lexicon, open_dawg
+
+
+class TestDawg(TestCase):
+    def test_membership_and_prefixes(self) -> None:
+        dawg = build_dawg(["CAT", "CATS", "CAR", "CARS", "DOG", "DOGS"])
+        for word in ("CAT", "CATS", "CAR", "CARS", "DOG", "DOGS", "cats"):
+            self.assertIn(word, dawg)
+        for word in ("CA", "DO", "COW", "", "CATSS"):
+            self.assertNotIn(word, dawg)
+        self.assertNotEqual(dawg.walk("CA"), -1)
+        self.assertEqual(dawg.walk("CX"), -1)
+
+    def test_shared_suffixes_are_merged(self) -> None:
+        dawg = build_dawg(["CAT", "CATS", "CAR", "CARS", "DOG", "DOGS"])
+        # The "S"/end states are shared: every word ends in one of two suffix nodes.
+        self.assertEqual(dawg.child(dawg.walk("CAT"), ord("S") - 65), dawg.child(dawg.walk("DOG"), ord("S") - 65))
+        self.assertLess(dawg.node_count, 12)
+
+    def test_words_round_trip(self) -> None:
+        words = ["AA", "AAH", "AAHED", "AB", "BA", "ZZZ"]
+        self.assertEqual(list(build_dawg(reversed(words)).words()), words)
+
+    def test_packaged_lexicon(self) -> None:
+        dawg = load_lexicon()
+        self.assertIs(dawg, load_lexicon())
+        self.assertIn("QI", dawg)
+        self.assertIn("ZZZ", dawg)
+        self.assertNotIn("ZXVY", dawg)
+
+
+class TestCompiledLexicon(TestCase):
+    def test_write_and_map_round_trip(self) -> None:
+        words = ["AA", "AAH", "AAHED", "AB", "BA", "ZZZ"]
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "words.txt"
+            source.write_text("\n".join(words))
+            target, gaddag_target = compile_lexicon(source)
+            self.assertEqual(target.name, "lexicon.dawg")
+            self.assertEqual(gaddag_target.name, "lexicon.gaddag")
+            mapped = open_dawg(target)
+            assert mapped is not None
+            self.assertEqual(list(mapped.words()), words)
+            self.assertIn("AAH", load_lexicon(source))
+
+    def test_stale_file_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "words.txt"
+            source.write_text("CAT\nDOG\n")
+            target = compile_lexicon(source, gaddag=False)[0]
+            source.write_text("CAT\nDOG\nEMU\n")
+            self.assertIsNone(open_dawg(target, expected_crc=0))
+            self.assertIn("EMU", load_lexicon(source))
@@ -0,0 +1,46 @@
+"""Move cache tests."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+from game.board import Board
+from game.move_cache import MoveCache
+from game.players import ComputerPlayer
+from game.rulebook import Rulebook
+from game.types import Move
+
+
+class TestMoveCache(TestCase):
+    def test_lru_eviction_and_counters(self) -> None:
+        cache = MoveCache(capacity=2)
+        cache.put("a", [])
+        cache.put("b", [(Move((7, 7), "R", "AT"), 4)])
+        self.assertEqual(cache.get("a"), ())
+        cache.put("c", [])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.stats.hits, cache.stats.misses, cache.stats.evictions), (1, 1, 1))
+        self.assertEqual(cache.stats.hit_rate, 0.5)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.hits, 0)
+
+    def test_player_reuses_candidates_for_same_position(self) -> None:
+        rulebook = Rulebook()
+        board = Board()
+        board.play_move(Move((7, 5), "R", "QUIET"))
+        cache = MoveCache()
+        first = ComputerPlayer(1, list("AERSTIN"), rulebook, name="a", cache=cache)
+        second = ComputerPlayer(2, list("NITSREA"), rulebook, name="b", cache=cache)
+        uncached = ComputerPlayer(3, list("AERSTIN"), rulebook, name="c")
+        expected = list(uncached.top_moves(board.state, 5))
+        self.assertEqual(list(first.top_moves(board.state, 5)), expected)
+        self.assertEqual(list(second.top_moves(board.state, 5)), expected)
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+
+        second.tiles = list("AERSTIZ")
+        second.top_moves(board.state, 5)
+        board.play_move(Move((8, 5), "R", "AT"))
+        first.top_moves(board.state, 5)
+        self.assertEqual(cache.stats.misses, 3)
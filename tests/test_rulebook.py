@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import ClassVar
 from unittest import TestCase
 
+from game.board import Board
+from game.exceptions import InvalidPlacementError
 from game.rulebook import Rulebook
 from game.types import Move
 
@@ -48,3 +50,35 @@ class TestRulebook(TestCase):
         test_board[14] = " " + "U" + " " * 13
         test_move = Move((14, 0), "R", "QUINTETS")
         self.assertEqual(self.rulebook.score_move(test_move, test_board, allow_illegal=True), 50 + 18 * 9)
+
+    def test_score_move_with_cross_checks_matches_rebuild(self) -> None:
+        board = Board()
+        cross_checks = self.rulebook.analyse(board)
+        for move in (Move((7, 7), "R", "QI"), Move((7, 7), "D", "QAT"), Move((6, 8), "D", "HI")):
+            self.assertEqual(
+                self.rulebook.score_move(move, board.state, cross_checks=cross_checks),
+                self.rulebook.score_move(move, board.state),
+            )
+            board.play_move(move)
+
+        candidates = [
+            Move((8, 7), "R", "AT"),  # cross-word HIT
+            Move((8, 7), "R", "Am"),  # blank in the cross-word HIM
+            Move((8, 7), "R", "AX"),  # HIX is not a word
+            Move((7, 7), "D", "QATS"),  # extends QAT in line
+            Move((0, 0), "R", "CAT"),  # touches nothing
+            Move((7, 7), "D", "ZAT"),  # disagrees with the board
+        ]
+        for move in candidates:
+            for allow_illegal in (False, True):
+                try:
+                    expected: int | str = self.rulebook.score_move(move, board.state, allow_illegal=allow_illegal)
+                except InvalidPlacementError:
+                    expected = "invalid"
+                try:
+                    got: int | str = self.rulebook.score_move(
+                        move, board.state, allow_illegal=allow_illegal, cross_checks=cross_checks
+                    )
+                except InvalidPlacementError:
+                    got = "invalid"
+                self.assertEqual(got, expected, (move, allow_illegal))
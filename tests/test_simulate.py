@@ -0,0 +1,54 @@
+"""Headless self-play tests."""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import ClassVar
+from unittest import TestCase
+
+from game.game_master import GameMaster
+from game.rulebook import Rulebook
+from game.simulate import replay_game, run_games, write_results
+
+
+class TestSimulate(TestCase):
+    rulebook: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+
+    def test_headless_game_logs_every_turn(self) -> None:
+        gm = GameMaster(computer_count=2, rulebook=self.rulebook)
+        gm.play_game(headless=True)
+        self.assertTrue(gm.turn_log)
+        self.assertEqual([rec.turn for rec in gm.turn_log], list(range(1, len(gm.turn_log) + 1)))
+        played = sum(rec.score for rec in gm.turn_log)
+        self.assertGreater(played, 0)
+
+    def test_records_are_json_lines_and_repeatable(self) -> None:
+        out = io.StringIO()
+        written = write_results(run_games(1, 2, seed=7, rulebook=self.rulebook), out)
+        self.assertEqual(written, 1)
+        record = json.loads(out.getvalue())
+        self.assertEqual(record["game"], 0)
+        self.assertEqual(len(record["scores"]), 2)
+        self.assertIn(record["winners"][0], record["players"])
+
+        again = next(run_games(1, 2, seed=7, rulebook=self.rulebook))
+        self.assertEqual(again.scores, record["scores"])
+        self.assertEqual([t["word"] for t in record["turns"]], [t["word"] for t in again.turns])
+
+    def test_worker_pool_matches_single_process(self) -> None:
+        serial = {r.game: r.scores for r in run_games(2, 2, seed=11, rulebook=self.rulebook)}
+        pooled = {r.game: r.scores for r in run_games(2, 2, seed=11, workers=2, rulebook=self.rulebook)}
+        self.assertEqual(pooled, serial)
+
+    def test_replay_from_seed_is_exact(self) -> None:
+        first = next(run_games(1, 2, seed=3, rulebook=self.rulebook))
+        replay = replay_game(first.seed, 2, rulebook=self.rulebook)
+        strip = [{k: v for k, v in t.items() if k != "seconds"} for t in first.turns]
+        self.assertEqual([{k: v for k, v in t.items() if k != "seconds"} for t in replay.turns], strip)
+        self.assertEqual(replay.players, first.players)
+        self.assertEqual(replay.scores, first.scores)
@@ -0,0 +1,87 @@
+"""SimulatingComputerPlayer tests."""
+
+from __future__ import annotations
+
+import random
+from typing import ClassVar
+from unittest import TestCase
+
+from game.board import Board
+from game.players import SimulatingComputerPlayer
+from game.players.simulating import rollout
+from game.rulebook import Rulebook
+from game.tile_bag import load_tile_counts
+from game.types import Move
+
+
+class TestSimulatingComputerPlayer(TestCase):
+    rulebook: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+
+    def setUp(self) -> None:
+        self.board = Board()
+        self.board.play_move(Move((7, 5), "R", "QUIeT"))
+
+    def test_unseen_tiles_exclude_board_and_rack(self) -> None:
+        player = SimulatingComputerPlayer(1, list("AERSTI?"), self.rulebook, name="sim")
+        unseen = player.unseen_tiles(self.board.state)
+        self.assertEqual(sum(unseen), sum(load_tile_counts().values()) - 5 - 7)
+        self.assertEqual(unseen[16], 0)  # the only Q is on the board
+        self.assertEqual(unseen[26], 0)  # one blank on the board, one on the rack
+
+    def test_picks_a_candidate_after_fixed_rollouts(self) -> None:
+        player = SimulatingComputerPlayer(
+            1, list("AERSTIN"), self.rulebook, name="sim", rng=random.Random(3),
+            candidates=3, budget=None, rollouts=2,
+        )
+        candidates = [m for m, _ in player.top_moves(self.board.state, 3)]
+        move = player.get_move(self.board.state, self.board)
+        self.assertIn(move, candidates)
+        self.assertEqual(player.last_rounds, 2)
+        self.assertEqual(self.board.state[7], "     QUIeT     ")
+        self.assertGreater(player.score_hist[-1], 0)
+
+    def test_budget_stops_a_round_partway(self) -> None:
+        player = SimulatingComputerPlayer(1, list("AERSTIN"), self.rulebook, name="sim", candidates=3)
+        candidates = [m for m, _ in player.top_moves(self.board.state, 3)]
+        unseen = player.unseen_tiles(self.board.state)
+        rows = [self.board.state[y] for y in range(15)]
+        _, counts = rollout(self.rulebook, rows, candidates, unseen, 7, 0.0, 5)
+        self.assertEqual(counts, [1, 0, 0])
+        replies = player.simulate(candidates, self.board.state, unseen, deadline=0.0)
+        self.assertIsNotNone(replies[0])
+        self.assertEqual(replies[1:], [None, None])
+        self.assertEqual(player.last_rounds, 1)
+
+    def test_zero_budget_still_picks_a_candidate(self) -> None:
+        player = SimulatingComputerPlayer(1, list("AERSTIN"), self.rulebook, name="sim", candidates=3, budget=0.0)
+        candidates = [m for m, _ in player.top_moves(self.board.state, 3)]
+        self.assertEqual(player.get_move(self.board.state, self.board), candidates[0])
+
+    def test_context_manager_shuts_the_pool_down(self) -> None:
+        from game.players import simulating
+
+        with SimulatingComputerPlayer(
+            1, list("AERSTIN"), self.rulebook, name="sim", candidates=2, budget=None, rollouts=2, workers=2
+        ) as player:
+            player.get_move(self.board.state, self.board)
+            self.assertIsNotNone(player._pool)
+        self.assertIsNone(player._pool)
+        self.assertIsNone(simulating._pool_rulebook)
+
+    def test_spawned_rollout_workers_rebuild_a_custom_lexicon(self) -> None:
+        from game.players import simulating
+
+        saved = simulating._pool_rulebook
+        try:
+            simulating._pool_rulebook = None
+            simulating._init_rollout_worker(["CAT", "CATS"])
+            worker = simulating._pool_rulebook
+            assert worker is not None
+            self.assertFalse(worker.packaged_lexicon)
+            self.assertEqual(worker.words_are_valid(["CAT", "CATS", "DOG"]), [True, True, False])
+        finally:
+            simulating._pool_rulebook = saved
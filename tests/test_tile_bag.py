@@ -0,0 +1,43 @@
+"""TileBag tests."""
+
+from __future__ import annotations
+
+import random
+from unittest import TestCase
+
+from game.tile_bag import TileBag
+
+
+class TestTileBag(TestCase):
+    def test_counts_match_tile_table(self) -> None:
+        bag = TileBag()
+        self.assertEqual(len(bag), sum(bag.tile_counts.values()))
+        self.assertEqual(bag.count("E"), bag.tile_counts["E"])
+        self.assertEqual(sorted(bag.bag), sorted(t for t, n in bag.tile_counts.items() for _ in range(n)))
+        self.assertTrue(str(bag).endswith("?: 2"))
+
+    def test_grab_removes_drawn_tiles(self) -> None:
+        bag = TileBag(random.Random(1))
+        before = len(bag)
+        drawn = bag.grab(7)
+        self.assertEqual(len(drawn), 7)
+        self.assertEqual(len(bag), before - 7)
+        for tile in set(drawn):
+            self.assertEqual(bag.count(tile) + drawn.count(tile), bag.tile_counts[tile])
+        self.assertEqual(len(bag.grab(1000)), before - 7)
+        self.assertEqual(bag.grab(3), [])
+
+    def test_seeded_draws_repeat(self) -> None:
+        self.assertEqual(TileBag(random.Random(5)).grab(20), TileBag(random.Random(5)).grab(20))
+
+    def test_snapshot_restore_and_switch(self) -> None:
+        bag = TileBag(random.Random(2))
+        snap = bag.snapshot()
+        bag.grab(30)
+        bag.restore(snap)
+        self.assertEqual(bag.snapshot(), snap)
+        self.assertEqual(len(bag), sum(snap))
+
+        new = bag.switch(["Q", "Z"])
+        self.assertEqual(len(new), 2)
+        self.assertEqual(len(bag), sum(snap))
@@ -0,0 +1,57 @@
+"""Per-turn search stats tests."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+from unittest import TestCase
+
+from game.board import Board
+from game.game_master import GameMaster
+from game.players import ComputerPlayer
+from game.rulebook import Rulebook
+from game.turn_stats import TurnStats
+from game.types import Move
+
+
+class TestTurnStats(TestCase):
+    rulebook: ClassVar[Rulebook]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rulebook = Rulebook()
+
+    def test_profiled_turn_counts_the_search(self) -> None:
+        board = Board()
+        board.play_move(Move((7, 5), "R", "QUIET"))
+        player = ComputerPlayer(1, list("AERSTIN"), self.rulebook, name="c")
+        moves = player.generate_moves(board.state, board.analysis)
+        locations = player.get_valid_locations(board.state, board.analysis)
+        player.get_move(board.state, board)
+        self.assertIsNone(player.stats)
+
+        player.tiles = list("AERSTIN")
+        player.profile = True
+        player.get_move(board.state, board)
+        stats = player.stats
+        assert stats is not None
+        self.assertEqual(stats.candidates, len(moves))
+        self.assertEqual(stats.anchors, len(locations))
+        self.assertGreater(stats.nodes, stats.candidates)
+        self.assertEqual(stats.rejected, 0)
+        self.assertGreaterEqual(
+            stats.total_seconds, stats.locate_seconds + stats.search_seconds + stats.score_seconds
+        )
+
+    def test_total(self) -> None:
+        total = TurnStats.total([TurnStats(anchors=2, nodes=5, search_seconds=0.5), TurnStats(nodes=1, cached=True)])
+        self.assertEqual((total.anchors, total.nodes, total.search_seconds, total.cached), (2, 6, 0.5, True))
+        self.assertEqual(TurnStats(**total.to_dict()), total)
+
+    def test_game_master_records_stats_when_profiling(self) -> None:
+        gm = GameMaster(computer_count=2, rulebook=self.rulebook, profile=True)
+        gm.play_game(headless=True, seed=5)
+        self.assertTrue(all(rec.stats is not None for rec in gm.turn_log))
+        plain = GameMaster(computer_count=2, rulebook=self.rulebook)
+        plain.play_game(headless=True, seed=5)
+        self.assertTrue(all(rec.stats is None for rec in plain.turn_log))
+        self.assertEqual([rec.move for rec in plain.turn_log], [rec.move for rec in gm.turn_log])
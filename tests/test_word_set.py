@@ -0,0 +1,57 @@
+"""Packed word set tests."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from game.lexicon import build_dawg
+from game.rulebook import Rulebook
+from game.word_set import build_word_set, compile_word_set, open_word_set, pack_word
+
+WORDS = ["AA", "CAT", "CATS", "QUIZ", "ABCDEFGHIJKL", "INTERNATIONAL"]
+
+
+class TestWordSet(TestCase):
+    def test_membership(self) -> None:
+        words = build_word_set(WORDS, build_dawg(WORDS))
+        for word in ("CAT", "cats", "QuIz", "ABCDEFGHIJKL", "INTERNATIONAL", "international"):
+            self.assertIn(word, words)
+        for word in ("", "CA", "CATSS", "C T", "CAT!", "CÄT", "INTERNATIONALS", "A" * 40):
+            self.assertNotIn(word, words)
+        self.assertEqual(len(words), 5)
+
+    def test_packing(self) -> None:
+        self.assertEqual(pack_word("A"), 1)
+        self.assertEqual(pack_word("BA"), 2 * 32 + 1)
+        self.assertEqual(pack_word("zz"), 26 * 32 + 26)
+        self.assertEqual(pack_word("ABCDEFGHIJKLM"), -1)
+        self.assertNotEqual(pack_word("AB"), pack_word("BA"))
+
+    def test_bulk_lookup_and_stats(self) -> None:
+        words = build_word_set(WORDS, build_dawg(WORDS))
+        self.assertEqual(words.contains_all(["CAT", "DOG", "INTERNATIONAL"]), [True, False, True])
+        self.assertIn("AA", words)
+        self.assertEqual((words.stats.lookups, words.stats.found, words.stats.fallback), (4, 3, 1))
+        self.assertEqual(words.stats.hit_rate, 0.75)
+
+    def test_compiled_file_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "words.txt"
+            source.write_text("\n".join(WORDS) + "\n", encoding="utf-8")
+            target = compile_word_set(source, Path(tmp) / "words.bin")
+            lexicon = build_dawg(WORDS)
+            mapped = open_word_set(target, lexicon, expected_crc=None)
+            assert mapped is not None
+            self.assertEqual(list(mapped.keys), sorted(pack_word(w) for w in WORDS if len(w) <= 12))
+            self.assertIn("quiz", mapped)
+            self.assertIsNone(open_word_set(target, lexicon, expected_crc=1))
+            self.assertIsNone(open_word_set(Path(tmp) / "missing", lexicon))
+
+    def test_rulebook_uses_word_set(self) -> None:
+        rulebook = Rulebook(lexicon=build_dawg(WORDS))
+        self.assertTrue(rulebook.word_is_valid("cat"))
+        self.assertEqual(rulebook.words_are_valid(["QUIZ", "QUIZZ"]), [True, False])
+        packaged = Rulebook()
+        self.assertEqual(packaged.words_are_valid(["QUARTZ", "QWXZ"]), [True, False])
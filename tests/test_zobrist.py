@@ -0,0 +1,55 @@
+"""Zobrist key tests."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+from game.board import Board
+from game.game_master import GameMaster
+from game.players import Player
+from game.rulebook import Rulebook
+from game.types import Move
+from game.zobrist import board_key, position_key, rack_key
+
+
+class TestZobrist(TestCase):
+    def test_keys_ignore_order_and_distinguish_blanks(self) -> None:
+        self.assertEqual(rack_key("ERS?"), rack_key("?SRE"))
+        self.assertNotEqual(rack_key("ERS"), rack_key("ERS", seat=1))
+        board = Board()
+        board.play_move(Move((7, 6), "R", "CAT"))
+        blank = Board()
+        blank.play_move(Move((7, 6), "R", "CaT"))
+        self.assertNotEqual(board_key(board.state), board_key(blank.state))
+        self.assertNotEqual(
+            position_key(board.state, ["A", "B"], 0), position_key(board.state, ["A", "B"], 1)
+        )
+
+    def test_board_key_follows_play_and_undo(self) -> None:
+        board = Board()
+        placed = board.apply_move(Move((7, 6), "R", "CaT"))
+        self.assertEqual(board.key, board_key(board.state))
+        board.play_move(Move((6, 7), "D", "BaD"))
+        self.assertEqual(board.key, board_key(board.state))
+        self.assertEqual(board.grid.copy().key, board.key)
+        board.undo_move(placed)
+        self.assertEqual(board.key, board_key(board.state))
+
+    def test_rack_key_follows_rack_operations(self) -> None:
+        player = Player(1, ["E", "E", "?"], Rulebook(), name="p")
+        player.receive_tiles(["E", "S"])
+        self.assertEqual(player.rack_key, rack_key(player.tiles))
+        player.remove_tile("E")
+        player.remove_tile("?")
+        self.assertEqual(player.rack_key, rack_key(["E", "E", "S"]))
+        player.tiles = ["Q"]
+        self.assertEqual(player.rack_key, rack_key("Q"))
+
+    def test_game_positions_are_consistent(self) -> None:
+        gm = GameMaster(computer_count=2)
+        gm.play_game(headless=True, seed=4)
+        assert gm.board is not None
+        self.assertEqual(gm.board.key, board_key(gm.board.state))
+        racks = [p.tiles for p in gm.players]
+        self.assertEqual(gm.position_key(1), position_key(gm.board.state, racks, 1))
+        self.assertEqual(len({rec.position for rec in gm.turn_log}), len(gm.turn_log))